@@ -0,0 +1,574 @@
+import numpy as np
+import stgeotk as stg
+
+from .bootstrap import bootstrap_cone
+from .density import density_grid, neighbor_counts, scatter_raster
+from .domains import assign_groups, domain_statistics
+from .extraction import extract_selected
+from .orientation import (
+    OrientationArray,
+    OrientationTensor,
+    cartesian_to_lines,
+    filter_measurements,
+    great_circle_arcs,
+    planes_from_poles,
+)
+from .profiling import StageTimer
+
+# share of the task progress spent on reading the layers
+EXTRACTION_PROGRESS = 60.0
+
+# great circles drawn in one batch at most,
+# larger datasets are drawn as a random subsample of this size
+MAX_BATCH_ARCS = 100000
+
+
+def line_fields(options):
+    """
+    Return the (trend, plunge) field names used for line data
+    """
+    return options["trend_field"], options["plunge_field"]
+
+
+def planar_fields(options):
+    """
+    Return the (direction, dip) field names used for planar data
+    """
+    if options["use_dip_dir"]:
+        return options["dip_dir_field"], options["dip_angle_field"]
+    return options["strike_field"], options["dip_angle_field"]
+
+
+def graph_name(snapshots):
+    return str([snapshot.name for snapshot in snapshots])
+
+
+def rejection_summary(name, total, rejected):
+    """
+    One line report of the rows of a layer rejected for each reason,
+    None if no row was rejected
+    """
+    counts = [f"{count} {reason}" for reason, count in rejected.items() if count]
+    if not counts:
+        return None
+    count = sum(rejected.values())
+    return f"{name}: {count} of {total} features rejected ({', '.join(counts)})"
+
+
+def read_group_keys(snapshot, group_field, fids, options, feedback):
+    """
+    Values of the group field of the features fids of a snapshot,
+    as objects. They are read apart from the numeric columns held
+    by the cache. Return None if canceled.
+    """
+    extracted = extract_selected(
+        snapshot, [group_field], feedback, object, options["extraction_chunk_size"]
+    )
+    if extracted is None:
+        return None
+    key_fids, keys, _ = extracted
+    if not np.array_equal(key_fids, fids):
+        # align the keys with the order of the orientations
+        order = np.argsort(key_fids)
+        keys = keys[order[np.searchsorted(key_fids, fids, sorter=order)]]
+    return keys[:, 0]
+
+
+def read_layers(
+    snapshots, fields, planar, color_field, options, feedback, cache=None, log=None
+):
+    """
+    Read a pair of orientation fields, of lines or of planes if planar,
+    and the optional color field from the selected features of every
+    snapshot, through cache if given, and the group-by field of options.
+    The measurements are checked and normalized by validate_measurements.
+    Invalid rows and rows with NULL values are dropped, and the number
+    of rejected rows of each layer is reported to log if given.
+
+    Return a list of (snapshot, orientations) for the layers with
+    the orientation fields, where orientations is an OrientationArray
+    with the color and group columns if the layer has these fields,
+    or None if canceled.
+    """
+    extract = extract_selected if cache is None else cache.extract
+    dtype = np.float32 if options["float32_storage"] else np.double
+    layers = []
+    for i, snapshot in enumerate(snapshots):
+        feedback.setProgress(EXTRACTION_PROGRESS * i / len(snapshots))
+        columns = list(fields)
+        use_color = bool(color_field) and snapshot.has_field(color_field)
+        if use_color:
+            columns.append(color_field)
+
+        extracted = extract(
+            snapshot, columns, feedback, dtype, options["extraction_chunk_size"]
+        )
+        if feedback.isCanceled():
+            return None
+        if extracted is None:
+            continue
+
+        fids, values, null = extracted
+        measurements, rows, rejected = filter_measurements(
+            values, null, planar, use_color
+        )
+        if log is not None:
+            summary = rejection_summary(snapshot.name, len(values), rejected)
+            if summary is not None:
+                log(summary)
+
+        columns = {color_field: values[rows, 2]} if use_color else {}
+        group_field = options["group_by_field"]
+        if group_field and snapshot.has_field(group_field):
+            keys = read_group_keys(snapshot, group_field, fids, options, feedback)
+            if keys is None:
+                return None
+            columns[group_field] = keys[rows]
+        source = {
+            "columns": columns,
+            "layer_ids": (snapshot.layer_id,),
+            "fids": np.asarray(fids, dtype=np.int64)[rows],
+        }
+        if planar:
+            orientations = OrientationArray.from_planes(
+                measurements, options["use_dip_dir"], **source
+            )
+        else:
+            orientations = OrientationArray.from_lines(measurements, **source)
+        layers.append((snapshot, orientations))
+
+    feedback.setProgress(EXTRACTION_PROGRESS)
+    return layers
+
+
+def concatenate_layers(layers, options):
+    """
+    Return the OrientationArray of all the layers read by read_layers,
+    which has the color column only if every layer provides it
+    """
+    if not layers:
+        dtype = np.float32 if options["float32_storage"] else np.double
+        return OrientationArray(np.empty((0, 3), dtype=dtype))
+    return OrientationArray.concatenate([orientations for _, orientations in layers])
+
+
+def read_orientations(
+    snapshots, fields, planar, color_field, options, feedback, cache=None, log=None
+):
+    """
+    read_layers concatenated over the layers.
+    Return an OrientationArray, or None if canceled.
+    """
+    layers = read_layers(
+        snapshots, fields, planar, color_field, options, feedback, cache, log
+    )
+    if layers is None:
+        return None
+    return concatenate_layers(layers, options)
+
+
+def layers_tensor(layers, fields, planar, options, cache=None, color_field=""):
+    """
+    Sum of the orientation tensors of the layers read by read_layers,
+    of the lines or of the poles to planes if planar.
+    The tensors of the layers are kept up to date in cache if given,
+    so that selection edits do not require a pass over all the data.
+    They are keyed on the color field of the layers which have it,
+    since its NULL values are dropped from their vectors.
+    """
+    use_dip_dir = planar and options["use_dip_dir"]
+    total = OrientationTensor()
+    for snapshot, orientations in layers:
+        color = color_field if orientations.column(color_field) is not None else ""
+        key = (tuple(fields), planar, use_dip_dir, color)
+
+        def compute():
+            tensor = OrientationTensor()
+            tensor.add_vectors(orientations.vectors)
+            return tensor
+
+        if cache is None:
+            total.add_tensor(compute())
+        else:
+            total.add_tensor(cache.tensor(snapshot, key, compute))
+    return total
+
+
+def load_line_data(data, legend, color_data, color_field):
+    dataset = stg.LineData()
+    if color_data is not None:
+        dataset.load_data(data, legend, color_data, color_field)
+    else:
+        dataset.load_data(data, legend)
+    return dataset
+
+
+def raster_data(orientations, color_data, options, timer):
+    """
+    Bin the vectors of an OrientationArray into a density.ScatterRaster
+    if there are more points than the rasterization threshold in options,
+    otherwise return None
+    """
+    threshold = options["marker_raster_threshold"]
+    if not threshold or len(orientations) <= threshold:
+        return None
+    with timer.stage("rasterization", len(orientations)):
+        return scatter_raster(
+            orientations.vectors, color_data, options["marker_raster_resolution"]
+        )
+
+
+def arc_data(orientations, options, timer):
+    """
+    Compute the projected great circles of the planes of an OrientationArray
+    if there are more planes than the batching threshold in options,
+    and the density of all their poles for the density shading.
+    Only a random subsample of MAX_BATCH_ARCS planes is drawn
+    from larger datasets.
+    Return (arcs, density), or (None, None) below the threshold.
+    """
+    threshold = options["plane_batch_threshold"]
+    if not threshold or len(orientations) <= threshold:
+        return None, None
+    with timer.stage("great circles", len(orientations)):
+        rows = np.arange(len(orientations))
+        if len(orientations) > MAX_BATCH_ARCS:
+            rng = np.random.default_rng(0)
+            rows = rng.choice(len(orientations), MAX_BATCH_ARCS, replace=False)
+            rows.sort()
+        planes = orientations.planes[rows]
+        arcs = great_circle_arcs(planes[:, 0], planes[:, 1])
+        density = None
+        if options["plane_shading"] == "density":
+            density = neighbor_counts(orientations.vectors)[rows]
+    return arcs, density
+
+
+def contour_data(orientations, options, contour_cache=None):
+    """
+    Compute the Fisher density of the vectors of an OrientationArray,
+    or fetch it from contour_cache if it was computed before
+    """
+    vectors = orientations.vectors
+    resolution = options["contour_resolution"]
+    tolerance = options["contour_tolerance"]
+    k_mode = options["contour_k_mode"]
+
+    def compute():
+        return density_grid(
+            vectors,
+            resolution=resolution,
+            tolerance=tolerance,
+            k_mode=k_mode,
+            workers=options["contour_workers"],
+        )
+
+    if contour_cache is None:
+        return compute()
+    return contour_cache.get_or_compute(
+        vectors, "fisher-" + k_mode, (resolution, tolerance), compute
+    )
+
+
+def group_data(orientations, options, timer):
+    """
+    Eigen, Fisher and Woodcock statistics of an OrientationArray grouped
+    by the value of the group-by field, timed in timer.
+    Return (groups, DomainStatistics) where groups has the value of each
+    group, or None if the orientations have no group column.
+    """
+    keys = orientations.column(options["group_by_field"])
+    if keys is None:
+        return None
+    with timer.stage("grouping", len(orientations)):
+        rows, domains, groups = assign_groups(keys)
+        return groups, domain_statistics(
+            orientations.vectors, rows, domains, len(groups)
+        )
+
+
+def confidence_cone(orientations, rank, options, feedback, timer):
+    """
+    Bootstrap cone of the eigenvector of rank (0 for the smallest
+    eigenvalue) of an OrientationArray, timed in timer.
+    None if no replicates are requested or if canceled.
+    """
+    replicates = options["bootstrap_replicates"]
+    if replicates <= 0 or feedback.isCanceled():
+        return None
+    with timer.stage("bootstrap", len(orientations)):
+        return bootstrap_cone(
+            orientations.vectors,
+            rank,
+            replicates,
+            options["bootstrap_confidence"],
+            options["bootstrap_workers"],
+            feedback=feedback,
+        )
+
+
+def analyse_lines(
+    orientations,
+    legend,
+    options,
+    feedback,
+    contour_cache=None,
+    timer=None,
+    tensor_source=None,
+):
+    """
+    Compute the statistics and contours requested in options
+    for an OrientationArray of lines.
+    The stages are timed in timer, kept in the result.
+    tensor_source returns the orientation tensor of the data
+    if it is known, otherwise it is computed from the vectors.
+    """
+    timer = StageTimer() if timer is None else timer
+    result = {"legend": legend, "dataset": None, "timer": timer, "messages": []}
+    if not len(orientations):
+        return result
+
+    color_data = orientations.column(options["marker_color_field"])
+    with timer.stage("conversion", len(orientations)):
+        dataset = load_line_data(
+            orientations.lines, legend, color_data, options["marker_color_field"]
+        )
+        result["dataset"] = dataset
+    result["raster"] = raster_data(orientations, color_data, options, timer)
+
+    # best-fit plane
+    result["mean_plane"] = None
+    result["cone"] = None
+    if options["plot_mean_plane"]:
+        with timer.stage("statistics", len(orientations)):
+            if tensor_source is not None:
+                tensor = tensor_source()
+            else:
+                tensor = OrientationTensor()
+                tensor.add_vectors(orientations.vectors)
+            bestfit_pole = cartesian_to_lines(tensor.eigen()[0][0])[0]
+            result["mean_plane"] = planes_from_poles(*bestfit_pole)[0]
+        result["cone"] = confidence_cone(orientations, 0, options, feedback, timer)
+    result["groups"] = group_data(orientations, options, timer)
+    feedback.setProgress(70.0)
+
+    result["contour"] = None
+    if options["plot_contours"] and not feedback.isCanceled():
+        with timer.stage("contouring", len(orientations)):
+            result["contour"] = contour_data(orientations, options, contour_cache)
+    feedback.setProgress(100.0)
+    return result
+
+
+def analyse_planes(
+    orientations,
+    legend,
+    options,
+    feedback,
+    contour_cache=None,
+    timer=None,
+    tensor_source=None,
+):
+    """
+    Compute the strike/dip of an OrientationArray of planes
+    and their average intersection if requested.
+    The stages are timed in timer, kept in the result.
+    tensor_source returns the orientation tensor of the data
+    if it is known, otherwise it is computed from the vectors.
+    """
+    timer = StageTimer() if timer is None else timer
+    result = {"legend": legend, "dataset": None, "timer": timer, "messages": []}
+    if not len(orientations):
+        return result
+
+    with timer.stage("conversion", len(orientations)):
+        dataset = stg.PlaneData()
+        dataset.load_data(orientations.planes, legend)
+        result["dataset"] = dataset
+    result["plane_count"] = len(orientations)
+    result["arcs"], result["arc_density"] = arc_data(orientations, options, timer)
+
+    # average intersection
+    result["intersection"] = None
+    result["cone"] = None
+    if options["plot_intersection_point"]:
+        with timer.stage("statistics", len(orientations)):
+            if tensor_source is not None:
+                tensor = tensor_source()
+            else:
+                tensor = OrientationTensor()
+                tensor.add_vectors(orientations.vectors)
+            result["intersection"] = cartesian_to_lines(tensor.eigen()[0][0])
+        result["cone"] = confidence_cone(orientations, 0, options, feedback, timer)
+    result["groups"] = group_data(orientations, options, timer)
+    feedback.setProgress(100.0)
+    return result
+
+
+def analyse_poles(
+    orientations,
+    legend,
+    options,
+    feedback,
+    contour_cache=None,
+    timer=None,
+    tensor_source=None,
+):
+    """
+    Compute the poles of an OrientationArray of planes
+    and their statistics and contours requested in options.
+    The stages are timed in timer, kept in the result.
+    tensor_source returns the orientation tensor of the data
+    if it is known, otherwise it is computed from the vectors.
+    """
+    timer = StageTimer() if timer is None else timer
+    result = {"legend": legend, "dataset": None, "timer": timer, "messages": []}
+    if not len(orientations):
+        return result
+
+    color_data = orientations.column(options["marker_color_field"])
+    with timer.stage("conversion", len(orientations)):
+        dataset = load_line_data(
+            orientations.lines,
+            legend + " poles",
+            color_data,
+            options["marker_color_field"],
+        )
+        result["dataset"] = dataset
+    result["raster"] = raster_data(orientations, color_data, options, timer)
+
+    # average plane
+    result["mean_plane"] = None
+    result["cone"] = None
+    if options["plot_mean_plane"]:
+        with timer.stage("statistics", len(orientations)):
+            if tensor_source is not None:
+                tensor = tensor_source()
+            else:
+                tensor = OrientationTensor()
+                tensor.add_vectors(orientations.vectors)
+            avg_plane_pole = cartesian_to_lines(tensor.eigen()[0][2])[0]
+            result["mean_plane"] = planes_from_poles(*avg_plane_pole)[0]
+        result["cone"] = confidence_cone(orientations, 2, options, feedback, timer)
+    result["groups"] = group_data(orientations, options, timer)
+    feedback.setProgress(70.0)
+
+    result["contour"] = None
+    if options["plot_contours"] and not feedback.isCanceled():
+        with timer.stage("contouring", len(orientations)):
+            result["contour"] = contour_data(orientations, options, contour_cache)
+    feedback.setProgress(100.0)
+    return result
+
+
+def timed_read(
+    timer, snapshots, fields, planar, color_field, options, feedback, cache, log
+):
+    """
+    read_layers timed as the extraction stage of timer
+    """
+    with timer.stage("extraction") as stage:
+        layers = read_layers(
+            snapshots, fields, planar, color_field, options, feedback, cache, log
+        )
+        if layers is not None:
+            stage.count = sum(len(orientations) for _, orientations in layers)
+    return layers
+
+
+def compute_lines(snapshots, options, feedback, cache=None, contour_cache=None):
+    """
+    Extract line data and compute the statistics
+    and contours requested in options
+    """
+    timer = StageTimer()
+    messages = []
+    fields = line_fields(options)
+    layers = timed_read(
+        timer,
+        snapshots,
+        fields,
+        False,
+        options["marker_color_field"],
+        options,
+        feedback,
+        cache,
+        messages.append,
+    )
+    if layers is None:
+        return None
+    result = analyse_lines(
+        concatenate_layers(layers, options),
+        graph_name(snapshots),
+        options,
+        feedback,
+        contour_cache,
+        timer,
+        lambda: layers_tensor(
+            layers, fields, False, options, cache, options["marker_color_field"]
+        ),
+    )
+    result["messages"] = messages
+    return result
+
+
+def compute_planes(snapshots, options, feedback, cache=None, contour_cache=None):
+    """
+    Extract plane data in strike/dip format
+    and compute the average intersection if requested
+    """
+    timer = StageTimer()
+    messages = []
+    fields = planar_fields(options)
+    layers = timed_read(
+        timer, snapshots, fields, True, "", options, feedback, cache, messages.append
+    )
+    if layers is None:
+        return None
+    result = analyse_planes(
+        concatenate_layers(layers, options),
+        graph_name(snapshots),
+        options,
+        feedback,
+        contour_cache,
+        timer,
+        lambda: layers_tensor(layers, fields, True, options, cache),
+    )
+    result["messages"] = messages
+    return result
+
+
+def compute_poles(snapshots, options, feedback, cache=None, contour_cache=None):
+    """
+    Extract poles to planes and compute the statistics
+    and contours requested in options
+    """
+    timer = StageTimer()
+    messages = []
+    fields = planar_fields(options)
+    layers = timed_read(
+        timer,
+        snapshots,
+        fields,
+        True,
+        options["marker_color_field"],
+        options,
+        feedback,
+        cache,
+        messages.append,
+    )
+    if layers is None:
+        return None
+    result = analyse_poles(
+        concatenate_layers(layers, options),
+        graph_name(snapshots),
+        options,
+        feedback,
+        contour_cache,
+        timer,
+        lambda: layers_tensor(
+            layers, fields, True, options, cache, options["marker_color_field"]
+        ),
+    )
+    result["messages"] = messages
+    return result
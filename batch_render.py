@@ -0,0 +1,235 @@
+"""
+Headless rendering of the stereonets of many layers to image files.
+
+The features are read in the calling process, which owns the layers,
+and the analysis and drawing of every stereonet run in a pool of
+worker processes with the off-screen Agg backend of matplotlib.
+It can be called from the QGIS Python console or a script:
+
+    render_layers(layers, "/tmp/stereonets", formats=("png", "pdf"))
+
+or run on a project file without QGIS open:
+
+    python -m <plugin package>.batch_render project.qgz output_dir
+"""
+import argparse
+import os
+import re
+
+from qgis.core import QgsApplication, QgsFeedback, QgsProject, QgsVectorLayer
+
+from .analysis import (
+    analyse_lines,
+    analyse_planes,
+    analyse_poles,
+    line_fields,
+    planar_fields,
+    read_orientations,
+)
+from .extraction import LayerSnapshot
+from .options import default_options, sniff_planar_format
+from .parallel import default_workers, process_pool
+from .rendering import line_stereonet, plane_stereonet, pole_stereonet
+
+# plots which can be rendered, as in the toolbar of the plugin
+PLOT_TYPES = {
+    "lines": (analyse_lines, line_stereonet),
+    "planes": (analyse_planes, plane_stereonet),
+    "poles": (analyse_poles, pole_stereonet),
+}
+
+IMAGE_FORMATS = ("png", "svg", "pdf")
+
+
+def plot_fields(plot_type, options):
+    """
+    Return the orientation fields and the color field read for plot_type
+    """
+    if plot_type == "lines":
+        return line_fields(options), options["marker_color_field"]
+    if plot_type == "planes":
+        return planar_fields(options), ""
+    return planar_fields(options), options["marker_color_field"]
+
+
+def file_stem(name, used):
+    """
+    File name derived from a layer name, unique among used
+    """
+    stem = re.sub(r"[^\w.-]+", "_", name).strip("_") or "layer"
+    unique = stem
+    suffix = 1
+    while unique in used:
+        suffix += 1
+        unique = f"{stem}_{suffix}"
+    used.add(unique)
+    return unique
+
+
+def _init_render_worker():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_job(plot_type, orientations, legend, options, paths, dpi):
+    """
+    Analyse and draw one stereonet in a worker process and save it to paths.
+    Return the statistics reported while drawing it.
+    """
+    import matplotlib.pyplot as plt
+
+    analyse, build = PLOT_TYPES[plot_type]
+    messages = []
+    result = analyse(orientations, legend, options, QgsFeedback())
+    timer = result["timer"]
+    with timer.stage("rendering"):
+        stereonet = build(result, options, messages.append)
+        stereonet.generate_plots()
+        figure = stereonet.ax.figure
+        for path in paths:
+            figure.savefig(path, dpi=dpi, bbox_inches="tight")
+        plt.close("all")
+    messages.append(timer.summary(f"{plot_type.capitalize()} plot"))
+    return messages
+
+
+def render_layers(
+    layers,
+    output_dir,
+    options=None,
+    plot_types=tuple(PLOT_TYPES),
+    formats=("png",),
+    dpi=150,
+    workers=None,
+    feedback=None,
+    log=print,
+):
+    """
+    Render the stereonets of plot_types for all the features of each
+    vector layer in layers, to output_dir/<layer name>_<plot type>.<format>.
+    The planar format is detected for every layer as in the plugin,
+    other settings come from options (the plugin defaults if None).
+    Layers lacking the fields of a plot type are skipped for it.
+
+    Return the paths of the written files.
+    """
+    if options is None:
+        options = default_options()
+    if workers is None:
+        workers = default_workers()
+    if feedback is None:
+        feedback = QgsFeedback()
+    os.makedirs(output_dir, exist_ok=True)
+
+    jobs = []
+    used_stems = set()
+    vector_layers = [layer for layer in layers if isinstance(layer, QgsVectorLayer)]
+    for layer in vector_layers:
+        layer_options = dict(options)
+        sniff_planar_format(layer_options, layer)
+        # the stereonets are rendered in parallel already
+        layer_options["contour_workers"] = 1
+        layer_options["bootstrap_workers"] = 1
+        snapshot = LayerSnapshot(layer, selected_only=False)
+        stem = file_stem(layer.name(), used_stems)
+
+        for plot_type in plot_types:
+            fields, color_field = plot_fields(plot_type, layer_options)
+            if not all(snapshot.has_field(field) for field in fields):
+                continue
+            orientations = read_orientations(
+                [snapshot],
+                fields,
+                plot_type != "lines",
+                color_field,
+                layer_options,
+                feedback,
+                log=log,
+            )
+            if orientations is None:
+                return []
+            if not len(orientations):
+                log(f"{layer.name()}: no {plot_type} data. Skipped.")
+                continue
+
+            paths = [
+                os.path.join(output_dir, f"{stem}_{plot_type}.{image_format}")
+                for image_format in formats
+            ]
+            jobs.append(
+                (plot_type, orientations, layer.name(), layer_options, paths, dpi)
+            )
+
+    written = []
+    if not jobs:
+        return written
+    with process_pool(min(workers, len(jobs)), _init_render_worker) as pool:
+        futures = [pool.submit(_render_job, *job) for job in jobs]
+        for i, (job, future) in enumerate(zip(jobs, futures)):
+            if feedback.isCanceled():
+                for pending in futures:
+                    pending.cancel()
+                break
+            plot_type, legend, paths = job[0], job[2], job[4]
+            try:
+                messages = future.result()
+            except Exception as exception:
+                log(f"{legend}: {plot_type} stereonet failed: {exception}")
+                continue
+            for message in messages:
+                log(f"{legend}: {message}")
+            written.extend(paths)
+            feedback.setProgress(100.0 * (i + 1) / len(jobs))
+    return written
+
+
+def render_project(project_path, output_dir, **kwargs):
+    """
+    render_layers for all the vector layers of a project file
+    """
+    project = QgsProject.instance()
+    if not project.read(project_path):
+        raise ValueError(f"Cannot read the project {project_path}.")
+    return render_layers(list(project.mapLayers().values()), output_dir, **kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render the stereonets of the vector layers of a QGIS project."
+    )
+    parser.add_argument("project", help="QGIS project file")
+    parser.add_argument("output_dir", help="directory of the images")
+    parser.add_argument(
+        "--plots", nargs="+", choices=list(PLOT_TYPES), default=list(PLOT_TYPES)
+    )
+    parser.add_argument(
+        "--formats", nargs="+", choices=IMAGE_FORMATS, default=["png"]
+    )
+    parser.add_argument("--contours", action="store_true", help="plot density contours")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    args = parser.parse_args(argv)
+
+    options = default_options()
+    options["plot_contours"] = args.contours
+
+    app = QgsApplication([], False)
+    app.initQgis()
+    try:
+        written = render_project(
+            args.project,
+            args.output_dir,
+            options=options,
+            plot_types=args.plots,
+            formats=args.formats,
+            dpi=args.dpi,
+            workers=args.workers,
+        )
+    finally:
+        app.exitQgis()
+    print(f"{len(written)} images written to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Compare the best times of two benchmark runs:
+
+    python benchmarks/compare.py before.json after.json
+"""
+import argparse
+import json
+
+
+def best_times(path):
+    with open(path) as results_file:
+        results = json.load(results_file)["results"]
+    return {
+        (result["distribution"], result["size"], result["stage"]): result["best"]
+        for result in results
+        if "best" in result
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs.")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args(argv)
+
+    before = best_times(args.before)
+    after = best_times(args.after)
+    print(
+        f"{'distribution':12} {'size':>9} {'stage':22} "
+        f"{'before':>9} {'after':>9} speedup"
+    )
+    for key in sorted(before.keys() & after.keys()):
+        distribution, size, stage = key
+        print(
+            f"{distribution:12} {size:>9} {stage:22} "
+            f"{before[key]:9.4f} {after[key]:9.4f} {before[key] / after[key]:6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+Import of the plugin modules from a checkout, whose directory name
+need not be a valid Python identifier (e.g. qgis-structural-geology)
+"""
+import importlib
+import os
+import sys
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def plugin_package():
+    """
+    Return the name of the plugin package, importable once this returns
+    """
+    parent = os.path.dirname(PLUGIN_DIR)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    return os.path.basename(PLUGIN_DIR)
+
+
+def plugin_module(name):
+    """
+    Return the module name of the plugin package, imported with relative imports working
+    """
+    return importlib.import_module(f"{plugin_package()}.{name}")
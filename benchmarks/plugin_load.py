@@ -0,0 +1,106 @@
+"""
+Load time of the plugin, as QGIS loads it at startup:
+
+    python benchmarks/plugin_load.py --repeat 10 --output load.json
+
+Every repeat runs in a fresh interpreter with a headless QgsApplication,
+and times the import of the plugin package, classFactory() and initGui().
+The heavy modules which the plugin defers to the first use of an action
+are reported if they were loaded anyway. The exit status is 1 if one was
+loaded, or if the best time exceeds --budget.
+
+The results are written as JSON, see compare.py to compare two runs.
+"""
+import argparse
+import importlib
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from plugin_import import plugin_package
+
+# modules which must not be loaded before an action is used
+DEFERRED_MODULES = (
+    "stgeotk",
+    "matplotlib",
+    "matplotlib.pyplot",
+    "PyQt5.uic",
+    "scipy",
+    "scipy.spatial",
+)
+
+
+def measure():
+    """
+    Load the plugin once in this interpreter and print the measurement
+    """
+    from qgis.core import QgsApplication
+
+    from stand_in import StandInIface
+
+    application = QgsApplication([], False)
+    application.initQgis()
+    start = time.perf_counter()
+    package = importlib.import_module(plugin_package())
+    plugin = package.classFactory(StandInIface())
+    plugin.initGui()
+    elapsed = time.perf_counter() - start
+    loaded = [name for name in DEFERRED_MODULES if name in sys.modules]
+    plugin.unload()
+    application.exitQgis()
+    print(json.dumps({"time": elapsed, "deferred_loaded": loaded}))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, help="maximum best time, in s")
+    parser.add_argument("--output", default="plugin_load.json")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        measure()
+        return 0
+
+    times = []
+    loaded = set()
+    for _ in range(args.repeat):
+        output = subprocess.run(
+            [sys.executable, __file__, "--child"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        measurement = json.loads(output.strip().splitlines()[-1])
+        times.append(measurement["time"])
+        loaded.update(measurement["deferred_loaded"])
+
+    result = {
+        "distribution": "plugin",
+        "size": 0,
+        "stage": "plugin_load",
+        "times": times,
+        "best": min(times),
+        "median": statistics.median(times),
+        "deferred_loaded": sorted(loaded),
+    }
+    print(f"plugin load {result['best']:.4f} s (median {result['median']:.4f} s)")
+    with open(args.output, "w") as output:
+        json.dump({"metadata": {"repeat": args.repeat}, "results": [result]}, output)
+    print(f"Results written to {args.output}")
+
+    status = 0
+    if loaded:
+        print("Loaded at startup: " + ", ".join(sorted(loaded)))
+        status = 1
+    if args.budget is not None and result["best"] > args.budget:
+        print(f"Over the budget of {args.budget} s")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
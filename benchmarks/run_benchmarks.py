@@ -0,0 +1,276 @@
+"""
+Benchmarks of the stages of the stereonet plots on synthetic data.
+
+    python benchmarks/run_benchmarks.py --sizes 1000 100000 --output run.json
+
+Every stage is timed separately for each distribution and size:
+attribute extraction from a memory and a GeoPackage layer, conversion
+of planes to poles, eigen analysis of the orientation tensor, Fisher
+contouring, the bootstrap cone of the mean and generate_plots().
+The plugin runs against a stand-in iface in a headless QgsApplication.
+The stages needing QGIS or stgeotk are recorded as skipped when these
+are not installed.
+
+The results are written as JSON, see compare.py to compare two runs.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from plugin_import import PLUGIN_DIR, plugin_module
+from synthetic import DISTRIBUTIONS, planar_columns, synthetic_lines
+
+orientation = plugin_module("orientation")
+density = plugin_module("density")
+bootstrap = plugin_module("bootstrap")
+
+DEFAULT_SIZES = [10 ** exponent for exponent in range(3, 8)]
+
+STAGES = (
+    "extraction_memory",
+    "extraction_geopackage",
+    "pole_conversion",
+    "eigen",
+    "fisher_contour",
+    "bootstrap_cone",
+    "generate_plots",
+)
+
+# stages which need a QgsApplication and the plugin module
+QGIS_STAGES = ("extraction_memory", "extraction_geopackage", "generate_plots")
+
+
+def time_repeats(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def start_qgis():
+    """
+    Start a headless QgsApplication.
+    Return (application, None), or (None, reason) if QGIS is unavailable.
+    """
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        from qgis.core import QgsApplication
+    except ImportError as exception:
+        return None, str(exception)
+    application = QgsApplication([], False)
+    application.initQgis()
+    return application, None
+
+
+class Session:
+    """
+    The plugin against a stand-in iface, with the layers it reads
+    """
+
+    def __init__(self, workdir):
+        from stand_in import StandInIface
+
+        self.workdir = workdir
+        self.iface = StandInIface()
+        self.plugin = plugin_module("stereoplot").StereonetPlugin(self.iface)
+        self.analysis = plugin_module("analysis")
+        self.options = dict(self.plugin.options)
+        self.options["use_dip_dir"] = True
+        self.options["dip_dir_field"] = "dip_dir"
+        self.options["dip_angle_field"] = "dip_angle"
+        self.options["plot_contours"] = False
+
+    def layers(self, name, lines):
+        """
+        Memory and GeoPackage layers of the planes whose poles are lines
+        """
+        from stand_in import geopackage_layer, memory_layer
+
+        fields = (self.options["dip_dir_field"], self.options["dip_angle_field"])
+        memory = memory_layer(name, fields, planar_columns(lines))
+        path = os.path.join(self.workdir, name + ".gpkg")
+        return memory, geopackage_layer(memory, path)
+
+    def extract(self, layer):
+        """
+        Read the planes of layer as the poles-to-plane plot does
+        """
+        from qgis.core import QgsFeedback
+
+        layer.selectAll()
+        self.iface.layerTreeView().set_layers([layer])
+        snapshots = self.plugin.snapshot_selected_layers("benchmark")
+        return self.analysis.read_orientations(
+            snapshots,
+            self.analysis.planar_fields(self.options),
+            True,
+            "",
+            self.options,
+            QgsFeedback(),
+        )
+
+    def poles_result(self, lines):
+        from qgis.core import QgsFeedback
+
+        orientations = orientation.OrientationArray.from_planes(
+            planar_columns(lines), use_dip_dir=True
+        )
+        return self.analysis.analyse_poles(
+            orientations, "benchmark", self.options, QgsFeedback()
+        )
+
+    def render(self, result):
+        import matplotlib.pyplot as plt
+
+        self.plugin.options = self.options
+        self.plugin.render_poles(result)
+        plt.close("all")
+
+
+def run_stages(distribution, size, args, session, skip_reason):
+    """
+    Time the stages on one dataset. Yield the result records.
+    """
+    lines = synthetic_lines(distribution, size, args.seed)
+    record = {"distribution": distribution, "size": size}
+
+    def timed(stage, function):
+        times = time_repeats(function, args.repeat)
+        result = dict(record, stage=stage, times=times)
+        result["best"] = min(times)
+        result["median"] = statistics.median(times)
+        print(f"{distribution:8} {size:>9} {stage:22} {result['best']:.4f} s")
+        return result
+
+    def skipped(stage, reason):
+        print(f"{distribution:8} {size:>9} {stage:22} skipped: {reason}")
+        return dict(record, stage=stage, skipped=reason)
+
+    layers = None
+    if session is not None and (
+        "extraction_memory" in args.stages or "extraction_geopackage" in args.stages
+    ):
+        layers = session.layers(f"{distribution}_{size}", lines)
+
+    for stage in args.stages:
+        if stage in QGIS_STAGES and session is None:
+            yield skipped(stage, skip_reason)
+        elif stage == "extraction_memory":
+            yield timed(stage, lambda: session.extract(layers[0]))
+        elif stage == "extraction_geopackage":
+            yield timed(stage, lambda: session.extract(layers[1]))
+        elif stage == "pole_conversion":
+            planes = planar_columns(lines)
+            strike = orientation.strike_from_direction(planes[:, 0], True)
+            yield timed(
+                stage, lambda: orientation.poles_from_planes(strike, planes[:, 1])
+            )
+        elif stage == "eigen":
+
+            def eigen():
+                tensor = orientation.OrientationTensor()
+                tensor.add_lines(lines[:, 0], lines[:, 1])
+                return tensor.eigen()
+
+            yield timed(stage, eigen)
+        elif stage == "fisher_contour":
+            vectors = orientation.lines_to_cartesian(lines[:, 0], lines[:, 1])
+            yield timed(
+                stage,
+                lambda: density.density_grid(
+                    vectors, k_mode=args.k_mode, workers=args.workers
+                ),
+            )
+        elif stage == "bootstrap_cone":
+            vectors = orientation.lines_to_cartesian(lines[:, 0], lines[:, 1])
+            yield timed(
+                stage,
+                lambda: bootstrap.bootstrap_cone(vectors, 2, workers=args.workers),
+            )
+        elif stage == "generate_plots":
+            result = session.poles_result(lines)
+            yield timed(stage, lambda: session.render(result))
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=PLUGIN_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(args):
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "k_mode": args.k_mode,
+        "workers": args.workers,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--distributions",
+        nargs="+",
+        choices=list(DISTRIBUTIONS),
+        default=list(DISTRIBUTIONS),
+    )
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--k-mode", choices=list(density.K_OPTIMIZATION_MODES), default="balanced"
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args(argv)
+
+    application, skip_reason = None, None
+    if any(stage in QGIS_STAGES for stage in args.stages):
+        application, skip_reason = start_qgis()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        session = Session(workdir) if application is not None else None
+        for distribution in args.distributions:
+            for size in args.sizes:
+                results.extend(
+                    run_stages(distribution, size, args, session, skip_reason)
+                )
+        if application is not None:
+            application.exitQgis()
+
+    with open(args.output, "w") as output:
+        json.dump({"metadata": metadata(args), "results": results}, output, indent=1)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Stand-ins for the QGIS interface, so that the plugin runs
+in a headless QgsApplication, and the layers it reads
+"""
+import os
+
+from qgis.core import (
+    QgsCoordinateTransformContext,
+    QgsFeature,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+)
+
+# features added to the memory layers at once
+ADD_FEATURES_BATCH = 100000
+
+
+class StandInSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot):
+        self.slots.remove(slot)
+
+    def emit(self, *args):
+        for slot in self.slots:
+            slot(*args)
+
+
+class StandInLayerTreeView:
+    """
+    Layer tree where every layer is selected
+    and the first one is the current layer
+    """
+
+    def __init__(self, layers):
+        self.layers = list(layers)
+        self.currentLayerChanged = StandInSignal()
+
+    def currentLayer(self):
+        return self.layers[0] if self.layers else None
+
+    def selectedLayersRecursive(self):
+        return list(self.layers)
+
+    def set_layers(self, layers):
+        self.layers = list(layers)
+        self.currentLayerChanged.emit(self.currentLayer())
+
+
+class StandInMessageBar:
+    def __init__(self):
+        self.messages = []
+
+    def pushMessage(self, title, text, level=None, duration=None):
+        self.messages.append((title, text))
+
+
+class StandInIface:
+    """
+    The parts of QgisInterface used by the plugin
+    """
+
+    def __init__(self, layers=()):
+        self.tree_view = StandInLayerTreeView(layers)
+        self.message_bar = StandInMessageBar()
+
+    def layerTreeView(self):
+        return self.tree_view
+
+    def messageBar(self):
+        return self.message_bar
+
+    def addToolBarIcon(self, action):
+        pass
+
+    def removeToolBarIcon(self, action):
+        pass
+
+    def mainWindow(self):
+        return None
+
+
+def memory_layer(name, field_names, values):
+    """
+    Geometryless memory layer with double fields field_names
+    holding the columns of the (N, len(field_names)) array values
+    """
+    fields = "&".join(f"field={field}:double" for field in field_names)
+    layer = QgsVectorLayer(f"None?{fields}", name, "memory")
+    provider = layer.dataProvider()
+    for start in range(0, len(values), ADD_FEATURES_BATCH):
+        features = []
+        for row in values[start : start + ADD_FEATURES_BATCH].tolist():
+            feature = QgsFeature(layer.fields())
+            feature.setAttributes(row)
+            features.append(feature)
+        provider.addFeatures(features)
+    layer.updateExtents()
+    return layer
+
+
+def geopackage_layer(layer, path):
+    """
+    Write layer to a GeoPackage at path and return it opened from there
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "GPKG"
+    options.layerName = layer.name()
+    result = QgsVectorFileWriter.writeAsVectorFormatV2(
+        layer, path, QgsCoordinateTransformContext(), options
+    )
+    if result[0] != QgsVectorFileWriter.NoError:
+        raise RuntimeError(f"Cannot write {path}: {result[1]}")
+    return QgsVectorLayer(f"{path}|layername={layer.name()}", layer.name(), "ogr")
+
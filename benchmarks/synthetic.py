@@ -0,0 +1,98 @@
+"""
+Reproducible synthetic orientation data.
+
+Fisher data cluster around a mean direction, Bingham data spread
+along a girdle, which are the two shapes the stereonet statistics
+are designed for.
+"""
+import numpy as np
+
+from plugin_import import plugin_module
+
+orientation = plugin_module("orientation")
+
+
+def rotate_to(vectors, axis):
+    """
+    Rotate vectors generated around the z axis to be around axis
+    """
+    axis = np.asarray(axis, dtype=np.double)
+    axis /= np.linalg.norm(axis)
+    z = np.array([0.0, 0.0, 1.0])
+    v = np.cross(z, axis)
+    c = z @ axis
+    if np.linalg.norm(v) < 1e-12:
+        return vectors if c > 0.0 else -vectors
+    vx = np.array([[0.0, -v[2], v[1]], [v[2], 0.0, -v[0]], [-v[1], v[0], 0.0]])
+    rotation = np.eye(3) + vx + vx @ vx / (1.0 + c)
+    return vectors @ rotation.T
+
+
+def fisher_vectors(size, kappa, mean, rng):
+    """
+    Sample size unit vectors of a Fisher distribution
+    of concentration kappa around mean
+    """
+    u = rng.random(size)
+    w = 1.0 + np.log(u + (1.0 - u) * np.exp(-2.0 * kappa)) / kappa
+    phi = rng.uniform(0.0, 2.0 * np.pi, size)
+    r = np.sqrt(np.clip(1.0 - w ** 2, 0.0, None))
+    vectors = np.column_stack((r * np.cos(phi), r * np.sin(phi), w))
+    return rotate_to(vectors, mean)
+
+
+def bingham_vectors(size, kappa, normal, rng):
+    """
+    Sample size unit vectors of a Bingham distribution with density
+    proportional to exp(-kappa (x.normal)^2), a girdle along the great
+    circle normal to normal, by rejection from an angular central
+    Gaussian envelope (Kent, Ganeiber and Mardia, 2013)
+    """
+    # the exponent is -x'Ax with A = diag(0, 0, kappa)
+    eigenvalues = np.array([0.0, 0.0, kappa])
+    q = 3
+    low, high = 1e-9, float(q)
+    for _ in range(100):
+        b = 0.5 * (low + high)
+        if (1.0 / (b + 2.0 * eigenvalues)).sum() > 1.0:
+            low = b
+        else:
+            high = b
+    omega = 1.0 + 2.0 * eigenvalues / b
+    log_m = -0.5 * (q - b) + 0.5 * q * np.log(q / b)
+
+    samples = []
+    count = 0
+    while count < size:
+        y = rng.standard_normal((size, 3)) / np.sqrt(omega)
+        x = y / np.linalg.norm(y, axis=1)[:, np.newaxis]
+        log_density = -kappa * x[:, 2] ** 2
+        log_envelope = log_m - 0.5 * q * np.log((x ** 2) @ omega)
+        accepted = x[np.log(rng.random(size)) < log_density - log_envelope]
+        samples.append(accepted)
+        count += len(accepted)
+    return rotate_to(np.concatenate(samples)[:size], normal)
+
+
+# parameters of the benchmarked distributions
+DISTRIBUTIONS = {
+    "fisher": lambda size, rng: fisher_vectors(size, 20.0, (0.3, 0.5, -0.8), rng),
+    "bingham": lambda size, rng: bingham_vectors(size, 20.0, (0.6, 0.2, -0.4), rng),
+}
+
+
+def synthetic_lines(distribution, size, seed=0):
+    """
+    (size, 2) array of trend/plunge drawn from one of DISTRIBUTIONS
+    """
+    rng = np.random.default_rng(seed)
+    vectors = DISTRIBUTIONS[distribution](size, rng)
+    return orientation.cartesian_to_lines(vectors)
+
+
+def planar_columns(lines):
+    """
+    Dip direction/dip angle columns of the planes whose poles are lines
+    """
+    dip_direction = np.mod(lines[:, 0] + 180.0, 360.0)
+    return np.column_stack((dip_direction, 90.0 - lines[:, 1]))
@@ -0,0 +1,145 @@
+"""
+Bootstrap confidence cones of the eigenvector means of axial data.
+
+The dataset is resampled with replacement many times and the eigenvector
+of interest is computed again for every resample. All the resamples of
+a chunk are drawn as one index matrix, turned into the counts of every
+measurement in every resample, and their orientation tensors are summed
+by one matrix product with the products v v^T of the measurements.
+The tensors of all resamples are diagonalized by one stacked eigen
+decomposition. The cone is the angle from the mean that holds the
+requested share of the resampled eigenvectors.
+"""
+import numpy as np
+
+from .defaults import DEFAULT_CONFIDENCE
+from .orientation import cartesian_to_lines
+from .parallel import process_pool
+
+# resamples of bootstrap_cone by default
+DEFAULT_REPLICATES = 1000
+
+# bound on the number of resampled indices held in memory at once
+MAX_RESAMPLE_INDICES = 4000000
+
+# resamples of each job, fixed so that the result does not depend
+# on the number of workers
+REPLICATES_PER_JOB = 250
+
+# below this number of resampled indices, the jobs run in this process
+PARALLEL_THRESHOLD = 50000000
+
+
+def tensor_products(vectors):
+    """
+    (N, 6) upper triangle components of v v^T of an (N, 3) array of vectors
+    """
+    i, j = np.triu_indices(3)
+    vectors = np.asarray(vectors, dtype=np.double)
+    return vectors[:, i] * vectors[:, j]
+
+
+def resample_tensors(products, replicates, rng):
+    """
+    Sums of the products of replicates resamples with replacement
+    of the rows of products, as a (replicates, 6) array
+    """
+    size = len(products)
+    dtype = np.int32 if size < 2 ** 31 else np.int64
+    step = max(1, MAX_RESAMPLE_INDICES // size)
+    sums = np.empty((replicates, 6))
+    for start in range(0, replicates, step):
+        count = min(step, replicates - start)
+        indices = rng.integers(0, size, (count, size), dtype=dtype)
+        counts = np.empty((count, size))
+        for row, resample in enumerate(indices):
+            counts[row] = np.bincount(resample, minlength=size)
+        sums[start : start + count] = counts @ products
+    return sums
+
+
+def resample_eigenvectors(products, replicates, rank, seed):
+    """
+    Eigenvectors of rank (0 for the smallest eigenvalue) of the tensors
+    of replicates resamples of products, as a (replicates, 3) array
+    """
+    sums = resample_tensors(products, replicates, np.random.default_rng(seed))
+    i, j = np.triu_indices(3)
+    tensors = np.zeros((replicates, 3, 3))
+    tensors[:, i, j] = sums
+    tensors[:, j, i] = sums
+    return np.linalg.eigh(tensors)[1][:, :, rank]
+
+
+class BootstrapCone:
+    """
+    Cone of confidence around the unit vector axis, with the angular
+    radius in degrees holding the confidence share of the replicates
+    """
+
+    def __init__(self, axis, radius, confidence, replicates):
+        self.axis = axis
+        self.radius = radius
+        self.confidence = confidence
+        self.replicates = replicates
+
+    def line(self):
+        """
+        Trend/plunge of the axis
+        """
+        return cartesian_to_lines(self.axis)[0]
+
+
+def bootstrap_cone(
+    vectors,
+    rank,
+    replicates=DEFAULT_REPLICATES,
+    confidence=DEFAULT_CONFIDENCE,
+    workers=1,
+    seed=0,
+    feedback=None,
+):
+    """
+    Bootstrap cone of the eigenvector of rank (0 for the smallest
+    eigenvalue) of the orientation tensor of an (N, 3) array of unit
+    vectors, from at least one replicate.
+    Large bootstraps are split across workers processes.
+    Return a BootstrapCone, or None if canceled.
+    """
+    products = tensor_products(vectors)
+    i, j = np.triu_indices(3)
+    tensor = np.zeros((3, 3))
+    tensor[i, j] = tensor[j, i] = products.sum(axis=0)
+    axis = np.linalg.eigh(tensor)[1][:, rank]
+
+    sizes = [
+        min(REPLICATES_PER_JOB, replicates - start)
+        for start in range(0, replicates, REPLICATES_PER_JOB)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    samples = []
+    parallel = replicates * len(products) > PARALLEL_THRESHOLD
+    if workers > 1 and len(sizes) > 1 and parallel:
+        with process_pool(min(workers, len(sizes))) as pool:
+            futures = [
+                pool.submit(resample_eigenvectors, products, size, rank, job_seed)
+                for size, job_seed in zip(sizes, seeds)
+            ]
+            for future in futures:
+                if feedback is not None and feedback.isCanceled():
+                    for pending in futures:
+                        pending.cancel()
+                    return None
+                samples.append(future.result())
+    else:
+        for size, job_seed in zip(sizes, seeds):
+            if feedback is not None and feedback.isCanceled():
+                return None
+            samples.append(resample_eigenvectors(products, size, rank, job_seed))
+
+    # the eigenvectors are axes, so their sign is irrelevant
+    cosines = np.abs(np.concatenate(samples) @ axis)
+    angles = np.degrees(np.arccos(np.clip(cosines, 0.0, 1.0)))
+    return BootstrapCone(
+        axis, float(np.quantile(angles, confidence)), confidence, replicates
+    )
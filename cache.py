@@ -0,0 +1,422 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .extraction import DEFAULT_CHUNK_SIZE, extract_attributes, extract_selected
+from .orientation import filter_measurements, measurement_vectors
+
+# selection changes larger than this since the last plot
+# are read again in full instead of being applied to the cached data
+MAX_INCREMENTAL_FIDS = 10000
+
+
+class LayerEntry:
+    """
+    Attribute columns cached for the current selection of one layer
+    """
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.fids = None
+        self.columns = {}
+
+
+class SelectionChanges:
+    """
+    Features added to and removed from the selection of a layer
+    since the generation of its cached entry
+    """
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.added = set()
+        self.removed = set()
+
+    def __len__(self):
+        return len(self.added) + len(self.removed)
+
+    def update(self, selected, deselected):
+        for fid in deselected:
+            if fid in self.added:
+                self.added.discard(fid)
+            else:
+                self.removed.add(fid)
+        for fid in selected:
+            if fid in self.removed:
+                self.removed.discard(fid)
+            else:
+                self.added.add(fid)
+
+
+class OrientationCache:
+    """
+    Cache of the attribute columns extracted from the selected features
+    of the watched layers, so that repeated plots skip extraction.
+
+    Each layer has a generation counter which is bumped by every
+    signal that may change the cached data. A LayerSnapshot records the
+    generation it was taken at, which stands for the selected feature ids,
+    and only matching entries are read or written.
+    Columns are cached per field name, so that different plots sharing
+    the same orientation fields reuse each other's extraction.
+
+    The orientation tensors of the selected features are kept as well,
+    keyed by (field names, planar, use_dip_dir, color field).
+
+    Selection edits only record the features added to or removed from
+    the selection. The next read brings the columns and the tensors up
+    to date from the task by dropping the rows of the removed features
+    and extracting the added ones, so that its cost follows the size
+    of the edit rather than the size of the selection.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generations = {}
+        self._entries = {}
+        self._tensors = {}
+        self._changes = {}
+        self._connections = {}
+
+    def watch(self, layer):
+        """
+        Start tracking the changes of layer if not done yet.
+        Return the current generation of the layer.
+        """
+        layer_id = layer.id()
+        if layer_id not in self._connections:
+            connections = [
+                (
+                    layer.selectionChanged,
+                    lambda selected, deselected, clear: self.selection_changed(
+                        layer_id, selected, deselected, clear
+                    ),
+                ),
+                (layer.featureAdded, lambda fid: self.invalidate(layer_id)),
+                (layer.featureDeleted, lambda fid: self.invalidate(layer_id)),
+                (layer.updatedFields, lambda: self.invalidate(layer_id)),
+                (
+                    layer.attributeValueChanged,
+                    lambda fid, index, value: self.attribute_changed(
+                        layer, layer_id, index
+                    ),
+                ),
+                (layer.willBeDeleted, lambda: self.forget(layer_id)),
+            ]
+            for signal, slot in connections:
+                signal.connect(slot)
+            self._connections[layer_id] = connections
+        return self.generation(layer_id)
+
+    def generation(self, layer_id):
+        with self._lock:
+            return self._generations.get(layer_id, 0)
+
+    def invalidate(self, layer_id):
+        with self._lock:
+            self._generations[layer_id] = self._generations.get(layer_id, 0) + 1
+            self._entries.pop(layer_id, None)
+            self._tensors.pop(layer_id, None)
+            self._changes.pop(layer_id, None)
+
+    def attribute_changed(self, layer, layer_id, index):
+        """
+        Only edits of a cached column invalidate the layer
+        """
+        field_name = layer.fields().field(index).name()
+        with self._lock:
+            entry = self._entries.get(layer_id)
+            cached = entry is not None and field_name in entry.columns
+            tensors = self._tensors.get(layer_id, {})
+            if not cached and not any(
+                field_name in key[0] or field_name == key[3] for key in tensors
+            ):
+                return
+        self.invalidate(layer_id)
+
+    def selection_changed(self, layer_id, selected, deselected, clear):
+        """
+        Bump the generation of the layer and record the edit of its
+        selection, which is applied to the cached data by the next read
+        """
+        with self._lock:
+            previous = self._generations.get(layer_id, 0)
+            self._generations[layer_id] = previous + 1
+            changes = self._changes.pop(layer_id, None)
+            if changes is None:
+                changes = SelectionChanges(previous)
+            cached = layer_id in self._entries or layer_id in self._tensors
+            size = len(changes) + len(selected) + len(deselected)
+            if clear or not cached or size > MAX_INCREMENTAL_FIDS:
+                self._entries.pop(layer_id, None)
+                self._tensors.pop(layer_id, None)
+                return
+            changes.update(selected, deselected)
+            self._changes[layer_id] = changes
+
+    def catch_up(self, snapshot, feedback=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Apply the selection changes recorded since the cached entry
+        of a LayerSnapshot to its columns and orientation tensors.
+        Return the updated LayerEntry, or None if it cannot be updated.
+        """
+        layer_id = snapshot.layer_id
+        with self._lock:
+            changes = self._changes.get(layer_id)
+            entry = self._entries.get(layer_id)
+            tensors = self._tensors.get(layer_id, {})
+            current = self._generations.get(layer_id, 0)
+        if (
+            changes is None
+            or entry is None
+            or not entry.columns
+            or entry.generation != changes.generation
+            or current != snapshot.generation
+        ):
+            return None
+
+        names = list(entry.columns)
+        removed = np.isin(entry.fids, np.fromiter(changes.removed, np.int64))
+        if np.count_nonzero(removed) != len(changes.removed):
+            return None
+        kept = ~removed
+        added = np.fromiter(changes.added, np.int64)
+        dtype = entry.columns[names[0]][0].dtype
+        new_fids = added
+        new_values = np.empty((0, len(names)), dtype=dtype)
+        new_null = np.empty((0, len(names)), dtype=bool)
+        if len(added):
+            extracted = extract_attributes(
+                snapshot.source,
+                snapshot.fields,
+                names,
+                added,
+                feedback,
+                dtype,
+                chunk_size,
+            )
+            if extracted is None or len(extracted[0]) != len(added):
+                return None
+            new_fids, new_values, new_null = extracted
+
+        updated = LayerEntry(snapshot.generation)
+        updated.fids = np.concatenate((entry.fids[kept], new_fids))
+        old_values, old_null = {}, {}
+        for i, name in enumerate(names):
+            values, null = entry.columns[name]
+            old_values[name], old_null[name] = values[removed], null[removed]
+            updated.columns[name] = (
+                np.concatenate((values[kept], new_values[:, i])),
+                np.concatenate((null[kept], new_null[:, i])),
+            )
+        if snapshot.fids is not None and len(updated.fids) != len(snapshot.fids):
+            return None
+
+        # the vectors of the changed rows, filtered as analysis.read_layers does
+        updated_tensors = {}
+        for key, (generation, tensor) in tensors.items():
+            field_names, planar, use_dip_dir, color_field = key
+            columns = list(field_names) + ([color_field] if color_field else [])
+            if generation != entry.generation or not set(columns) <= set(names):
+                continue
+            indices = [names.index(name) for name in columns]
+            tensor = tensor.copy()
+            for values, null, update in (
+                (
+                    np.column_stack([old_values[name] for name in columns]),
+                    np.column_stack([old_null[name] for name in columns]),
+                    tensor.remove_vectors,
+                ),
+                (new_values[:, indices], new_null[:, indices], tensor.add_vectors),
+            ):
+                measurements, _, _ = filter_measurements(
+                    values, null, planar, bool(color_field)
+                )
+                update(measurement_vectors(measurements, planar, use_dip_dir))
+            updated_tensors[key] = (snapshot.generation, tensor)
+
+        with self._lock:
+            if self._generations.get(layer_id, 0) != snapshot.generation:
+                return None
+            self._entries[layer_id] = updated
+            self._tensors[layer_id] = updated_tensors
+            self._changes.pop(layer_id, None)
+        return updated
+
+    def tensor(self, snapshot, key, compute):
+        """
+        Orientation tensor of the selected features of a LayerSnapshot
+        for key, as cached or returned by compute
+        """
+        with self._lock:
+            cached = self._tensors.get(snapshot.layer_id, {}).get(key)
+        if cached is not None and cached[0] == snapshot.generation:
+            return cached[1]
+        if cached is not None and self.catch_up(snapshot) is not None:
+            with self._lock:
+                cached = self._tensors.get(snapshot.layer_id, {}).get(key)
+            if cached is not None and cached[0] == snapshot.generation:
+                return cached[1]
+
+        tensor = compute()
+        with self._lock:
+            if self._generations.get(snapshot.layer_id, 0) == snapshot.generation:
+                tensors = self._tensors.setdefault(snapshot.layer_id, {})
+                tensors[key] = (snapshot.generation, tensor)
+        return tensor
+
+    def forget(self, layer_id):
+        """
+        Drop the entry of a layer which is being deleted
+        """
+        self.invalidate(layer_id)
+        self._connections.pop(layer_id, None)
+
+    def clear(self):
+        """
+        Drop all entries and stop tracking the layers
+        """
+        for connections in self._connections.values():
+            for signal, slot in connections:
+                try:
+                    signal.disconnect(slot)
+                except (RuntimeError, TypeError):
+                    pass
+        self._connections.clear()
+        with self._lock:
+            self._entries.clear()
+            self._tensors.clear()
+            self._changes.clear()
+
+    def extract(
+        self,
+        snapshot,
+        field_names,
+        feedback=None,
+        dtype=np.double,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Same as extraction.extract_selected,
+        but only reads the columns which are not cached yet
+        """
+        if not all(snapshot.has_field(name) for name in field_names):
+            return None
+
+        with self._lock:
+            entry = self._entries.get(snapshot.layer_id)
+        if entry is None or entry.generation != snapshot.generation:
+            entry = self.catch_up(snapshot, feedback, chunk_size)
+            if entry is None:
+                entry = LayerEntry(snapshot.generation)
+        with self._lock:
+            missing = [name for name in field_names if name not in entry.columns]
+            fids = entry.fids
+
+        if missing:
+            extracted = extract_selected(snapshot, missing, feedback, dtype, chunk_size)
+            if extracted is None:
+                return None
+            new_fids, values, null = extracted
+
+            if fids is None:
+                fids = new_fids
+            elif len(fids) != len(new_fids):
+                return extract_selected(
+                    snapshot, field_names, feedback, dtype, chunk_size
+                )
+            elif not np.array_equal(fids, new_fids):
+                # align the new columns with the order of the cached ones
+                order = np.argsort(new_fids)
+                rows = order[np.searchsorted(new_fids, fids, sorter=order)]
+                values, null = values[rows], null[rows]
+
+            columns = dict(entry.columns)
+            for i, name in enumerate(missing):
+                columns[name] = (values[:, i], null[:, i])
+
+            with self._lock:
+                if self._generations.get(snapshot.layer_id, 0) == snapshot.generation:
+                    entry.fids = fids
+                    entry.columns.update(columns)
+                    self._entries[snapshot.layer_id] = entry
+        else:
+            columns = entry.columns
+
+        values = np.column_stack([columns[name][0] for name in field_names])
+        null = np.column_stack([columns[name][1] for name in field_names])
+        return fids, values, null
+
+
+# memory budget of the contour cache
+CONTOUR_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def data_digest(data):
+    """
+    Hash of the content of an array, used as part of cache keys
+    """
+    data = np.ascontiguousarray(data)
+    digest = hashlib.blake2b(data.tobytes(), digest_size=16)
+    digest.update(str((data.dtype, data.shape)).encode())
+    return digest.hexdigest()
+
+
+def estimate_nbytes(obj):
+    """
+    Approximate memory held by obj through its numpy array attributes
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    nbytes = 0
+    for value in getattr(obj, "__dict__", {}).values():
+        if isinstance(value, np.ndarray):
+            nbytes += value.nbytes
+    return nbytes
+
+
+class ContourCache:
+    """
+    Least-recently-used cache of density grids and their optimized
+    Fisher k, bounded by an estimate of the memory they hold.
+    Keyed on a hash of the point data, the counting method
+    and the grid resolution, so that changes of the contour styling
+    re-render without recomputing the density.
+    """
+
+    def __init__(self, max_bytes=CONTOUR_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get_or_compute(self, data, counting_method, resolution, compute):
+        """
+        Return the cached density of data, or compute() it and cache it
+        """
+        key = (data_digest(data), counting_method, resolution)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+
+        density = compute()
+        nbytes = estimate_nbytes(density)
+        if nbytes > self.max_bytes:
+            return density
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (density, nbytes)
+                self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self.nbytes -= evicted_nbytes
+        return density
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
@@ -0,0 +1,31 @@
+"""
+Default values of the options and parameters of the plugin.
+
+They live apart from the modules which use them, so that the plugin
+can read them at QGIS startup without loading scipy or the other
+dependencies of the computations.
+"""
+
+# kernel terms below this fraction of the peak are dropped
+DEFAULT_TOLERANCE = 1e-6
+
+# number of grid nodes across the diameter of the stereonet
+DEFAULT_RESOLUTION = 100
+
+# k optimization modes, from accurate to fast:
+# size of the subsample searched and whether to refine the search
+# with finer candidates around its optimum
+K_OPTIMIZATION_MODES = {
+    "exact": (None, False),
+    "balanced": (4000, True),
+    "fast": (2000, False),
+}
+
+# number of pixels across the stereonet of the rasterized scatter plots
+DEFAULT_RASTER_RESOLUTION = 400
+
+# scatter plots of more points than this are rasterized
+DEFAULT_RASTER_THRESHOLD = 100000
+
+# share of the resampled eigenvectors inside a bootstrap cone by default
+DEFAULT_CONFIDENCE = 0.95
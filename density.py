@@ -0,0 +1,344 @@
+"""
+Fisher-kernel density of axial data on the lower hemisphere.
+
+The kernel exp(k (cos(theta) - 1)) is negligible a few degrees away
+from its center for large k, so only the neighbors within a cutoff
+angle derived from k and an error tolerance are summed, using a
+KD-tree over the unit vectors. Density is in multiples of a
+uniform distribution.
+"""
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+from .orientation import project_equal_area, unproject_equal_area
+from .defaults import (
+    DEFAULT_RASTER_RESOLUTION,
+    DEFAULT_RESOLUTION,
+    DEFAULT_TOLERANCE,
+    K_OPTIMIZATION_MODES,
+)
+from .parallel import process_pool
+
+# candidate k values searched by the automatic optimization
+DEFAULT_K_CANDIDATES = np.geomspace(2.0, 1000.0, 24)
+
+# candidates of the refinement, between the neighbors of the optimum
+# among DEFAULT_K_CANDIDATES
+REFINE_CANDIDATES = 5
+
+# below this number of vectors, the candidates are scored in this process
+# as starting worker processes would take longer
+PARALLEL_THRESHOLD = 10000
+
+# size of the cells the subsamples are stratified over
+STRATUM_SIZE = 0.1
+
+# cell size of the binning relative to the kernel width 1 / sqrt(k)
+BIN_SIZE_FACTOR = 0.1
+
+# bound on the number of kernel terms held in memory at once
+MAX_PAIRS = 4000000
+
+
+def kernel_cutoff(k, tolerance=DEFAULT_TOLERANCE):
+    """
+    Chord distance beyond which exp(k (cos(theta) - 1)) < tolerance.
+    Return None if no neighbor can be dropped.
+    """
+    chord2 = -2.0 * np.log(tolerance) / k
+    if chord2 >= 4.0:
+        return None
+    return np.sqrt(chord2)
+
+
+def kernel_scale(k):
+    """
+    Normalization of the Fisher kernel exp(k (cos(theta) - 1))
+    to multiples of uniform density
+    """
+    return 2.0 * k / (1.0 - np.exp(-2.0 * k))
+
+
+def bin_vectors(vectors, bin_size):
+    """
+    Merge the unit vectors falling in the same cubic cell of size bin_size.
+    Return the normalized centroids of the cells, their counts
+    and the cell of every vector.
+    """
+    cells = np.floor(vectors / bin_size).astype(np.int64)
+    _, inverse, counts = np.unique(
+        cells, axis=0, return_inverse=True, return_counts=True
+    )
+    inverse = inverse.ravel()
+    centroids = np.column_stack(
+        [np.bincount(inverse, weights=vectors[:, i]) for i in range(3)]
+    )
+    centroids /= np.linalg.norm(centroids, axis=1)[:, np.newaxis]
+    return centroids, counts.astype(np.double), inverse
+
+
+class NeighborIndex:
+    """
+    Spherical neighbor index over an (N, 3) array of unit vectors.
+
+    If bin_size is given, vectors closer than about bin_size are merged
+    into weighted centroids first, which bounds the cost of dense
+    datasets by the area they cover rather than by their size.
+    Falls back to chunked brute-force summation if scipy is unavailable.
+    """
+
+    def __init__(self, vectors, bin_size=None):
+        vectors = np.asarray(vectors, dtype=np.double)
+        self.size = len(vectors)
+        if bin_size:
+            self.vectors, self.weights, _ = bin_vectors(vectors, bin_size)
+        else:
+            self.vectors = np.ascontiguousarray(vectors)
+            self.weights = np.ones(len(vectors))
+        self.tree = cKDTree(self.vectors) if cKDTree is not None else None
+
+    def __len__(self):
+        return self.size
+
+    def kernel_sums(self, queries, k, tolerance=DEFAULT_TOLERANCE):
+        """
+        For every query vector, sum the axial kernel
+        exp(k (q.v - 1)) + exp(k (-q.v - 1)) over all indexed vectors v,
+        dropping the terms smaller than tolerance.
+        """
+        queries = np.ascontiguousarray(queries, dtype=np.double)
+        sums = np.zeros(len(queries))
+        cutoff = kernel_cutoff(k, tolerance)
+
+        if self.tree is None or cutoff is None:
+            step = max(1, MAX_PAIRS // len(self.vectors))
+            for start in range(0, len(queries), step):
+                dots = queries[start : start + step] @ self.vectors.T
+                terms = np.exp(k * (dots - 1.0)) + np.exp(k * (-dots - 1.0))
+                sums[start : start + step] = terms @ self.weights
+            return sums
+
+        # the kernel is exp(-k d^2 / 2) in terms of the chord distance d
+        expected_neighbors = max(1.0, len(self.vectors) * cutoff ** 2 / 4.0)
+        step = max(1, int(MAX_PAIRS / expected_neighbors))
+        for sign in (1.0, -1.0):
+            for start in range(0, len(queries), step):
+                chunk = sign * queries[start : start + step]
+                pairs = cKDTree(chunk).sparse_distance_matrix(
+                    self.tree, cutoff, output_type="ndarray"
+                )
+                terms = self.weights[pairs["j"]] * np.exp(-0.5 * k * pairs["v"] ** 2)
+                sums[start : start + len(chunk)] += np.bincount(
+                    pairs["i"], weights=terms, minlength=len(chunk)
+                )
+        return sums
+
+
+def fisher_density(index, nodes, k, tolerance=DEFAULT_TOLERANCE):
+    """
+    Density of the vectors in index at nodes, in multiples of uniform density
+    """
+    sums = index.kernel_sums(nodes, k, tolerance)
+    return kernel_scale(k) / (2.0 * len(index)) * sums
+
+
+def leave_one_out_score(vectors, k, tolerance=DEFAULT_TOLERANCE, queries=None):
+    """
+    Leave-one-out log-likelihood of the density estimate of vectors
+    with concentration k, evaluated at queries (all vectors by default).
+    Each query must be one of the vectors.
+    """
+    if queries is None:
+        queries = vectors
+    bin_size = BIN_SIZE_FACTOR / np.sqrt(k)
+    index = NeighborIndex(vectors, bin_size=bin_size)
+    # the queries of a cell share the kernel sum at its centroid
+    centroids, counts, _ = bin_vectors(queries, bin_size)
+    sums = index.kernel_sums(centroids, k, tolerance)
+
+    # remove the contribution of each point to its own estimate
+    self_term = 1.0
+    cutoff = kernel_cutoff(k, tolerance)
+    if cutoff is None or cutoff >= 2.0:
+        self_term += np.exp(-2.0 * k)
+    sums = np.clip(sums - self_term, np.finfo(np.double).tiny, None)
+
+    density = kernel_scale(k) / (2.0 * (len(index) - 1)) * sums
+    return counts @ np.log(density)
+
+
+# data of the leave-one-out scores in a worker process
+_worker_state = {}
+
+
+def _init_score_worker(vectors, queries):
+    _worker_state["vectors"] = vectors
+    _worker_state["queries"] = queries
+
+
+def _score_in_worker(k, tolerance):
+    return leave_one_out_score(
+        _worker_state["vectors"], k, tolerance, _worker_state["queries"]
+    )
+
+
+def optimize_k(
+    vectors,
+    candidates=DEFAULT_K_CANDIDATES,
+    tolerance=DEFAULT_TOLERANCE,
+    workers=1,
+    queries=None,
+):
+    """
+    Return the k of candidates maximizing the leave-one-out likelihood
+    of vectors, estimated at queries (all vectors by default).
+    The candidates are evaluated in parallel if workers > 1
+    and vectors are large enough.
+    """
+    if workers > 1 and len(candidates) > 1 and len(vectors) >= PARALLEL_THRESHOLD:
+        with process_pool(
+            min(workers, len(candidates)), _init_score_worker, (vectors, queries)
+        ) as pool:
+            scores = list(
+                pool.map(_score_in_worker, candidates, [tolerance] * len(candidates))
+            )
+    else:
+        scores = [
+            leave_one_out_score(vectors, k, tolerance, queries) for k in candidates
+        ]
+    return float(candidates[int(np.argmax(scores))])
+
+
+def stratified_subsample(vectors, size, rng):
+    """
+    Indices of about size vectors, drawn in proportion
+    from coarse cells covering the sphere
+    """
+    step = max(1.0, len(vectors) / size)
+    cells = np.floor(vectors / STRATUM_SIZE).astype(np.int64)
+    cell_ids = np.unique(cells, axis=0, return_inverse=True)[1].ravel()
+    order = np.lexsort((rng.random(len(vectors)), cell_ids))
+    positions = (rng.random() + np.arange(int(len(vectors) / step))) * step
+    return np.sort(order[positions.astype(np.int64)])
+
+
+def auto_k(vectors, mode="balanced", tolerance=DEFAULT_TOLERANCE, workers=1, seed=0):
+    """
+    Optimize k according to one of K_OPTIMIZATION_MODES.
+
+    The exact mode searches the candidates on the full dataset, at a cost
+    growing with its size. The other modes search them on a stratified
+    subsample of bounded size, optionally refine the optimum with a few
+    finer candidates scored on the same subsample, and scale it to the
+    full dataset by the N^(1/3) growth of the optimal concentration.
+    """
+    sample_size, refine = K_OPTIMIZATION_MODES[mode]
+    if sample_size is None:
+        return optimize_k(vectors, tolerance=tolerance, workers=workers)
+
+    sample = vectors
+    if len(vectors) > sample_size:
+        rng = np.random.default_rng(seed)
+        sample = vectors[stratified_subsample(vectors, sample_size, rng)]
+    k = optimize_k(sample, tolerance=tolerance, workers=workers)
+    if refine:
+        step = DEFAULT_K_CANDIDATES[1] / DEFAULT_K_CANDIDATES[0]
+        candidates = k * np.geomspace(1.0 / step, step, REFINE_CANDIDATES)
+        k = optimize_k(sample, candidates, tolerance, workers)
+    return k * (len(vectors) / len(sample)) ** (1.0 / 3.0)
+
+
+class DensityGrid:
+    """
+    Density of a point dataset on a regular grid over the
+    equal-area stereonet. Nodes outside the unit circle are NaN.
+    """
+
+    def __init__(self, x, y, density, k):
+        self.x = x
+        self.y = y
+        self.density = density
+        self.k = k
+
+
+def density_grid(
+    vectors,
+    k=None,
+    resolution=DEFAULT_RESOLUTION,
+    tolerance=DEFAULT_TOLERANCE,
+    k_mode="balanced",
+    workers=1,
+):
+    """
+    Compute the Fisher density of an (N, 3) array of unit vectors
+    on a resolution x resolution grid.
+    k is optimized in k_mode with workers processes if not given,
+    on a subsample of bounded size unless k_mode is exact.
+    """
+    if k is None:
+        k = auto_k(vectors, k_mode, tolerance, workers)
+    index = NeighborIndex(vectors, bin_size=BIN_SIZE_FACTOR / np.sqrt(k))
+
+    axis = np.linspace(-1.0, 1.0, resolution)
+    x, y = np.meshgrid(axis, axis)
+    inside = x ** 2 + y ** 2 <= 1.0
+    density = np.full(x.shape, np.nan)
+    nodes = unproject_equal_area(x[inside], y[inside])
+    density[inside] = fisher_density(index, nodes, k, tolerance)
+    return DensityGrid(x, y, density, k)
+
+
+class ScatterRaster:
+    """
+    Points binned into the pixels of a square raster over the equal-area
+    stereonet: their count per pixel and, if they have color data,
+    their mean color per pixel (NaN for empty pixels)
+    """
+
+    def __init__(self, counts, mean_color, size):
+        self.counts = counts
+        self.mean_color = mean_color
+        self.size = size
+
+
+def raster_pixels(vectors, resolution):
+    """
+    Flat indices of the pixels of a resolution x resolution raster
+    over the equal-area stereonet which an (N, 3) array of vectors fall in
+    """
+    xy = project_equal_area(vectors)
+    pixels = ((xy + 1.0) * 0.5 * resolution).astype(np.int64)
+    pixels = np.clip(pixels, 0, resolution - 1)
+    return pixels[:, 1] * resolution + pixels[:, 0]
+
+
+def scatter_raster(vectors, color_data=None, resolution=DEFAULT_RASTER_RESOLUTION):
+    """
+    Bin an (N, 3) array of unit vectors and their optional color data
+    into a resolution x resolution ScatterRaster, rows going up in y
+    """
+    flat = raster_pixels(vectors, resolution)
+    counts = np.bincount(flat, minlength=resolution ** 2).astype(np.double)
+
+    mean_color = None
+    if color_data is not None:
+        sums = np.bincount(flat, weights=color_data, minlength=resolution ** 2)
+        mean_color = np.full(resolution ** 2, np.nan)
+        filled = counts > 0
+        mean_color[filled] = sums[filled] / counts[filled]
+        mean_color = mean_color.reshape(resolution, resolution)
+    counts = counts.reshape(resolution, resolution)
+    return ScatterRaster(counts, mean_color, len(vectors))
+
+
+def neighbor_counts(vectors, resolution=50):
+    """
+    Number of vectors sharing the pixel of each vector
+    on a coarse raster over the stereonet
+    """
+    flat = raster_pixels(vectors, resolution)
+    return np.bincount(flat, minlength=resolution ** 2)[flat]
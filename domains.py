@@ -0,0 +1,294 @@
+"""
+Structural domains: orientation statistics of the measurements falling
+in each polygon of a layer, in each cell of a regular grid or sharing
+a value of an attribute.
+
+The measurements are assigned to all the domains in one pass through
+an index of their points, then the orientation tensors of the domains
+are summed by a segmented reduction over the measurements sorted by
+domain, and diagonalized by one stacked eigen decomposition.
+"""
+import numpy as np
+
+from .defaults import DEFAULT_RESOLUTION
+from .density import density_grid
+from .orientation import cartesian_to_lines, unproject_equal_area
+from .parallel import process_pool
+
+# bound on the number of edge/point pairs tested at once
+POINT_IN_POLYGON_BLOCK = 1000000
+
+
+class PointIndex:
+    """
+    Points sorted by x, so that the points in a rectangle are found
+    by a binary search for its x range and a filter on y
+    """
+
+    def __init__(self, points):
+        finite = np.flatnonzero(np.isfinite(points).all(axis=1))
+        self.order = finite[np.argsort(points[finite, 0], kind="stable")]
+        self.x = points[self.order, 0]
+        self.y = points[self.order, 1]
+
+    def query(self, xmin, ymin, xmax, ymax):
+        """
+        Rows of the points inside the rectangle, with their x and y
+        """
+        start = np.searchsorted(self.x, xmin, side="left")
+        end = np.searchsorted(self.x, xmax, side="right")
+        y = self.y[start:end]
+        inside = (y >= ymin) & (y <= ymax)
+        return self.order[start:end][inside], self.x[start:end][inside], y[inside]
+
+
+def points_in_polygon(x, y, rings):
+    """
+    Even-odd test of the points (x, y) against all the rings of a polygon,
+    exterior and holes of all its parts, given as (M, 2) arrays of closed
+    vertices. Blocks of edges are tested against all the points at once.
+    """
+    crossings = np.zeros(len(x), dtype=np.int64)
+    if not len(x):
+        return crossings.astype(bool)
+    edges = np.concatenate([np.column_stack((ring[:-1], ring[1:])) for ring in rings])
+    block = max(1, POINT_IN_POLYGON_BLOCK // len(x))
+    for start in range(0, len(edges), block):
+        x0, y0, x1, y1 = edges[start : start + block, :, None].transpose(1, 0, 2)
+        straddles = (y0 > y) != (y1 > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = x0 + (x1 - x0) * (y - y0) / (y1 - y0)
+        crossings += np.count_nonzero(straddles & (x < x_cross), axis=0)
+    return crossings % 2 == 1
+
+
+def assign_polygons(points, polygons, feedback=None):
+    """
+    Assign an (N, 2) array of points to the polygons containing them.
+    polygons is a list of polygons, each a list of rings as in
+    points_in_polygon. A point in overlapping polygons belongs to all.
+
+    Return (rows, domains): the row of each membership and the index
+    of its polygon, or None if canceled.
+    """
+    index = PointIndex(points)
+    rows = []
+    domains = []
+    for i, rings in enumerate(polygons):
+        if feedback is not None:
+            if feedback.isCanceled():
+                return None
+            feedback.setProgress(100.0 * i / max(len(polygons), 1))
+        if not rings:
+            continue
+        vertices = np.concatenate(rings)
+        xmin, ymin = vertices.min(axis=0)
+        xmax, ymax = vertices.max(axis=0)
+        candidates, x, y = index.query(xmin, ymin, xmax, ymax)
+        inside = candidates[points_in_polygon(x, y, rings)]
+        rows.append(inside)
+        domains.append(np.full(len(inside), i, dtype=np.int64))
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(rows), np.concatenate(domains)
+
+
+def assign_grid(points, cell_size):
+    """
+    Assign an (N, 2) array of points to the cells of a grid of square cells
+    aligned on multiples of cell_size. Only the cells holding points are
+    domains.
+
+    Return (rows, domains, cells) where cells is the (D, 2) array
+    of the lower left corners of the domains.
+    """
+    rows = np.flatnonzero(np.isfinite(points).all(axis=1))
+    cell_indices = np.floor(points[rows] / cell_size).astype(np.int64)
+    cells, domains = np.unique(cell_indices, axis=0, return_inverse=True)
+    return rows, domains.reshape(-1), cells * cell_size
+
+
+def assign_groups(keys):
+    """
+    Assign the rows of an array of attribute values to the groups
+    of equal values, NULL values being NaN or None.
+
+    Return (rows, domains, groups) where groups has the value of each
+    domain in ascending order, then None for the NULL values if any.
+    """
+    keys = np.asarray(keys, dtype=object)
+    null = np.equal(keys, None) | (keys != keys)
+    present = keys[~null]
+    try:
+        groups, domains = np.unique(present, return_inverse=True)
+    except TypeError:
+        # values of mixed types are ordered by their text
+        _, first, domains = np.unique(
+            present.astype(str), return_index=True, return_inverse=True
+        )
+        groups = present[first]
+    groups = list(groups)
+    rows = np.flatnonzero(~null)
+    domains = domains.reshape(-1)
+    if null.any():
+        rows = np.concatenate((rows, np.flatnonzero(null)))
+        domains = np.concatenate(
+            (domains, np.full(np.count_nonzero(null), len(groups)))
+        )
+        groups.append(None)
+    return rows, domains.astype(np.int64), groups
+
+
+class DomainStatistics:
+    """
+    Eigen analysis of the orientation tensors of the domains.
+    counts has the number of measurements of each domain, values its
+    normalized eigenvalues in ascending order, vectors the matching
+    eigenvectors as rows, resultants the sum of its vectors turned
+    towards its largest eigenvector, and segments the rows of its
+    measurements.
+    """
+
+    def __init__(self, counts, values, vectors, resultants, segments):
+        self.counts = counts
+        self.values = values
+        self.vectors = vectors
+        self.resultants = resultants
+        self.segments = segments
+
+    def lines(self, rank):
+        """
+        (D, 2) trend/plunge of the eigenvectors of rank (0 for the smallest
+        eigenvalue) of all domains
+        """
+        return cartesian_to_lines(self.vectors[:, rank])
+
+    def fisher(self):
+        """
+        (D, 2) Fisher concentration kappa and radius in degrees of the 95%
+        confidence cone of the mean of all domains, NaN for the domains
+        of less than three measurements, whose cone is degenerate
+        """
+        n = self.counts.astype(np.double)
+        r = np.linalg.norm(self.resultants, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kappa = (n - 1.0) / (n - r)
+            cosine = 1.0 - (n - r) / r * (20.0 ** (1.0 / (n - 1.0)) - 1.0)
+        alpha95 = np.degrees(np.arccos(np.clip(cosine, -1.0, 1.0)))
+        fisher = np.column_stack((kappa, alpha95))
+        fisher[n < 3] = np.nan
+        return fisher
+
+    def woodcock(self):
+        """
+        (D, 2) Woodcock shape K = ln(e1 / e2) / ln(e2 / e3) and strength
+        C = ln(e1 / e3) of the eigenvalues e1 >= e2 >= e3 of all domains,
+        NaN for the domains of less than three measurements,
+        whose smallest eigenvalues are zero
+        """
+        e3, e2, e1 = np.clip(self.values, np.finfo(np.double).tiny, None).T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            woodcock = np.column_stack(
+                (np.log(e1 / e2) / np.log(e2 / e3), np.log(e1 / e3))
+            )
+        woodcock[self.counts < 3] = np.nan
+        return woodcock
+
+
+def domain_statistics(vectors, rows, domains, count):
+    """
+    Orientation tensors and their eigen analysis for count domains,
+    given the (N, 3) unit vectors and their memberships (rows, domains)
+    as returned by assign_polygons, assign_grid or assign_groups
+    """
+    order = np.argsort(domains, kind="stable")
+    rows, domains = rows[order], domains[order]
+    v = np.asarray(vectors, dtype=np.double)[rows]
+
+    # the six distinct products of the symmetric tensor v v^T
+    i, j = np.triu_indices(3)
+    products = v[:, i] * v[:, j]
+
+    counts = np.zeros(count, dtype=np.int64)
+    sums = np.zeros((count, 6))
+    resultants = np.zeros((count, 3))
+    segments = [np.empty(0, dtype=np.int64)] * count
+    if len(rows):
+        starts = np.flatnonzero(np.r_[True, domains[1:] != domains[:-1]])
+        present = domains[starts]
+        sums[present] = np.add.reduceat(products, starts, axis=0)
+        counts[present] = np.diff(np.r_[starts, len(rows)])
+        for domain, segment in zip(present, np.split(rows, starts[1:])):
+            segments[domain] = segment
+
+    tensors = np.zeros((count, 3, 3))
+    tensors[:, i, j] = sums
+    tensors[:, j, i] = sums
+    tensors /= np.maximum(counts, 1)[:, None, None]
+    values, eigenvectors = np.linalg.eigh(tensors)
+    eigenvectors = eigenvectors.transpose(0, 2, 1)
+
+    if len(rows):
+        # the vectors are axes, so turn them to the side of the principal
+        # axis of their domain before summing them
+        axes = eigenvectors[domains, 2]
+        sides = np.where((v * axes).sum(axis=1) < 0.0, -1.0, 1.0)
+        resultants[present] = np.add.reduceat(v * sides[:, None], starts, axis=0)
+    return DomainStatistics(counts, values, eigenvectors, resultants, segments)
+
+
+def _domain_density(vectors, resolution, k_mode):
+    """
+    Fisher density peak of the vectors of one domain:
+    (k, peak density, peak trend, peak plunge)
+    """
+    grid = density_grid(vectors, resolution=resolution, k_mode=k_mode)
+    peak = np.nanargmax(grid.density)
+    x, y = grid.x.flat[peak], grid.y.flat[peak]
+    trend, plunge = cartesian_to_lines(unproject_equal_area(x, y))[0]
+    return grid.k, grid.density.flat[peak], trend, plunge
+
+
+def domain_densities(
+    vectors,
+    segments,
+    resolution=DEFAULT_RESOLUTION,
+    k_mode="balanced",
+    workers=1,
+    feedback=None,
+):
+    """
+    Fisher density peak of each domain, with the rows of the domains
+    in segments, computed in workers processes.
+    Return a (D, 4) array of k, peak density, peak trend and plunge,
+    NaN for empty domains, or None if canceled.
+    """
+    densities = np.full((len(segments), 4), np.nan)
+    jobs = [domain for domain, segment in enumerate(segments) if len(segment)]
+    if not jobs:
+        return densities
+    if workers <= 1:
+        for done, domain in enumerate(jobs):
+            if feedback is not None and feedback.isCanceled():
+                return None
+            densities[domain] = _domain_density(
+                vectors[segments[domain]], resolution, k_mode
+            )
+            if feedback is not None:
+                feedback.setProgress(100.0 * (done + 1) / len(jobs))
+        return densities
+
+    with process_pool(min(workers, len(jobs))) as pool:
+        futures = [
+            pool.submit(_domain_density, vectors[segments[domain]], resolution, k_mode)
+            for domain in jobs
+        ]
+        for done, (domain, future) in enumerate(zip(jobs, futures)):
+            if feedback is not None and feedback.isCanceled():
+                for pending in futures:
+                    pending.cancel()
+                return None
+            densities[domain] = future.result()
+            if feedback is not None:
+                feedback.setProgress(100.0 * (done + 1) / len(jobs))
+    return densities
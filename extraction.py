@@ -0,0 +1,257 @@
+import numpy as np
+
+from qgis.core import NULL, QgsFeatureRequest, QgsVectorLayerFeatureSource, QgsWkbTypes
+
+# number of features converted to typed arrays at once
+DEFAULT_CHUNK_SIZE = 50000
+
+
+class LayerSnapshot:
+    """
+    Everything needed to read the selected features of a layer,
+    or all of its features if selected_only is false.
+    Must be created in the main thread, but can be read from any thread.
+    generation identifies the state of the selection for caching.
+    """
+
+    def __init__(self, layer, generation=0, selected_only=True):
+        self.layer_id = layer.id()
+        self.generation = generation
+        self.name = layer.name()
+        self.fields = layer.fields()
+        self.fids = layer.selectedFeatureIds() if selected_only else None
+        self.source = QgsVectorLayerFeatureSource(layer)
+
+    def has_field(self, field_name):
+        """
+        Return true if field_name exists in the layer
+        """
+        return self.fields.indexFromName(field_name) != -1
+
+
+def field_indices(fields, field_names):
+    """
+    Resolve the attribute indices of field_names once per layer.
+    Return None if any of the fields does not exist.
+    """
+    indices = [fields.indexFromName(name) for name in field_names]
+    if -1 in indices:
+        return None
+    return indices
+
+
+def null_mask(values):
+    """
+    Vectorized test of an object array for NULL attribute values
+    """
+    return np.equal(values, NULL) | np.equal(values, None)
+
+
+def to_numbers(values, dtype=np.double):
+    """
+    Convert an object array of attribute values to dtype,
+    with the values which cannot be parsed, such as text, as NaN
+    """
+    try:
+        return values.astype(dtype)
+    except (TypeError, ValueError):
+        pass
+    converted = np.empty(values.shape, dtype=dtype)
+    flat = converted.reshape(-1)
+    for i, value in enumerate(values.flat):
+        try:
+            flat[i] = value
+        except (TypeError, ValueError):
+            flat[i] = np.nan
+    return converted
+
+
+class GrowableArray:
+    """
+    Typed buffer of rows which grows geometrically when full,
+    so that streamed values never go through Python lists
+    """
+
+    def __init__(self, capacity, columns=None, dtype=np.double):
+        shape = (max(capacity, 1),) if columns is None else (max(capacity, 1), columns)
+        self.buffer = np.empty(shape, dtype=dtype)
+        self.size = 0
+
+    def extend(self, rows):
+        end = self.size + len(rows)
+        if end > len(self.buffer):
+            grown = np.empty(
+                (max(end, int(1.5 * len(self.buffer))),) + self.buffer.shape[1:],
+                dtype=self.buffer.dtype,
+            )
+            grown[: self.size] = self.buffer[: self.size]
+            self.buffer = grown
+        self.buffer[self.size : end] = rows
+        self.size = end
+
+    def array(self):
+        """
+        Return the filled rows, without keeping unused capacity alive
+        """
+        if self.size == len(self.buffer):
+            return self.buffer
+        return self.buffer[: self.size].copy()
+
+
+def attribute_request(attribute_indices, fids=None):
+    """
+    Build a feature request which only fetches the listed attributes
+    and no geometry, restricted to the features in fids if given
+    """
+    request = QgsFeatureRequest()
+    request.setFlags(QgsFeatureRequest.NoGeometry)
+    request.setSubsetOfAttributes(attribute_indices)
+    if fids is not None:
+        request.setFilterFids(list(fids))
+    return request
+
+
+def extract_attributes(
+    source,
+    fields,
+    field_names,
+    fids=None,
+    feedback=None,
+    dtype=np.double,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    expected=0,
+):
+    """
+    Stream the attributes field_names of the features of source,
+    or of the features in fids only, into (N, len(field_names)) arrays
+    of dtype, chunk_size features at a time. Only one chunk of attribute
+    objects is alive at once, so peak memory stays close to the size
+    of the result. expected is a hint of the number of features.
+
+    Return (fids, values, null) where fids are the ids of the rows,
+    NULL entries in values are NaN and null is the boolean mask of these entries,
+    or None if the layer lacks any of the fields
+    or the extraction is canceled through feedback.
+    Values which cannot be converted to dtype are NaN without being NULL,
+    so that validate_measurements rejects them as not a number.
+    """
+    indices = field_indices(fields, field_names)
+    if indices is None:
+        return None
+
+    if fids is not None:
+        expected = len(fids)
+    row_fids = GrowableArray(expected, dtype=np.int64)
+    values = GrowableArray(expected, len(indices), dtype)
+    null = GrowableArray(expected, len(indices), bool)
+
+    chunk_fids = np.empty(chunk_size, dtype=np.int64)
+    chunk = np.empty((chunk_size, len(indices)), dtype=object)
+
+    def flush(count):
+        chunk_null = null_mask(chunk[:count])
+        chunk[:count][chunk_null] = np.nan
+        row_fids.extend(chunk_fids[:count])
+        values.extend(to_numbers(chunk[:count], dtype))
+        null.extend(chunk_null)
+
+    count = 0
+    for feature in source.getFeatures(attribute_request(indices, fids)):
+        attributes = feature.attributes()
+        chunk_fids[count] = feature.id()
+        chunk[count] = [attributes[i] for i in indices]
+        count += 1
+        if count == chunk_size:
+            flush(count)
+            count = 0
+            if feedback is not None and feedback.isCanceled():
+                return None
+    flush(count)
+
+    return row_fids.array(), values.array(), null.array()
+
+
+def feature_point(geometry):
+    """
+    (x, y) of a point geometry, or of the centroid of other geometries,
+    NaN if the geometry is empty
+    """
+    if geometry.isEmpty():
+        return np.nan, np.nan
+    if geometry.type() != QgsWkbTypes.PointGeometry or geometry.isMultipart():
+        geometry = geometry.centroid()
+    point = geometry.asPoint()
+    return point.x(), point.y()
+
+
+def extract_points(
+    source,
+    fields,
+    field_names,
+    feedback=None,
+    dtype=np.double,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    expected=0,
+):
+    """
+    Same as extract_attributes for all the features of source,
+    also reading their geometry as points with feature_point.
+
+    Return (fids, values, null, points) where points is an (N, 2) array
+    of x/y in the CRS of source, or None.
+    """
+    indices = field_indices(fields, field_names)
+    if indices is None:
+        return None
+
+    row_fids = GrowableArray(expected, dtype=np.int64)
+    values = GrowableArray(expected, len(indices), dtype)
+    null = GrowableArray(expected, len(indices), bool)
+    points = GrowableArray(expected, 2)
+
+    chunk_fids = np.empty(chunk_size, dtype=np.int64)
+    chunk = np.empty((chunk_size, len(indices)), dtype=object)
+    chunk_points = np.empty((chunk_size, 2))
+
+    def flush(count):
+        chunk_null = null_mask(chunk[:count])
+        chunk[:count][chunk_null] = np.nan
+        row_fids.extend(chunk_fids[:count])
+        values.extend(to_numbers(chunk[:count], dtype))
+        null.extend(chunk_null)
+        points.extend(chunk_points[:count])
+
+    request = QgsFeatureRequest()
+    request.setSubsetOfAttributes(indices)
+    count = 0
+    for feature in source.getFeatures(request):
+        attributes = feature.attributes()
+        chunk_fids[count] = feature.id()
+        chunk[count] = [attributes[i] for i in indices]
+        chunk_points[count] = feature_point(feature.geometry())
+        count += 1
+        if count == chunk_size:
+            flush(count)
+            count = 0
+            if feedback is not None and feedback.isCanceled():
+                return None
+    flush(count)
+
+    return row_fids.array(), values.array(), null.array(), points.array()
+
+
+def extract_selected(
+    snapshot, field_names, feedback=None, dtype=np.double, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """
+    extract_attributes for the features of a LayerSnapshot
+    """
+    return extract_attributes(
+        snapshot.source,
+        snapshot.fields,
+        field_names,
+        snapshot.fids,
+        feedback,
+        dtype,
+        chunk_size,
+    )
@@ -0,0 +1,221 @@
+"""
+Dockable stereonet following the selection of the layers
+selected in the layer tree.
+
+The stereonet is drawn by stgeotk as for the toolbar actions. Once
+generate_plots() has drawn its figure, the figure is taken out of
+pyplot and shown on a canvas in the dock instead of its own window.
+"""
+import functools
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+
+from qgis.core import QgsProject, QgsVectorLayer
+from qgis.gui import QgsDockWidget
+from qgis.PyQt.QtWidgets import QComboBox, QLabel, QVBoxLayout, QWidget
+from qgis.PyQt.QtCore import QTimer
+
+from .analysis import (
+    compute_lines,
+    compute_planes,
+    compute_poles,
+    line_fields,
+    planar_fields,
+)
+from .extraction import LayerSnapshot
+from .rendering import line_stereonet, plane_stereonet, pole_stereonet
+from .stereoplot import info
+
+# selection changes closer together than this are coalesced into one plot
+DEBOUNCE_MS = 300
+
+# plots shown by the dock: (name, compute, stereonet, fields of the plot)
+LIVE_PLOTS = (
+    ("Lines", compute_lines, line_stereonet, line_fields),
+    ("Planes", compute_planes, plane_stereonet, planar_fields),
+    ("Poles to planes", compute_poles, pole_stereonet, planar_fields),
+)
+
+
+class LiveStereonetDock(QgsDockWidget):
+    """
+    Stereonet of the selected features of the layers selected in the
+    layer tree, recomputed in the background when their selection changes
+    """
+
+    def __init__(self, plugin, parent=None):
+        super(LiveStereonetDock, self).__init__("Live stereonet", parent)
+        self.setObjectName("LiveStereonetDock")
+        self.plugin = plugin
+        self.tree_view = plugin.iface.layerTreeView()
+        self.layers = {}
+        self.slots = {}
+        # ids of the layers whose selection changed since the last plot
+        self.dirty = set()
+        self.running = False
+        self.canvas = None
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(DEBOUNCE_MS)
+        self.timer.timeout.connect(self.refresh)
+
+        widget = QWidget()
+        self.box = QVBoxLayout(widget)
+        self.plot_combobox = QComboBox()
+        for name, _, _, _ in LIVE_PLOTS:
+            self.plot_combobox.addItem(name)
+        self.plot_combobox.currentIndexChanged.connect(self.replot)
+        self.status_label = QLabel()
+        self.box.addWidget(self.plot_combobox)
+        self.box.addWidget(self.status_label)
+        self.setWidget(widget)
+
+        self.tree_view.selectionModel().selectionChanged.connect(self.follow_layers)
+        QgsProject.instance().layersWillBeRemoved.connect(self.layers_removed)
+        self.visibilityChanged.connect(self.replot)
+        self.follow_layers()
+
+    def follow_layers(self, *args):
+        """
+        Listen to the selection of the vector layers selected in the layer tree
+        """
+        layers = {
+            layer.id(): layer
+            for layer in self.tree_view.selectedLayersRecursive()
+            if isinstance(layer, QgsVectorLayer)
+        }
+        for layer_id in set(self.layers) - set(layers):
+            self.disconnect_layer(layer_id)
+        for layer_id in set(layers) - set(self.layers):
+            slot = lambda *args, layer_id=layer_id: self.selection_changed(layer_id)
+            layers[layer_id].selectionChanged.connect(slot)
+            self.slots[layer_id] = slot
+        self.layers = layers
+        self.replot()
+
+    def layers_removed(self, layer_ids):
+        """
+        Stop following the layers about to be removed from the project,
+        before the layer tree selection is updated
+        """
+        for layer_id in layer_ids:
+            if layer_id in self.layers:
+                self.disconnect_layer(layer_id)
+                del self.layers[layer_id]
+            self.dirty.discard(layer_id)
+
+    def disconnect_layer(self, layer_id):
+        try:
+            self.layers[layer_id].selectionChanged.disconnect(self.slots.pop(layer_id))
+        except (RuntimeError, TypeError):
+            pass
+
+    def selection_changed(self, layer_id):
+        self.dirty.add(layer_id)
+        self.timer.start()
+
+    def replot(self, *args):
+        """
+        Plot all the followed layers again, e.g. when the plot type changes
+        """
+        self.dirty.update(self.layers)
+        self.timer.start()
+
+    def refresh(self):
+        """
+        Recompute the plot if the selection changed in any layer it shows.
+        Unchanged layers are read from the caches of the plugin.
+        """
+        if not self.isVisible():
+            return
+        if self.running:
+            # the plot is refreshed again once the running task is done
+            return
+
+        name, compute, build, fields = LIVE_PLOTS[self.plot_combobox.currentIndex()]
+        field_names = fields(self.plugin.options)
+        affected = [
+            layer_id
+            for layer_id in self.dirty
+            if layer_id in self.layers
+            and all(
+                self.layers[layer_id].fields().indexFromName(field) != -1
+                for field in field_names
+            )
+        ]
+        self.dirty.clear()
+        if not affected:
+            return
+
+        snapshots = [
+            LayerSnapshot(layer, self.plugin.orientation_cache.watch(layer))
+            for layer in self.layers.values()
+        ]
+        self.running = True
+        self.status_label.setText("Updating…")
+        task = self.plugin.run_in_background(
+            "Live " + name.lower(),
+            compute,
+            snapshots,
+            functools.partial(self.show_result, build, dict(self.plugin.options)),
+            profile=False,
+        )
+        task.taskCompleted.connect(self.task_done)
+        task.taskTerminated.connect(self.task_done)
+
+    def task_done(self):
+        self.running = False
+        if self.dirty:
+            self.timer.start()
+
+    def show_result(self, build, options, result):
+        """
+        Show a result with the stereonet builder of the plot type and
+        the options it was computed with, which may have been changed since
+        """
+        if result["dataset"] is None:
+            self.status_label.setText("No features selected.")
+            self.show_figure(None)
+            return
+
+        stereonet = build(result, options, info)
+        stereonet.generate_plots()
+        figure = stereonet.ax.figure
+        plt.close(figure)
+        count = result["timer"].count("extraction")
+        self.status_label.setText(f"{count} selected features")
+        self.show_figure(figure)
+
+    def show_figure(self, figure):
+        """
+        Replace the canvas of the dock by one showing figure
+        """
+        if self.canvas is not None:
+            self.box.removeWidget(self.canvas)
+            self.canvas.deleteLater()
+            self.canvas = None
+        if figure is not None:
+            self.canvas = FigureCanvasQTAgg(figure)
+            self.box.addWidget(self.canvas, 1)
+            self.canvas.draw_idle()
+
+    def stop(self):
+        """
+        Stop following the layer tree and the layers
+        """
+        self.timer.stop()
+        try:
+            self.tree_view.selectionModel().selectionChanged.disconnect(
+                self.follow_layers
+            )
+        except (RuntimeError, TypeError):
+            pass
+        try:
+            QgsProject.instance().layersWillBeRemoved.disconnect(self.layers_removed)
+        except (RuntimeError, TypeError):
+            pass
+        for layer_id in list(self.slots):
+            self.disconnect_layer(layer_id)
+        self.layers = {}
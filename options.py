@@ -0,0 +1,100 @@
+from qgis.core import QgsVectorLayer
+
+from .defaults import (
+    DEFAULT_CONFIDENCE,
+    DEFAULT_RASTER_RESOLUTION,
+    DEFAULT_RASTER_THRESHOLD,
+    DEFAULT_RESOLUTION,
+    DEFAULT_TOLERANCE,
+)
+from .extraction import DEFAULT_CHUNK_SIZE
+from .parallel import default_workers
+from .schema import FIELD_ALIASES, LayerSchema, alias_lookup
+
+# plane plots of more planes than this draw their great circles in one batch
+DEFAULT_PLANE_BATCH_THRESHOLD = 2000
+
+
+def default_options():
+    """
+    Plotting options used until they are changed in the settings dialog
+    """
+    options = {}
+
+    # general group settings
+    options["use_dip_dir"] = True
+    options["strike_field"] = "Strike"
+    options["dip_angle_field"] = "dip_angle"
+    options["dip_dir_field"] = "dip_dir"
+    options["trend_field"] = "trend"
+    options["plunge_field"] = "plunge"
+    options["plot_contours"] = False
+    options["plot_mean_plane"] = True
+    options["plot_intersection_point"] = True
+    options["float32_storage"] = False
+    options["plane_batch_threshold"] = DEFAULT_PLANE_BATCH_THRESHOLD
+    options["plane_shading"] = "alpha"
+    options["extraction_chunk_size"] = DEFAULT_CHUNK_SIZE
+    options["profile_next_plot"] = False
+
+    # statistics group settings
+    # no confidence cone unless requested, as it resamples the data many times
+    options["bootstrap_replicates"] = 0
+    options["bootstrap_confidence"] = DEFAULT_CONFIDENCE
+    options["bootstrap_workers"] = default_workers()
+    options["group_by_field"] = ""
+
+    # marker group settings
+    options["marker"] = "+"
+    options["marker_cmap"] = "RdYlGn"
+    options["marker_cmap_limits"] = None
+    options["marker_color"] = "#000000"
+    options["marker_size"] = 6
+    options["marker_cmap_center"] = None
+    options["marker_color_field"] = ""
+    options["marker_raster_threshold"] = DEFAULT_RASTER_THRESHOLD
+    options["marker_raster_resolution"] = DEFAULT_RASTER_RESOLUTION
+
+    # contour group settings
+    options["contour_limits"] = None
+    options["contour_cmap"] = "Oranges"
+    options["contour_resolution"] = DEFAULT_RESOLUTION
+    options["contour_tolerance"] = DEFAULT_TOLERANCE
+    options["contour_k_mode"] = "balanced"
+    options["contour_workers"] = default_workers()
+    return options
+
+
+def sniff_planar_format(options, layer, schema_cache=None):
+    """
+    Try to determine if the planar data of layer is in strike-dip format
+    or dip-dir/dip-angle format from its field names, and set the options
+    accordingly, along with the line fields if the layer has them.
+    The fields are resolved through schema_cache if given.
+    """
+    schema = None
+    if isinstance(layer, QgsVectorLayer):
+        if schema_cache is None:
+            schema = LayerSchema.resolve(
+                layer.fields().names(), alias_lookup(FIELD_ALIASES)
+            )
+        else:
+            schema = schema_cache.schema(layer)
+
+    planar_format = None if schema is None else schema.planar_format()
+    if planar_format == "strike":
+        options["use_dip_dir"] = False
+        options["strike_field"] = schema.field("strike")
+        options["dip_angle_field"] = schema.field("dip")
+    elif planar_format == "dip_dir":
+        options["use_dip_dir"] = True
+        options["dip_angle_field"] = schema.field("dip")
+        options["dip_dir_field"] = schema.field("dip_dir")
+    else:
+        options["use_dip_dir"] = True
+        options["dip_angle_field"] = "dip_angle"
+        options["dip_dir_field"] = "dip_dir"
+
+    if schema is not None and schema.has_lines():
+        options["trend_field"] = schema.field("trend")
+        options["plunge_field"] = schema.field("plunge")
@@ -0,0 +1,355 @@
+"""
+Vectorized conversions between orientation representations.
+
+Angles are in degrees. Planes follow the right-hand rule and
+lines point into the lower hemisphere. Cartesian vectors are
+expressed in an east-north-up frame.
+"""
+import numpy as np
+
+
+def strike_from_direction(direc, use_dip_dir):
+    """
+    Convert a whole array of dip directions (or strikes) to strikes
+    """
+    return np.mod(np.asarray(direc, dtype=np.double) - 90.0 * use_dip_dir, 360.0)
+
+
+def lines_to_cartesian(trend, plunge):
+    """
+    Convert arrays of trend/plunge to an (N, 3) array of unit vectors
+    """
+    trd = np.radians(trend)
+    plg = np.radians(plunge)
+    cos_plg = np.cos(plg)
+    return np.column_stack((cos_plg * np.sin(trd), cos_plg * np.cos(trd), -np.sin(plg)))
+
+
+def cartesian_to_lines(vectors):
+    """
+    Convert an (N, 3) array of vectors to an (N, 2) array of trend/plunge.
+    Vectors pointing upwards are flipped to the lower hemisphere.
+    """
+    vectors = np.atleast_2d(vectors)
+    vectors = np.where(vectors[:, 2:3] > 0.0, -vectors, vectors)
+    norm = np.linalg.norm(vectors, axis=1)
+    trend = np.mod(np.degrees(np.arctan2(vectors[:, 0], vectors[:, 1])), 360.0)
+    plunge = np.degrees(np.arcsin(np.clip(-vectors[:, 2] / norm, -1.0, 1.0)))
+    return np.column_stack((trend, plunge))
+
+
+def poles_from_planes(strike, dip, cartesian=False):
+    """
+    Compute the poles of whole arrays of strike/dip in one pass.
+    Return an (N, 2) array of trend/plunge,
+    or an (N, 3) array of unit vectors if cartesian is True.
+    """
+    trend = np.mod(np.asarray(strike, dtype=np.double) - 90.0, 360.0)
+    plunge = 90.0 - np.asarray(dip, dtype=np.double)
+    if cartesian:
+        return lines_to_cartesian(trend, plunge)
+    return np.column_stack((trend, plunge))
+
+
+def planes_from_poles(trend, plunge):
+    """
+    Inverse of poles_from_planes: return an (N, 2) array of strike/dip
+    """
+    strike = np.mod(np.asarray(trend, dtype=np.double) + 90.0, 360.0)
+    dip = 90.0 - np.asarray(plunge, dtype=np.double)
+    return np.column_stack((strike, dip))
+
+
+def measurement_vectors(values, planar=False, use_dip_dir=False):
+    """
+    Unit vectors of an (N, 2) array of trend/plunge, or of the poles
+    of an (N, 2) array of planes if planar, given as dip direction/dip
+    if use_dip_dir and as strike/dip otherwise
+    """
+    if planar:
+        strike = strike_from_direction(values[:, 0], use_dip_dir)
+        return poles_from_planes(strike, values[:, 1], cartesian=True)
+    return lines_to_cartesian(values[:, 0], values[:, 1])
+
+
+def validate_measurements(values, planar=False):
+    """
+    Check and normalize an (N, 2) array of trend/plunge, or of planes
+    if planar, in one pass. Rows which are not finite or whose plunge
+    or dip is out of range are rejected. Azimuths are wrapped to 0-360
+    and lines plunging upwards are flipped to the lower hemisphere.
+
+    Return (values, valid, rejected) where values holds the valid rows
+    normalized, valid is the mask of these rows, and rejected maps the
+    reasons for rejection to the number of rows.
+    """
+    finite = np.isfinite(values).all(axis=1)
+    angle = values[:, 1]
+    with np.errstate(invalid="ignore"):
+        if planar:
+            in_range = (angle >= 0.0) & (angle <= 90.0)
+        else:
+            in_range = np.abs(angle) <= 90.0
+    valid = finite & in_range
+    rejected = {
+        "not a number": int(np.count_nonzero(~finite)),
+        ("dip" if planar else "plunge") + " out of range": int(
+            np.count_nonzero(finite & ~in_range)
+        ),
+    }
+
+    values = values[valid]
+    if not planar:
+        upward = values[:, 1] < 0.0
+        values[upward, 0] += 180.0
+        values[upward, 1] *= -1.0
+    values[:, 0] = np.mod(values[:, 0], 360.0)
+    return values, valid, rejected
+
+
+def filter_measurements(values, null, planar=False, color=False):
+    """
+    Rows of extracted orientation data which can be plotted: an (N, 2)
+    array of values with its null mask, or (N, 3) with a color column
+    if color. Rows with a NULL orientation or color are dropped and the
+    others go through validate_measurements.
+
+    Return (measurements, rows, rejected) where measurements are the
+    normalized orientations of the kept rows, rows their indices and
+    rejected maps the reasons for rejection to the number of rows.
+    """
+    present = ~null[:, 0] & ~null[:, 1]
+    rejected = {"NULL orientation": int(np.count_nonzero(~present))}
+    if color:
+        color_present = ~null[:, 2] & ~np.isnan(values[:, 2])
+        rejected["NULL color"] = int(np.count_nonzero(present & ~color_present))
+        present &= color_present
+    measurements, valid, invalid = validate_measurements(values[present, :2], planar)
+    rejected.update(invalid)
+    return measurements, np.flatnonzero(present)[valid], rejected
+
+
+def project_equal_area(vectors):
+    """
+    Lower-hemisphere equal-area projection of an (N, 3) array of vectors
+    onto the unit circle. Return an (N, 2) array of x/y coordinates.
+    """
+    vectors = np.atleast_2d(vectors)
+    vectors = np.where(vectors[:, 2:3] > 0.0, -vectors, vectors)
+    scale = 1.0 / np.sqrt(1.0 - vectors[:, 2])
+    return vectors[:, :2] * scale[:, np.newaxis]
+
+
+def great_circle_arcs(strike, dip, vertices=61, chunk_size=10000):
+    """
+    Lower-hemisphere equal-area projection of the great circles of arrays
+    of strike/dip, computed chunk_size circles at a time.
+    Return an (N, vertices, 2) array of x/y coordinates running along
+    each circle from its strike direction to the opposite one.
+    """
+    strike = np.asarray(strike)
+    dip = np.asarray(dip)
+    angles = np.linspace(0.0, np.pi, vertices)[np.newaxis, :, np.newaxis]
+    arcs = np.empty((len(strike), vertices, 2))
+    for start in range(0, len(strike), chunk_size):
+        end = start + chunk_size
+        stk = np.radians(strike[start:end])
+        strike_vectors = np.column_stack((np.sin(stk), np.cos(stk), np.zeros(len(stk))))
+        dip_vectors = lines_to_cartesian(
+            np.mod(strike[start:end] + 90.0, 360.0), dip[start:end]
+        )
+        points = (
+            np.cos(angles) * strike_vectors[:, np.newaxis, :]
+            + np.sin(angles) * dip_vectors[:, np.newaxis, :]
+        )
+        scale = 1.0 / np.sqrt(1.0 - np.minimum(points[:, :, 2], 0.0))
+        arcs[start:end] = points[:, :, :2] * scale[:, :, np.newaxis]
+    return arcs
+
+
+def unproject_equal_area(x, y):
+    """
+    Inverse of project_equal_area for points inside the unit circle.
+    Return an array of unit vectors of shape x.shape + (3,).
+    """
+    rho2 = np.asarray(x) ** 2 + np.asarray(y) ** 2
+    scale = np.sqrt(np.clip(2.0 - rho2, 0.0, None))
+    return np.stack((x * scale, y * scale, rho2 - 1.0), axis=-1)
+
+
+class OrientationTensor:
+    """
+    Orientation tensor sum(v v^T) of unit vectors, which can be added
+    and removed, and of trend/plunge arrays converted chunk by chunk
+    so that their unit vectors are never all needed at once
+    """
+
+    # number of rows of add_lines converted to unit vectors at once
+    chunk_size = 100000
+
+    def __init__(self):
+        self.tensor = np.zeros((3, 3))
+        self.count = 0
+
+    def add_vectors(self, vectors):
+        vectors = np.asarray(vectors, dtype=np.double)
+        self.tensor += vectors.T @ vectors
+        self.count += len(vectors)
+
+    def remove_vectors(self, vectors):
+        """
+        Take back vectors added before, e.g. when features are deselected
+        """
+        vectors = np.asarray(vectors, dtype=np.double)
+        self.tensor -= vectors.T @ vectors
+        self.count -= len(vectors)
+
+    def add_lines(self, trend, plunge):
+        """
+        Accumulate arrays of trend/plunge in chunks
+        """
+        for start in range(0, len(trend), self.chunk_size):
+            end = start + self.chunk_size
+            self.add_vectors(lines_to_cartesian(trend[start:end], plunge[start:end]))
+
+    def add_tensor(self, other):
+        self.tensor += other.tensor
+        self.count += other.count
+
+    def copy(self):
+        tensor = OrientationTensor()
+        tensor.add_tensor(self)
+        return tensor
+
+    def eigen(self):
+        """
+        Return (eigenvectors, eigenvalues) of the normalized tensor,
+        sorted by ascending eigenvalue, with the eigenvectors as rows
+        """
+        values, vectors = np.linalg.eigh(self.tensor / max(self.count, 1))
+        return vectors.T, values
+
+
+class OrientationArray:
+    """
+    Orientation measurements stored once as an (N, 3) array of unit
+    vectors: the lines themselves, or the poles of planes.
+    The trend/plunge, strike/dip and dip direction/dip views are computed
+    on first use and cached. Every row also carries its feature id,
+    the index of its source layer in layer_ids and the attribute columns.
+    """
+
+    __slots__ = (
+        "vectors",
+        "columns",
+        "layer_ids",
+        "layer_index",
+        "fids",
+        "_lines",
+        "_planes",
+        "_dip_directions",
+    )
+
+    def __init__(
+        self, vectors, columns=None, layer_ids=(), layer_index=None, fids=None
+    ):
+        self.vectors = vectors
+        self.columns = {} if columns is None else columns
+        self.layer_ids = tuple(layer_ids)
+        if layer_index is None:
+            layer_index = np.zeros(len(vectors), dtype=np.int32)
+        self.layer_index = layer_index
+        if fids is None:
+            fids = np.full(len(vectors), -1, dtype=np.int64)
+        self.fids = fids
+        self._lines = None
+        self._planes = None
+        self._dip_directions = None
+
+    @classmethod
+    def from_lines(cls, values, **kwargs):
+        """
+        Orientations of an (N, 2) array of trend/plunge
+        """
+        vectors = measurement_vectors(values).astype(values.dtype)
+        array = cls(vectors, **kwargs)
+        # keep the measured values when they are the canonical view already
+        if np.all((values[:, 1] >= 0.0) & (values[:, 1] <= 90.0)):
+            array._lines = np.column_stack((np.mod(values[:, 0], 360.0), values[:, 1]))
+        return array
+
+    @classmethod
+    def from_planes(cls, values, use_dip_dir=False, **kwargs):
+        """
+        Orientations of the poles of an (N, 2) array of dip direction/dip
+        if use_dip_dir, of strike/dip otherwise
+        """
+        vectors = measurement_vectors(values, True, use_dip_dir).astype(values.dtype)
+        array = cls(vectors, **kwargs)
+        # horizontal planes have no strike to recover from their pole
+        if np.all((values[:, 1] >= 0.0) & (values[:, 1] <= 90.0)):
+            strike = strike_from_direction(values[:, 0], use_dip_dir)
+            array._planes = np.column_stack((strike, values[:, 1]))
+        return array
+
+    @classmethod
+    def concatenate(cls, arrays):
+        """
+        Rows of all arrays, with the attribute columns they all have
+        """
+        layer_ids = []
+        layer_index = []
+        for array in arrays:
+            offset = len(layer_ids)
+            layer_ids.extend(array.layer_ids)
+            layer_index.append(array.layer_index + offset)
+        names = set.intersection(*(set(array.columns) for array in arrays))
+        return cls(
+            np.concatenate([array.vectors for array in arrays]),
+            {
+                name: np.concatenate([array.columns[name] for array in arrays])
+                for name in names
+            },
+            layer_ids,
+            np.concatenate(layer_index),
+            np.concatenate([array.fids for array in arrays]),
+        )
+
+    def __len__(self):
+        return len(self.vectors)
+
+    @property
+    def lines(self):
+        """
+        (N, 2) array of trend/plunge
+        """
+        if self._lines is None:
+            self._lines = cartesian_to_lines(self.vectors)
+        return self._lines
+
+    @property
+    def planes(self):
+        """
+        (N, 2) array of strike/dip of the planes normal to the vectors
+        """
+        if self._planes is None:
+            self._planes = planes_from_poles(self.lines[:, 0], self.lines[:, 1])
+        return self._planes
+
+    @property
+    def dip_directions(self):
+        """
+        (N, 2) array of dip direction/dip of the planes normal to the vectors
+        """
+        if self._dip_directions is None:
+            planes = self.planes
+            self._dip_directions = np.column_stack(
+                (np.mod(planes[:, 0] + 90.0, 360.0), planes[:, 1])
+            )
+        return self._dip_directions
+
+    def column(self, name):
+        """
+        Attribute column called name, None if it was not read
+        """
+        return self.columns.get(name)
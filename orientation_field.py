@@ -0,0 +1,179 @@
+"""
+Orientation field: the average plane of the measurements within a
+search radius of every node of a raster grid, as in the poles to plane
+plot, with the strength of their fabric.
+
+The grid is processed in square tiles to bound memory. The neighbors
+of all the nodes of a tile are found at once with a KD-tree over the
+points of the measurements, their orientation tensors are summed per
+node with bincount and diagonalized by one stacked eigen decomposition.
+"""
+import math
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+from .density import MAX_PAIRS
+from .orientation import cartesian_to_lines, planes_from_poles
+
+# nodes along each side of the tiles of the grid
+DEFAULT_TILE_SIZE = 256
+
+# value of the nodes with too few measurements in their neighborhood
+NODATA = -9999.0
+
+# bands of the orientation field
+FIELD_BANDS = ("dip_direction", "dip", "strength", "count")
+
+
+def grid_shape(extent, pixel_size):
+    """
+    (width, height) in pixels of a grid covering extent (xmin, ymin, xmax, ymax)
+    """
+    xmin, ymin, xmax, ymax = extent
+    width = max(1, math.ceil((xmax - xmin) / pixel_size))
+    height = max(1, math.ceil((ymax - ymin) / pixel_size))
+    return width, height
+
+
+def tile_windows(width, height, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Yield the (column, row, columns, rows) windows of the tiles of a grid
+    """
+    for row in range(0, height, tile_size):
+        for column in range(0, width, tile_size):
+            columns = min(tile_size, width - column)
+            yield column, row, columns, min(tile_size, height - row)
+
+
+def neighbor_pairs(tree, points, nodes, radius):
+    """
+    (node, point) index pairs of the points within radius of the nodes
+    """
+    if tree is not None:
+        pairs = cKDTree(nodes).sparse_distance_matrix(
+            tree, radius, output_type="ndarray"
+        )
+        return pairs["i"], pairs["j"]
+
+    step = max(1, MAX_PAIRS // max(len(points), 1))
+    node_indices, point_indices = [], []
+    for start in range(0, len(nodes), step):
+        chunk = nodes[start : start + step]
+        distances = np.hypot(
+            chunk[:, None, 0] - points[None, :, 0],
+            chunk[:, None, 1] - points[None, :, 1],
+        )
+        i, j = np.nonzero(distances <= radius)
+        node_indices.append(i + start)
+        point_indices.append(j)
+    return np.concatenate(node_indices), np.concatenate(point_indices)
+
+
+def neighborhood_tensors(tree, points, vectors, nodes, radius):
+    """
+    Sums of v v^T over the vectors within radius of each node,
+    as (M, 6) upper triangle components, and the number of vectors
+    """
+    sums = np.zeros((len(nodes), 6))
+    counts = np.zeros(len(nodes), dtype=np.int64)
+    i, j = np.triu_indices(3)
+
+    # bound the number of pairs found at once
+    area = max(np.ptp(points[:, 0]) * np.ptp(points[:, 1]), radius ** 2)
+    expected_neighbors = max(1.0, len(points) * math.pi * radius ** 2 / area)
+    step = max(1, int(MAX_PAIRS / expected_neighbors))
+    for start in range(0, len(nodes), step):
+        chunk = nodes[start : start + step]
+        node_indices, point_indices = neighbor_pairs(tree, points, chunk, radius)
+        neighbors = vectors[point_indices]
+        counts[start : start + len(chunk)] = np.bincount(
+            node_indices, minlength=len(chunk)
+        )
+        for component, (a, b) in enumerate(zip(i, j)):
+            sums[start : start + len(chunk), component] = np.bincount(
+                node_indices,
+                weights=neighbors[:, a] * neighbors[:, b],
+                minlength=len(chunk),
+            )
+    return sums, counts
+
+
+def mean_planes(sums, counts, min_count=3):
+    """
+    Average plane and fabric strength of the poles summed in each tensor:
+    (M, 3) array of dip direction, dip and Woodcock's strength ln(e1 / e3),
+    NaN for the tensors of less than min_count poles. The strength is NaN
+    as well where e3 is zero, as for coplanar or collinear poles.
+    """
+    i, j = np.triu_indices(3)
+    tensors = np.zeros((len(sums), 3, 3))
+    tensors[:, i, j] = sums
+    tensors[:, j, i] = sums
+    tensors /= np.maximum(counts, 1)[:, None, None]
+    values, vectors = np.linalg.eigh(tensors)
+
+    # the average pole is the eigenvector of the largest eigenvalue
+    strike, dip = planes_from_poles(*cartesian_to_lines(vectors[:, :, 2]).T).T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        strength = np.log(values[:, 2] / values[:, 0])
+    strength[~np.isfinite(strength)] = np.nan
+    field = np.column_stack((np.mod(strike + 90.0, 360.0), dip, strength))
+    field[counts < min_count] = np.nan
+    return field
+
+
+def orientation_field(
+    points,
+    vectors,
+    extent,
+    pixel_size,
+    radius,
+    write,
+    min_count=3,
+    tile_size=DEFAULT_TILE_SIZE,
+    feedback=None,
+):
+    """
+    Compute the orientation field of the poles in the (N, 3) array vectors
+    measured at the (N, 2) points, over a grid of pixel_size covering extent
+    (xmin, ymin, xmax, ymax) with rows from the top, tile by tile.
+    Every tile is passed to write(column, row, bands), where bands is
+    a (len(FIELD_BANDS), rows, columns) array. The orientation bands are
+    NODATA at the nodes with less than min_count measurements within radius,
+    and the strength band where it is undefined.
+    Return False if canceled.
+    """
+    finite = np.isfinite(points).all(axis=1)
+    points = np.ascontiguousarray(points[finite], dtype=np.double)
+    vectors = np.asarray(vectors, dtype=np.double)[finite]
+    tree = cKDTree(points) if cKDTree is not None and len(points) else None
+
+    xmin, _, _, ymax = extent
+    width, height = grid_shape(extent, pixel_size)
+    windows = list(tile_windows(width, height, tile_size))
+    for done, (column, row, columns, rows) in enumerate(windows):
+        if feedback is not None:
+            if feedback.isCanceled():
+                return False
+            feedback.setProgress(100.0 * done / len(windows))
+
+        x = xmin + (column + np.arange(columns) + 0.5) * pixel_size
+        y = ymax - (row + np.arange(rows) + 0.5) * pixel_size
+        node_x, node_y = np.meshgrid(x, y)
+        nodes = np.column_stack((node_x.ravel(), node_y.ravel()))
+        if len(points):
+            sums, counts = neighborhood_tensors(tree, points, vectors, nodes, radius)
+        else:
+            sums, counts = np.zeros((len(nodes), 6)), np.zeros(len(nodes), np.int64)
+
+        field = mean_planes(sums, counts, min_count)
+        bands = np.column_stack((field, counts)).T.reshape(-1, rows, columns)
+        orientation = bands[:3]
+        orientation[~np.isfinite(orientation)] = NODATA
+        write(column, row, bands)
+    return True
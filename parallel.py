@@ -0,0 +1,46 @@
+import os
+import sys
+
+
+def default_workers():
+    """
+    Number of worker processes leaving one core to QGIS
+    """
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def python_executable():
+    """
+    Interpreter used to spawn worker processes.
+    Inside QGIS, sys.executable is the QGIS binary itself,
+    so look for the python interpreter it ships with.
+    """
+    executable = sys.executable
+    if os.path.basename(executable).lower().startswith("python"):
+        return executable
+    for candidate in (
+        os.path.join(sys.exec_prefix, "python.exe"),
+        os.path.join(sys.exec_prefix, "bin", "python3"),
+    ):
+        if os.path.exists(candidate):
+            return candidate
+    return executable
+
+
+def process_pool(workers, initializer=None, initargs=()):
+    """
+    Pool of spawned worker processes, which is safe to start
+    from the threads of a QGIS session
+    """
+    # imported here as the plugin only needs default_workers at startup
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(python_executable())
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    )
@@ -0,0 +1,248 @@
+"""
+Plots drawn by the plugin itself on top of stgeotk stereonets.
+
+They follow the protocol of the stgeotk plots: they are appended to
+a Stereonet with append_plot() and draw() is called by generate_plots().
+The stereonet axes hold the lower-hemisphere equal-area projection
+on the unit circle.
+"""
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import LinearSegmentedColormap, LogNorm, Normalize, to_rgba
+from matplotlib.patches import Circle
+
+from .orientation import lines_to_cartesian, project_equal_area
+
+
+class DensityContourPlot:
+    """
+    Filled contours of a density.DensityGrid
+    """
+
+    def __init__(self, stereonet, density_grid, alpha=0.9, cmap="Oranges", lim=None):
+        self.stereonet = stereonet
+        self.density_grid = density_grid
+        self.alpha = alpha
+        self.cmap = cmap
+        self.lim = lim
+
+    def draw(self):
+        ax = self.stereonet.ax
+        grid = self.density_grid
+        density = np.ma.masked_invalid(grid.density)
+        if self.lim is not None:
+            levels = np.linspace(self.lim[0], self.lim[1], 11)
+        else:
+            levels = np.linspace(0.0, density.max(), 11)
+
+        contours = ax.contourf(
+            grid.x,
+            grid.y,
+            density,
+            levels=levels,
+            cmap=self.cmap,
+            alpha=self.alpha,
+            extend="max",
+            zorder=0,
+        )
+        ax.figure.colorbar(contours, ax=ax, shrink=0.6, label="MUD")
+
+
+class RasterScatterPlot:
+    """
+    Scatter plot of a large dataset drawn as a single image of a
+    density.ScatterRaster, clipped to the stereonet. Pixels show the
+    mean color data of their points with cmap, or their count in
+    shades of color if there is no color data.
+    """
+
+    def __init__(
+        self,
+        stereonet,
+        raster,
+        color="#000000",
+        cmap="RdYlGn",
+        cmap_limits=None,
+        color_label="",
+    ):
+        self.stereonet = stereonet
+        self.raster = raster
+        self.color = color
+        self.cmap = cmap
+        self.cmap_limits = cmap_limits
+        self.color_label = color_label
+
+    def draw(self):
+        ax = self.stereonet.ax
+        raster = self.raster
+        if raster.mean_color is not None:
+            image = np.ma.masked_invalid(raster.mean_color)
+            cmap = self.cmap
+            if self.cmap_limits is not None:
+                norm = Normalize(*self.cmap_limits)
+            else:
+                norm = Normalize(image.min(), image.max())
+            label = self.color_label
+        else:
+            image = np.ma.masked_equal(raster.counts, 0.0)
+            cmap = LinearSegmentedColormap.from_list(
+                "counts", [to_rgba(self.color, 0.15), to_rgba(self.color, 1.0)]
+            )
+            norm = LogNorm(1.0, max(image.max(), 2.0))
+            label = "points per pixel"
+
+        artist = ax.imshow(
+            image,
+            extent=(-1.0, 1.0, -1.0, 1.0),
+            origin="lower",
+            cmap=cmap,
+            norm=norm,
+            interpolation="nearest",
+            zorder=1,
+        )
+        artist.set_clip_path(Circle((0.0, 0.0), 1.0, transform=ax.transData))
+        ax.figure.colorbar(artist, ax=ax, shrink=0.6, label=label)
+
+
+class GreatCirclePlot:
+    """
+    Great circles of many planes drawn as a single LineCollection
+    of the (N, M, 2) array of orientation.great_circle_arcs().
+
+    shading is "none" for opaque arcs, "alpha" for translucent arcs
+    whose overlaps accumulate, or "density" to color the arcs with cmap
+    by the given density of their poles, the densest drawn on top.
+    """
+
+    # opacity shared by the arcs in the alpha shading
+    alpha_budget = 50.0
+
+    def __init__(
+        self,
+        stereonet,
+        arcs,
+        color="#000000",
+        shading="alpha",
+        density=None,
+        cmap="Oranges",
+        linewidth=0.6,
+        label=None,
+    ):
+        self.stereonet = stereonet
+        self.arcs = arcs
+        self.color = color
+        self.shading = shading
+        self.density = density
+        self.cmap = cmap
+        self.linewidth = linewidth
+        self.label = label
+
+    def draw(self):
+        ax = self.stereonet.ax
+        arcs = self.arcs
+        if self.shading == "density" and self.density is not None:
+            order = np.argsort(self.density)
+            collection = LineCollection(
+                arcs[order],
+                array=self.density[order],
+                cmap=self.cmap,
+                norm=LogNorm(1.0, max(self.density.max(), 2.0)),
+                linewidths=self.linewidth,
+                label=self.label,
+            )
+            ax.add_collection(collection)
+            ax.figure.colorbar(collection, ax=ax, shrink=0.6, label="poles per cell")
+            return
+
+        alpha = 1.0
+        if self.shading == "alpha":
+            alpha = float(np.clip(self.alpha_budget / len(arcs), 0.02, 1.0))
+        collection = LineCollection(
+            arcs,
+            colors=[to_rgba(self.color, alpha)],
+            linewidths=self.linewidth,
+            label=self.label,
+        )
+        ax.add_collection(collection)
+
+
+class ConfidenceConePlot:
+    """
+    Small circle of a bootstrap.BootstrapCone around its axis.
+    The parts of the circle above the horizontal are drawn through
+    their antipodes on the lower hemisphere.
+    """
+
+    # number of vertices of the small circle
+    vertices = 181
+
+    def __init__(self, stereonet, cone, color="#d62728", linewidth=1.2, label=None):
+        self.stereonet = stereonet
+        self.cone = cone
+        self.color = color
+        self.linewidth = linewidth
+        self.label = label
+
+    def draw(self):
+        ax = self.stereonet.ax
+        axis = self.cone.axis
+        if axis[2] > 0.0:
+            axis = -axis
+
+        # two unit vectors normal to the axis and to each other
+        u = np.cross(axis, [0.0, 0.0, 1.0] if abs(axis[2]) < 0.9 else [1.0, 0.0, 0.0])
+        u /= np.linalg.norm(u)
+        w = np.cross(axis, u)
+        radius = np.radians(self.cone.radius)
+        angles = np.linspace(0.0, 2.0 * np.pi, self.vertices)[:, np.newaxis]
+        points = np.cos(radius) * axis + np.sin(radius) * (
+            np.cos(angles) * u + np.sin(angles) * w
+        )
+
+        # break the circle where it crosses the horizontal
+        xy = project_equal_area(points)
+        upward = points[:, 2] > 0.0
+        breaks = np.flatnonzero(upward[1:] != upward[:-1]) + 1
+        segments = [part for part in np.split(xy, breaks) if len(part) > 1]
+        ax.add_collection(
+            LineCollection(
+                segments,
+                colors=[self.color],
+                linewidths=self.linewidth,
+                label=self.label,
+            )
+        )
+
+
+class GroupMeanPlot:
+    """
+    One symbol per group at an (N, 2) array of trend/plunge,
+    each in its own color of cmap and labelled for the legend
+    """
+
+    def __init__(self, stereonet, lines, labels, marker="o", size=60, cmap="tab10"):
+        self.stereonet = stereonet
+        self.lines = lines
+        self.labels = labels
+        self.marker = marker
+        self.size = size
+        self.cmap = cmap
+
+    def draw(self):
+        ax = self.stereonet.ax
+        xy = project_equal_area(lines_to_cartesian(*self.lines.T))
+        norm = Normalize(0.0, max(len(xy) - 1.0, 1.0))
+        for i, ((x, y), label) in enumerate(zip(xy, self.labels)):
+            ax.scatter(
+                [x],
+                [y],
+                c=[i],
+                cmap=self.cmap,
+                norm=norm,
+                s=self.size,
+                marker=self.marker,
+                edgecolors="#000000",
+                linewidths=0.6,
+                label=label,
+                zorder=3,
+            )
@@ -0,0 +1,122 @@
+"""
+Instrumentation of the plot actions: per-stage timers summarized
+in the log tab, and opt-in cProfile dumps of a single plot.
+"""
+import cProfile
+import os
+import pstats
+import tempfile
+import time
+from contextlib import contextmanager
+
+
+class Stage:
+    """
+    Elapsed time of a stage and the number of items it processed
+    """
+
+    def __init__(self, name, count=None):
+        self.name = name
+        self.count = count
+        self.elapsed = 0.0
+
+
+class StageTimer:
+    """
+    Timings of the stages of one plot:
+
+        with timer.stage("extraction") as stage:
+            data = ...
+            stage.count = len(data)
+    """
+
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name, count=None):
+        stage = Stage(name, count)
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.elapsed = time.perf_counter() - start
+            self.stages.append(stage)
+
+    def count(self, name):
+        """
+        Item count of the first stage called name, None if there is none
+        """
+        for stage in self.stages:
+            if stage.name == name:
+                return stage.count
+        return None
+
+    def total(self):
+        return sum(stage.elapsed for stage in self.stages)
+
+    def summary(self, title):
+        """
+        One line report of the stages, with their share of the total time
+        """
+        total = self.total()
+        parts = []
+        for stage in self.stages:
+            part = f"{stage.name} {stage.elapsed:.3f} s"
+            if total > 0.0:
+                part += f" {100.0 * stage.elapsed / total:.0f}%"
+            if stage.count is not None:
+                part += f" ({stage.count} items)"
+            parts.append(part)
+        return f"{title} timings: " + ", ".join(parts) + f"; total {total:.3f} s"
+
+
+class RunProfiler:
+    """
+    cProfile of one plot, across the task thread and the main thread.
+    Does nothing unless enabled.
+    The computation in worker processes is not included.
+    A run is not profiled, and skipped is set, if another profiler
+    is active, which cProfile does not allow from Python 3.12.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.skipped = False
+        self.profiles = []
+
+    @contextmanager
+    def profile(self):
+        if not self.enabled:
+            yield
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # the sys.monitoring tool of cProfile is held by another profiler
+            profiler = None
+        if profiler is None:
+            self.skipped = True
+            yield
+            return
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self.profiles.append(profiler)
+
+    def dump(self, name):
+        """
+        Write the merged profiles to a .prof file in the temporary directory,
+        which snakeviz or flameprof can turn into a flame graph.
+        Return its path.
+        """
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        slug = "-".join(name.lower().split())
+        path = os.path.join(tempfile.gettempdir(), f"stereonet-{slug}-{stamp}.prof")
+        stats = pstats.Stats(self.profiles[0])
+        for profile in self.profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(path)
+        return path
@@ -0,0 +1,234 @@
+"""
+Assembly of the stereonets from the results of the analysis module,
+shared by the plugin and the headless batch renderer.
+log receives the statistics reported along the plots.
+"""
+import stgeotk as stg
+
+from .orientation import planes_from_poles
+from .plots import (
+    ConfidenceConePlot,
+    DensityContourPlot,
+    GreatCirclePlot,
+    GroupMeanPlot,
+    RasterScatterPlot,
+)
+
+
+def line_plot(stereonet, dataset, options):
+    """
+    Generate scatter plot for line (point) dataset
+    Automatically detect whether markers will be drawn with colors
+    """
+    common_opts = {
+        "marker": options["marker"],
+        "s": options["marker_size"],
+        "linewidth": 0.8,
+    }
+
+    if dataset.color_data is not None:
+        return stg.LinePlot(
+            stereonet,
+            dataset,
+            **common_opts,
+            cmap=options["marker_cmap"],
+            cmap_center=options["marker_cmap_center"],
+            cmap_limits=options["marker_cmap_limits"],
+        )
+    else:
+        return stg.LinePlot(
+            stereonet,
+            dataset,
+            **common_opts,
+            color=options["marker_color"],
+        )
+
+
+def raster_plot(stereonet, raster, options, log):
+    """
+    Generate the rasterized scatter plot of a large point dataset
+    """
+    log(f"Scatter plot of {raster.size} points rasterized")
+    if raster.mean_color is not None:
+        return RasterScatterPlot(
+            stereonet,
+            raster,
+            cmap=options["marker_cmap"],
+            cmap_limits=options["marker_cmap_limits"],
+            color_label=options["marker_color_field"],
+        )
+    return RasterScatterPlot(stereonet, raster, color=options["marker_color"])
+
+
+def scatter_plot(stereonet, result, options, log):
+    """
+    Plot the points of a result as markers, or rasterized if there are many
+    """
+    if result["raster"] is not None:
+        return raster_plot(stereonet, result["raster"], options, log)
+    return line_plot(stereonet, result["dataset"], options)
+
+
+def contour_plot(stereonet, contour_data, options, log):
+    """
+    Generate contour plots from the density of a point dataset
+    """
+    log(
+        f"Fisher density contoured with k = {contour_data.k:.1f} "
+        f"({options['contour_k_mode']} k optimization)"
+    )
+    return DensityContourPlot(
+        stereonet,
+        contour_data,
+        alpha=0.9,
+        cmap=options["contour_cmap"],
+        lim=options["contour_limits"],
+    )
+
+
+def cone_plot(stereonet, cone, description, log):
+    """
+    Draw the bootstrap confidence cone of a mean and report its radius
+    """
+    trend, plunge = cone.line()
+    log(
+        f"{cone.confidence:.0%} bootstrap confidence cone of the {description} "
+        f"{trend:.1f} / {plunge:.1f}: radius {cone.radius:.2f} degrees "
+        f"({cone.replicates} replicates)"
+    )
+    return ConfidenceConePlot(stereonet, cone)
+
+
+def group_plot(stereonet, groups, planar, log):
+    """
+    Overlay the mean line, or mean pole if planar, of each group
+    of analysis.group_data and report the statistics of the groups
+    """
+    groups, statistics = groups
+    means = statistics.lines(2)
+    # the best-fit plane of lines is normal to their smallest eigenvector
+    planes = planes_from_poles(*statistics.lines(2 if planar else 0).T)
+    fisher = statistics.fisher()
+    woodcock = statistics.woodcock()
+    labels = ["NULL" if group is None else str(group) for group in groups]
+    mean_name = "mean pole" if planar else "mean line"
+    plane_name = "average plane" if planar else "best-fit plane"
+    for i, label in enumerate(labels):
+        e3, e2, e1 = statistics.values[i]
+        log(
+            f"{label}: {statistics.counts[i]} measurements, "
+            f"{mean_name} {means[i, 0]:.1f} / {means[i, 1]:.1f}, "
+            f"{plane_name} {planes[i, 0]:.1f} / {planes[i, 1]:.1f}, "
+            f"eigenvalues {e1:.3f} {e2:.3f} {e3:.3f}, "
+            f"kappa {fisher[i, 0]:.1f}, alpha95 {fisher[i, 1]:.1f}, "
+            f"K {woodcock[i, 0]:.2f}, C {woodcock[i, 1]:.2f}"
+        )
+    return GroupMeanPlot(stereonet, means, labels)
+
+
+def line_stereonet(result, options, log):
+    """
+    Stereonet of the result of analysis.analyse_lines
+    """
+    dataset = result["dataset"]
+    stereonet = stg.Stereonet()
+
+    # generate contour plot if requested
+    if result["contour"] is not None:
+        stereonet.append_plot(contour_plot(stereonet, result["contour"], options, log))
+
+    # generate bestfit plane
+    if result["mean_plane"] is not None:
+        bestfit_plane = result["mean_plane"]
+        log(f"Best-fit plane strike/dip = {bestfit_plane[0]} / {bestfit_plane[1]}")
+        bestfit_plane_data = stg.PlaneData()
+        bestfit_plane_data.load_data(
+            bestfit_plane, dataset.data_legend + " best-fit plane"
+        )
+        stereonet.append_plot(stg.PlanePlot(stereonet, bestfit_plane_data))
+    if result["cone"] is not None:
+        stereonet.append_plot(
+            cone_plot(stereonet, result["cone"], "best-fit plane pole", log)
+        )
+
+    stereonet.append_plot(scatter_plot(stereonet, result, options, log))
+    if result["groups"] is not None:
+        stereonet.append_plot(group_plot(stereonet, result["groups"], False, log))
+    return stereonet
+
+
+def plane_stereonet(result, options, log):
+    """
+    Stereonet of the result of analysis.analyse_planes
+    """
+    # generate foliation plot
+    stereonet = stg.Stereonet()
+    if result["arcs"] is not None:
+        count = len(result["arcs"])
+        if count < result["plane_count"]:
+            log(
+                f"Great circles of a random subsample of {count} "
+                f"of {result['plane_count']} planes drawn in one batch"
+            )
+        else:
+            log(f"Great circles of {count} planes drawn in one batch")
+        plane_plot = GreatCirclePlot(
+            stereonet,
+            result["arcs"],
+            color=options["marker_color"],
+            shading=options["plane_shading"],
+            density=result["arc_density"],
+            cmap=options["contour_cmap"],
+            label=result["legend"],
+        )
+    else:
+        plane_plot = stg.PlanePlot(stereonet, result["dataset"])
+
+    # generate average intersection
+    if result["intersection"] is not None:
+        avg_intersect = stg.LineData()
+        avg_intersect.load_data(
+            result["intersection"], result["legend"] + " average intersect"
+        )
+        stereonet.append_plot(stg.LinePlot(stereonet, avg_intersect, marker="*"))
+
+        # report trend/plunge
+        avg_trd, avg_plg = result["intersection"][0]
+        log(f"Trend/plunge of the best-fit intersection point: {avg_trd} / {avg_plg}")
+    if result["cone"] is not None:
+        stereonet.append_plot(
+            cone_plot(stereonet, result["cone"], "best-fit intersection", log)
+        )
+
+    stereonet.append_plot(plane_plot)
+    if result["groups"] is not None:
+        stereonet.append_plot(group_plot(stereonet, result["groups"], True, log))
+    return stereonet
+
+
+def pole_stereonet(result, options, log):
+    """
+    Stereonet of the result of analysis.analyse_poles
+    """
+    stereonet = stg.Stereonet()
+
+    # generate contour plot if requested
+    if result["contour"] is not None:
+        stereonet.append_plot(contour_plot(stereonet, result["contour"], options, log))
+
+    # generate average plane
+    if result["mean_plane"] is not None:
+        avg_plane = result["mean_plane"]
+        log(f"Average plane strike/dip = {avg_plane[0]} / {avg_plane[1]}")
+        avg_plane_data = stg.PlaneData()
+        avg_plane_data.load_data(avg_plane, result["legend"] + " average plane")
+        stereonet.append_plot(stg.PlanePlot(stereonet, avg_plane_data))
+    if result["cone"] is not None:
+        stereonet.append_plot(
+            cone_plot(stereonet, result["cone"], "average plane pole", log)
+        )
+
+    stereonet.append_plot(scatter_plot(stereonet, result, options, log))
+    if result["groups"] is not None:
+        stereonet.append_plot(group_plot(stereonet, result["groups"], True, log))
+    return stereonet
@@ -2,150 +2,13 @@
 
 # Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
 #
 # WARNING! All changes made in this file will be lost!
 
 from PyQt5 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x08\x6a\
-\x00\
-\x00\x69\x06\x78\x9c\xed\x5c\x3b\x92\xdb\x38\x10\x05\x49\x51\x14\
-\xc5\x9f\x94\x38\x9d\x74\x83\xcd\x7c\x80\xf1\x05\x7c\x00\x5f\xc0\
-\xb5\xb9\x0f\x30\xba\x80\x53\x57\xf9\x02\xbe\x80\x2f\xa0\x0b\xf8\
-\x00\xce\x14\x39\x56\x95\x93\x09\x54\x33\x4b\x51\x20\x88\x06\xba\
-\xf1\x21\xc1\x19\xbb\x8a\x6f\x6b\xed\xaa\x67\x09\x7a\xec\x6e\x34\
-\x9a\x60\x83\x8c\x45\xed\x7f\x5f\xbe\xb0\xf6\xcf\x0d\x3b\xff\xc7\
-\xd8\x1b\xc6\xd8\x3f\xed\xff\x2d\xc5\xfe\x8d\x6e\xbc\x09\x6f\xdf\
-\xbe\x65\xef\xde\xbd\x63\xef\xdf\xbf\x67\x1f\x3e\x7c\x60\x1f\x3f\
-\x7e\x64\x9f\x3e\x7d\x62\x87\xc3\x81\x7d\xfe\xfc\x99\x7d\xfd\xfa\
-\x95\x7d\xfb\xf6\x8d\x7d\xff\xfe\x9d\x1d\x8f\x47\xf6\xe3\xc7\x0f\
-\xf6\xf3\xe7\x4f\xf6\xeb\xd7\x2f\xf6\xfb\xf7\x6f\xf6\xfc\xfc\x6c\
-\x1c\x7f\xc1\x82\x05\x0b\x16\x2c\x58\xb0\x60\x81\x0b\xea\x2a\xcf\
-\xd7\x69\x9a\x26\x51\x14\x25\xed\xdf\x59\x9e\x57\xf5\x2b\x4b\xda\
-\x66\xab\x08\xc7\x2a\xdb\xbe\x8e\xb8\xa6\x58\xc7\x84\xa6\x1e\xf1\
-\xba\x68\x5e\x58\xd4\x96\xb2\x93\x66\xb7\xed\xcb\x49\x2b\x52\x47\
-\x51\x37\xa4\xc5\x4b\x88\x6a\x36\x36\xf7\x21\x0e\xdd\xcc\x6d\xb4\
-\x26\xf3\x16\x75\x43\x36\xa7\xb2\xd1\xaa\xe6\x55\xb6\x99\xa0\xea\
-\x0a\xf3\xdd\xe9\x58\x14\xfe\x71\xa5\x22\x0e\x3f\x03\x1a\xbf\x39\
-\x48\x21\x0d\xec\xcc\xed\x74\x63\xdd\x10\x6f\x43\xca\x0a\x63\xac\
-\x1b\xd2\x60\xaa\x2a\xa3\xb1\x92\x34\x2f\xaa\x7a\xdf\xa3\xae\x8a\
-\xbc\x5b\xc3\x69\x93\x55\x61\x64\x6d\xe9\x9f\x58\x6d\xca\xdd\x1e\
-\xc3\xae\xdc\x18\x56\xaa\x20\xbe\x24\x73\x56\xbb\xf4\xa1\x9a\x7a\
-\x18\x16\xd1\x6c\xba\x2c\x62\xec\x24\x37\x8b\xe2\xd2\x72\xc2\xa3\
-\x93\x83\x0c\x97\x95\x16\x0e\xa2\x6e\x20\x16\xf9\xd5\x0c\xb2\xd2\
-\xca\x59\xd5\x15\x15\xaa\x6c\x92\x30\x4c\x56\xe2\xa7\xaa\x53\x86\
-\x79\x73\x82\x30\x44\x56\xbc\xf5\x16\xb5\xdd\xa4\xa8\xd9\x47\x0b\
-\x43\x46\x4b\x5d\xa2\x5d\xa0\x2e\x32\x53\x26\x1b\x29\x4c\x0f\x0b\
-\x1f\x63\xed\xcc\x9a\x3a\xac\xc7\xc8\xd2\xf3\xd6\xaa\xb6\xcb\xe9\
-\x45\xad\x6d\x9a\x3a\x8c\xc8\x63\x85\x3e\x08\x9e\xda\x75\x94\x6e\
-\xa2\xae\xf0\x2e\x7c\x6a\x6d\x88\xdc\x4d\x14\x99\x4a\x71\xf8\xde\
-\x64\x6a\x83\xbb\x65\xd2\x1a\x5d\xb5\xda\x7b\xf0\xa2\xea\xd2\x8b\
-\xe6\x85\xc4\x4f\x96\xe6\x09\x27\x59\x48\x06\x4d\xf3\x12\x4c\x61\
-\x4d\x98\x57\xec\x97\x63\x64\xd5\xaa\xaa\xd5\x06\x49\xc1\x9a\xb0\
-\xd2\x43\x97\x5a\x70\x39\xc8\x52\xef\x95\xc8\x6a\x43\x15\x16\x8f\
-\xf7\xa2\x5d\xd6\x2e\x07\x97\x62\xac\x36\x54\x61\xce\x9e\xac\x94\
-\x2f\x6e\xac\xb2\xe0\x02\x98\x96\xe6\x4f\xab\x73\xc3\xb5\x7e\x55\
-\xe6\xe2\xda\x6a\x2c\x60\xdf\xcc\xbe\x54\x29\x81\xe8\x38\x27\x73\
-\xe5\x5b\xb6\x74\x5a\xca\x2e\x74\x50\xd5\x5e\x88\x72\xe5\xb9\x93\
-\x2e\x25\xe8\x2d\x8b\xcf\x4e\xbe\x0b\x77\x52\xd5\x42\xc9\xda\x4e\
-\xa1\xaf\x98\xcb\x92\xe6\x6b\xa9\xe8\xf0\xa8\x17\xd5\x1f\xf1\x36\
-\xd7\xca\x3c\xbe\xb4\x39\x10\xbb\xd7\xd6\x2d\x60\x0d\xe5\x60\x30\
-\xe5\x4a\xcc\x5e\x94\x66\xd6\xc6\x75\x55\xbf\x41\xf1\xa4\xdd\x60\
-\xd0\x5c\x46\x2f\xee\x86\x8b\xf6\x2f\xae\xe1\xf5\x5b\x0d\x06\x93\
-\x5e\x6c\x32\x82\x14\x5a\x6b\x3f\x63\x75\x17\x05\x0d\x60\x2b\x78\
-\xa0\xdf\x4d\x21\x53\x8b\x81\xfd\x22\xab\x07\xb4\x80\xa5\xa6\x86\
-\x6e\x4f\x0c\xc3\x0e\x59\xcb\xbd\x8c\x85\x80\x49\xcc\x5c\x88\xc1\
-\x25\xc2\x60\x87\xe1\x6a\x47\xf8\x50\x1d\xe2\x0a\x73\x49\x0d\x57\
-\x5f\x97\x31\x1d\xcb\x58\x0c\xc0\x60\xc6\xc8\x87\x75\x17\xfd\x93\
-\x83\xac\x51\xa1\xc5\x01\xa7\xa4\xa9\x0e\x83\x6e\x24\x1d\x24\x64\
-\xc5\x23\x43\xeb\x86\x9d\xb3\x23\x81\x1b\x33\x6a\xbc\x3a\x8c\x2c\
-\xa5\xe0\x31\x38\x12\xce\x46\xaa\x8a\x12\x09\x62\xaa\xac\x3d\x0c\
-\x1b\x7a\x46\x02\x87\xc7\xc4\x60\xbb\x60\xb2\xf6\x7b\xe0\x1f\x7a\
-\x2d\x02\xf5\x1a\xe1\x46\xb1\xf8\x04\x90\x05\x1d\x49\xef\xd5\xb9\
-\xb8\x71\x1d\x50\x96\xe2\x48\x4a\x16\xac\xeb\xf1\x91\xf2\x90\xb2\
-\xf6\x7b\xf0\x8b\x54\x9d\x0f\x36\x9e\x53\x74\x1c\x21\xdd\x72\x6b\
-\xe1\x0a\x10\x39\xd4\x36\x35\xf0\x36\x9a\x54\x45\xcc\x4f\x49\xa7\
-\x32\xc0\x4c\xa3\x32\x18\x10\x8f\x16\x54\xfd\x27\xc8\xd4\xe6\x0b\
-\x10\x3a\x54\xe0\x03\x67\x63\xc9\xbe\x77\xb4\xa5\xb8\xf6\x00\x4c\
-\xf9\x0e\xba\xb0\xec\xd5\xa7\x5d\x63\xb5\xe8\x89\xd8\xae\x0b\xda\
-\x14\x19\xa3\xcf\x5c\xfe\x1b\xd2\x34\x60\xec\xd8\x75\x21\xf7\xfe\
-\x5b\xfa\x9f\xc6\x63\x63\xd7\x05\xd2\x84\x3e\x1d\x9b\x38\x74\x70\
-\x5d\x01\x26\x24\x9e\x28\xc0\x47\xf4\x44\xd0\x27\xfa\x30\x09\xb5\
-\x07\x28\x5a\xf1\x15\x12\xe8\xd2\x62\xa8\xf7\xf2\x84\xfa\x14\x43\
-\x35\x55\x57\x32\x87\x17\x9d\x74\x65\x26\x5d\x5b\x4a\x6f\x48\x5d\
-\x78\xc2\x37\xa5\xfb\x7e\x01\x0a\x96\xe8\x51\x5d\x78\xc2\x37\xe9\
-\xe2\x3e\x0e\x99\x51\x43\xe8\xea\xcd\x15\x38\xe8\xdd\x74\x19\xe2\
-\x9e\xff\x93\x75\xeb\x70\xa2\x2e\xdf\xf9\xd8\x9b\x2b\x54\x75\x13\
-\x4a\x17\x9f\x8c\xa6\xed\x8a\x97\xd2\x05\x22\x29\x99\xcd\x5c\x70\
-\x1d\xc2\x75\x95\x94\xae\x62\x3e\x73\x41\x5d\xf8\x56\x00\x59\xe7\
-\xa4\x88\x09\x43\x01\x6c\xfd\xe3\xf5\x44\x23\x7f\x44\x5a\x6f\x38\
-\x1f\x3e\x77\x5d\x01\xf6\x01\x89\x26\x2c\xf9\x23\xd2\x6d\x1a\x2f\
-\x91\x82\xa7\xfa\x0e\xe0\x37\x71\x59\x70\x0f\x73\x28\x67\x78\xd4\
-\x7b\x75\x02\xb8\x02\xec\x88\x50\xcf\x63\x80\xaf\xc5\xe4\x2b\xf5\
-\x80\x0b\x07\x50\x7e\x51\xf7\x43\xf0\x66\xae\xff\x6a\xa6\xe8\x0c\
-\x0a\x78\xcb\x4a\xe8\x02\x89\x42\x64\x05\x9e\xeb\x67\x89\x7a\xb8\
-\x95\x49\xed\x18\x82\x09\xd9\xc7\x53\x39\x67\xd4\x2b\xbf\x48\xe8\
-\x82\x0f\x1e\x79\x6f\x09\x9f\x8d\x81\xf6\x23\x14\x80\x5b\x1d\xfa\
-\x31\x24\xf0\x36\xcf\x60\x5c\xeb\x2c\xb2\x60\xf6\xa2\x37\x58\xe1\
-\x8e\x7a\xe7\x48\x6e\x69\xeb\x33\xdb\x51\x80\x6e\x34\x3c\x8a\x01\
-\x9f\xeb\x1c\xc9\xa5\xce\x33\x1b\x61\x47\x25\x2d\x0b\x66\xd6\x6e\
-\x46\x66\x92\xed\x82\x03\xc4\xb3\xe9\x09\x11\xbc\x80\x4a\x7c\x75\
-\x96\x52\x02\xd6\x5e\xc6\xe6\x51\xe8\xf0\xb5\x88\x80\x79\xb2\x04\
-\x6c\xd3\x30\x76\x4e\xc3\xc7\x7c\x4d\x9f\xbd\x66\x09\x2f\x68\x04\
-\xf3\x83\x3e\xe5\x19\x57\x5f\xb6\x85\xdd\x93\xe0\x50\x9e\xdd\x19\
-\x75\x29\x8f\x91\x1b\x6e\xea\x39\x64\x41\x73\xd9\x1e\x24\xc3\x8b\
-\x58\xdf\xfc\x1a\x7a\x53\xa2\x03\x8c\x2e\x5b\x47\x9f\xde\x27\x17\
-\xcd\x13\xf6\x4a\x13\x90\xf5\xbc\x00\xd6\x9c\x3b\x47\x65\x0f\x67\
-\x98\xbd\x5f\x5a\x6d\x66\xea\x62\x32\xbc\x2c\xa5\x4d\xc3\xa1\xa5\
-\x09\x31\x58\xe8\xcd\x25\xad\xad\xc3\xa5\xbd\x1c\x31\x58\xf8\x34\
-\xa1\xb4\x12\x3b\x75\x80\xe9\x06\x0b\x2e\x4b\x39\x89\xe4\xd6\x8d\
-\xaf\x4f\xc9\xd0\xb2\xd4\x4e\x3e\xc7\x26\x56\xed\x5c\x55\x60\x59\
-\xb5\xd2\x61\xe6\x7c\x0e\x4b\x6d\xc7\x0c\x7b\xcf\xa1\x74\xe6\x78\
-\x34\x64\xaa\xed\xab\xab\x90\xc2\x76\x6a\xfb\xbc\x47\x03\xab\xda\
-\x28\x1a\x50\x98\x26\xcb\xab\xe1\x57\xf5\x64\x30\x61\x9a\x2c\x8f\
-\xb6\x5a\xc4\x93\xa1\x84\x69\xb2\xbc\xda\x90\x19\x32\x27\x83\x08\
-\x6b\x34\x59\xde\x67\x22\xb5\x11\x02\x74\x00\xa8\x09\x62\xd4\x11\
-\x0f\x6d\x8c\x71\x6d\x71\x12\xf4\x23\x10\x7e\xc1\x75\x83\x7e\x71\
-\xee\x27\x29\x30\xec\xf4\x23\x03\xf1\xa8\x23\xf1\x5a\xec\x8f\x3a\
-\xd3\xd4\x03\x3b\xdb\xe4\x19\xf3\x3d\x74\xbb\x7b\xb7\xa9\x0a\x63\
-\x61\x67\x86\x47\x9f\xb6\xc5\x84\x25\x63\xa2\xac\xc0\xce\xa2\x4c\
-\x38\x04\x8c\x09\xf3\x3d\x36\x47\x1d\x9c\x9b\x74\x36\x19\x15\xe6\
-\xa7\x0c\x57\x35\x4d\x16\x25\xac\xf5\xa6\x5b\x9c\xed\x50\x0f\x4e\
-\x97\x45\x1f\xfa\x8d\x33\xfb\x16\x62\x99\x51\x5f\x0e\x70\xf4\xb7\
-\x26\xcf\x4f\xb5\xd2\x68\xab\xed\x48\x51\xad\xb5\xc3\xbc\xca\xc3\
-\x74\x7a\x7b\xb5\x29\xf4\x60\xab\x0a\xd3\x69\xe4\x70\x27\xb8\x73\
-\xc3\x8f\x74\xd7\x9f\xae\xf3\x1e\x6b\xf3\xe1\xed\xc8\xf5\x34\x87\
-\x13\xd0\x83\xa8\xe3\x90\x04\x3a\x55\xce\x31\xf5\x1d\x0f\x3d\x82\
-\xbf\xeb\x21\x88\xc9\x02\x1b\xeb\x86\x9c\x9c\x5f\x8e\x88\x03\x46\
-\x96\x8c\x49\xaf\x11\x99\xf5\x15\x27\x13\x94\xcd\xfa\xe2\x95\xd1\
-\xca\x66\x56\xd5\x61\xeb\x3b\x03\x92\xa0\xef\xe8\x30\xa0\xa2\x97\
-\x18\x0d\x71\x36\xc7\x1c\x24\x51\xda\x4f\x8d\x5f\x2d\x95\x8d\x2c\
-\x95\xa7\xa0\xde\x1a\xdf\x68\x15\xaf\x5f\xe9\x4d\x5b\x57\x34\x65\
-\xbb\x20\x6a\x92\xda\xe5\xb2\x7c\xe1\x37\x6c\xe1\xa8\xab\xaa\x2a\
-\xda\x45\xbb\x68\xff\xfe\x23\x04\x2d\x58\xb0\x60\xc1\x82\xbf\x04\
-\xcf\x1a\x2e\x7f\x0d\x77\x64\x91\xca\x3d\xb6\x97\xd4\x28\xdc\x61\
-\xb8\xce\x8b\xf8\xfb\x8a\x3b\xc0\x9d\x3b\x2e\x03\xdc\x41\x32\x12\
-\xe7\x9e\xb8\xe1\xee\x25\xee\x91\x73\x8d\xc4\x9d\x39\x97\x49\xdc\
-\x91\x73\x91\xc4\x09\x4f\x3c\x08\xee\x49\x70\xf7\x82\xbb\x08\xee\
-\x4e\x70\x67\xc1\x65\x82\x3b\x09\x2e\x11\xdc\x51\x70\x91\xe0\x0e\
-\x20\x04\x6e\x9c\x14\x16\x0f\x9c\x7b\x92\xb8\x7b\xce\x5d\x24\xee\
-\x8e\x73\x67\x89\xcb\x0c\xdc\x49\xe2\x12\xce\x1d\x25\x2e\xe2\x9c\
-\x24\xef\x2a\xf0\xa2\xbd\x73\xff\x81\xe4\x9e\x00\x77\xdf\x71\x17\
-\xc0\xdd\x91\xdc\x23\xe0\x9a\x8e\x3b\x03\x2e\x23\xb9\x13\xe0\x12\
-\x92\x3b\x02\x2e\x22\xb9\x03\xe0\x18\xc9\x41\x8a\x3d\x10\xdc\x93\
-\xc2\xdd\x7b\x70\x17\x85\xbb\xf3\xe0\x1e\x15\xae\x99\xc8\x9d\x15\
-\x2e\x7b\x21\xee\xa4\x70\xc9\xc2\x4d\xe6\x5e\xcb\x97\x53\xe2\x6f\
-\xca\x5c\xc0\x38\xd7\x39\xe8\x3a\xcf\x51\xee\x00\x39\x32\x97\x1c\
-\x01\x45\xe7\xa6\x13\xe0\xe8\x5c\x87\xe5\x49\x2c\xc7\x62\x1c\x96\
-\x9f\xb1\xdc\x8e\x71\xe8\x5a\x71\x90\x39\xc3\xda\x83\x71\xf2\xc5\
-\x25\x86\xf5\x4d\xbe\x90\xc6\xb0\x5e\x62\xeb\x2a\xb6\xfe\xa2\xeb\
-\xf4\x20\x70\x58\xcf\xb1\x5a\x60\x10\xd3\x18\xeb\x08\xac\x06\x19\
-\x7e\x58\xaa\x55\x7a\x2b\x24\x96\x3a\xe7\x22\xfd\x84\xa8\xa5\xa4\
-\x9f\x10\xdc\x69\x18\x4e\x70\x8f\x42\xb1\x54\xc3\x0d\x5f\x1d\xb8\
-\x93\xf8\xea\xc0\x3d\x31\x5e\x99\xc9\x75\xe2\x85\x57\x7a\x7f\x42\
-\xcd\x1a\x8a\xfb\x1f\xa7\x3b\xd1\x3c\
 \x00\x00\x08\x35\
 \x00\
 \x00\x69\x06\x78\x9c\xed\x9c\x3d\x6e\xdb\x4a\x10\xc7\x77\x49\x8a\
@@ -1206,6 +1069,368 @@ qt_resource_data = b"\
 \xfc\xd0\xcf\x7d\xdf\x83\x79\x30\x1a\x70\x10\x82\x3e\x30\x83\xff\
 \x0f\xfb\x38\x4f\x5d\x3e\xf5\xc9\x6a\x00\x00\x00\x00\x49\x45\x4e\
 \x44\xae\x42\x60\x82\
+\x00\x00\x0d\xe7\
+\x00\
+\x00\x42\x3e\x78\x9c\xed\x5b\x79\x54\x55\xd5\x1a\x3f\x4a\xeb\x99\
+\x43\xb9\x5a\xb5\xac\xb5\xb4\xe7\x7b\x7f\xbd\xa6\xb5\x9c\xc1\x0c\
+\x03\xcd\x0a\x45\x0a\xbd\x26\x39\x80\x03\xe1\x50\x0a\xfa\x10\x2b\
+\x92\xbc\x58\x82\x9a\xb3\x88\x9a\xe6\x90\x43\x6a\xa8\x39\x80\x23\
+\x4a\xe9\xb2\xd4\x5e\xa0\x36\x60\x0e\xa1\xa0\xaf\x9c\xa7\x6b\x82\
+\xc0\x7e\xbf\xdf\xf6\x6e\xde\xe5\xdc\x73\x2e\xf7\xc2\x05\xfa\x83\
+\xaf\x75\xda\xd7\x7b\xcf\xb0\x7f\xdf\xfe\xbe\xdf\x37\xec\x83\xa6\
+\xd5\xc3\x7f\x81\x81\x1a\xfe\xff\x0f\xed\xa9\xae\x9a\xd6\x4c\xd3\
+\xb4\xa7\x70\xe0\x2b\xcd\xaa\xdd\xff\x5e\x0a\xbe\x78\xb4\xf1\xfd\
+\xa3\x4e\xea\xa4\x4e\xea\xa4\xba\x45\x08\xc1\xa3\xde\xe5\xcb\x97\
+\x9b\x4c\x9b\x36\xed\xa1\xb4\xb4\xb4\x67\xd7\xaf\x5f\xdf\x07\x9f\
+\x2d\x71\x71\x71\x96\x21\x43\x86\x58\xac\x56\xab\x65\xee\xdc\xb9\
+\x7d\xd6\xad\x5b\xd7\x0d\xff\x7e\x64\xeb\xd6\xad\x0f\xdf\xb9\x73\
+\xe7\x6f\xd7\xae\x5d\xab\xed\xe9\x57\x4a\x6e\xdf\xbe\x4d\xcc\x3e\
+\x3b\x77\xee\x6c\x3e\x76\xec\xd8\x8e\xef\xbc\xf3\x4e\xc2\x98\x31\
+\x63\x0e\xf4\xea\xd5\x2b\xe7\xe5\x97\x5f\xce\x0f\x09\x09\x11\xaf\
+\xbc\xf2\x4a\x69\xd7\xae\x5d\x4b\x3b\x77\xee\x5c\xda\xad\x5b\xb7\
+\xd2\xa0\xa0\x20\xd1\xbd\x7b\xf7\xdb\xfe\xfe\xfe\xc7\xc2\xc3\xc3\
+\x8f\xe2\x58\xfc\xc1\x07\x1f\x44\xcf\x9c\x39\xb3\xf5\x9e\x3d\x7b\
+\x9a\x64\x64\x64\xd4\x36\x2c\x97\xc2\x75\x5e\xb3\x66\x8d\x96\x9b\
+\x9b\xdb\x78\xea\xd4\xa9\x7e\x23\x46\x8c\x98\x3a\x70\xe0\xc0\x53\
+\xc0\x77\xb5\x53\xa7\x4e\xa2\x5d\xbb\x76\xf2\x68\xdb\xb6\xad\x68\
+\xd3\xa6\x8d\x1c\x8d\x0e\x75\x5e\xfb\xf6\xed\xc5\x8b\x2f\xbe\x58\
+\xf2\xea\xab\xaf\x5e\x0a\x0b\x0b\xdb\x91\x90\x90\x10\x37\x7f\xfe\
+\xfc\xbf\xf3\x39\xd9\xd9\xd9\xb5\x0d\xd7\x49\x8e\x1f\x3f\xde\x64\
+\xfa\xf4\xe9\x21\xc3\x86\x0d\x4b\xc7\x3a\xde\xf2\xf3\xf3\x2b\x31\
+\xc2\xe5\xc9\xa1\xae\xa5\x2e\xa0\xc7\x92\xe0\xe0\xe0\x5c\xe8\xf4\
+\x7d\xe8\xa2\xe5\xe9\xd3\xa7\xeb\xc1\xbe\x6a\x15\xf3\xa1\x43\x87\
+\xb8\xee\xf5\x13\x13\x13\x9f\xc5\x7a\x6f\xc0\x5a\xdd\xe9\xd0\xa1\
+\x43\xa5\xf1\xba\xa3\x8f\x8e\x1d\x3b\x0a\x3c\x27\x37\x3a\x3a\xfa\
+\xfd\xd4\xd4\xd4\x47\xe1\x1f\xb5\x82\x7d\xc3\x86\x0d\xda\xde\xbd\
+\x7b\x1f\x7e\xeb\xad\xb7\x22\xb1\x2e\x79\xc0\x5d\xea\x0a\x37\x7f\
+\x6b\xdd\xba\xb5\x3c\xd4\x9a\x3a\x1e\x3c\x87\x7e\xc1\xdf\x95\x7f\
+\xb8\xd2\x05\x78\xa2\x18\x7c\x42\xbf\xe8\x4c\x9f\xf8\xf2\xcb\x2f\
+\x6b\x04\xb7\x9d\xcf\xb5\xf8\xf8\xf8\x27\xfa\xf5\xeb\xb7\x0c\x3e\
+\x7a\xcf\x6c\xae\x0a\x33\xf1\x81\xf7\x44\x64\x64\xa4\x98\x38\x71\
+\xa2\x58\xb8\x70\xa1\xd8\xb4\x69\x93\x48\x4f\x4f\x2f\x3b\xd6\xae\
+\x5d\x2b\xe6\xcc\x99\x23\xc6\x8f\x1f\x2f\xde\x7c\xf3\x4d\xda\x7b\
+\xd9\xf5\x66\xf7\xa6\xad\xe1\xbe\xe7\x3f\xfc\xf0\xc3\x84\x8d\x1b\
+\x37\x36\x5a\xb4\x68\x51\xb5\x62\xa7\xbf\x21\x3e\x69\x9f\x7d\xf6\
+\x59\xe0\x80\x01\x03\xfe\x03\x5c\x25\x46\xd8\x15\xc7\xbd\xf4\xd2\
+\x4b\x22\x36\x36\x56\x60\x6d\xc4\xaf\xbf\xfe\x2a\x6e\xde\xbc\x29\
+\x4a\x4b\x4b\x85\x2b\xb9\x77\xef\x9e\xb8\x74\xe9\x92\xf8\xfe\xfb\
+\xef\xc5\x82\x05\x0b\xc4\xa0\x41\x83\xc4\xf3\xcf\x3f\x2f\xef\x67\
+\xa6\x87\xc0\xc0\xc0\xa2\x3e\x7d\xfa\x24\x47\x44\x44\x34\xc4\xbc\
+\xaa\x05\x3b\xd7\xbc\x45\x8b\x16\xda\xbc\x79\xf3\x02\xc0\xc7\xa7\
+\xa8\x7b\xb3\xf9\x70\xad\x3f\xf9\xe4\x13\xf1\xd3\x4f\x3f\x89\xc2\
+\xc2\x42\x97\x78\x5d\x09\x75\x75\xf5\xea\x55\xb1\x7b\xf7\x6e\x01\
+\x7f\x77\xa9\x07\xf0\x42\x21\x78\x21\x09\xfc\xdb\x10\x76\xe9\x55\
+\xec\x58\x37\x39\x82\x6f\x02\xfb\xf6\xed\x7b\x4a\xf9\xab\x19\xfe\
+\xd0\xd0\x50\x31\x7b\xf6\x6c\xb1\x63\xc7\x0e\xb9\xee\xb7\x6e\xdd\
+\xaa\x70\xdd\x2b\x12\xe4\x14\xd2\x4f\x80\xcd\x34\xa6\x40\x07\x45\
+\xd0\x41\x32\xfc\xcc\xab\x3a\x80\xbd\x6b\xab\x57\xaf\x6e\x03\x5b\
+\x3c\x69\x84\x5d\xf1\x96\x23\x77\x71\xa4\x8d\x20\xcf\x11\xe0\x48\
+\x81\xd8\x2d\x8e\x1c\x39\x22\x7d\xa0\x2a\x52\x50\x50\x20\x3e\xfe\
+\xf8\x63\xc1\x9c\xc2\x48\x07\x88\xbb\x45\x58\xa3\xe4\xcc\xcc\xcc\
+\x86\xcc\x47\xaa\x2a\xc8\x65\xb4\xe5\xcb\x97\x3f\x02\xae\x5d\xed\
+\xeb\xeb\x6b\xba\xde\xc3\x87\x0f\x17\xf0\x3f\xd1\xbb\x77\x6f\xd1\
+\xa5\x4b\x17\x89\x9d\x3a\x68\xd5\xaa\x95\x3c\xf8\x39\x20\x20\x40\
+\x9e\x87\x79\x89\xf3\xe7\xcf\x57\xda\x26\xee\xde\xbd\x2b\xef\x81\
+\xfc\xd1\xd0\x1f\xf0\xfc\xa2\x77\xdf\x7d\x77\x5c\xb3\x66\xcd\x34\
+\xe4\xd5\x95\xc6\xbe\x62\xc5\x0a\xe9\xf7\xc8\x5d\x93\x11\x6f\x9c\
+\xf4\xcd\x67\x0f\x1d\x3a\x54\x9c\x3c\x79\x52\xf2\x16\xd7\xf6\xc2\
+\x85\x0b\xd2\xef\x77\xed\xda\x25\xf0\x6c\x31\x72\xe4\x48\x81\xfc\
+\x56\x9e\xaf\x6c\x84\x36\x64\xb1\x58\x04\xf8\x5a\x9c\x3d\x7b\xb6\
+\x52\x7a\x28\x29\x29\x11\xdb\xb6\x6d\x93\x1c\xab\xd7\x01\xe7\x09\
+\x1d\x9c\x81\x9d\x04\x12\x07\x31\x54\x46\x50\x9f\x68\xc9\xc9\xc9\
+\x41\xb0\xe1\x8b\x46\xd8\x11\x0b\xc4\xa9\x53\xa7\x5c\xce\x93\x7e\
+\x8b\x9c\x58\xac\x5c\xb9\x52\xae\x3d\xe3\x9a\xd2\x03\xef\x43\x7b\
+\xe1\x6f\x57\xae\x5c\xa9\x94\x0e\x50\x2b\x49\x3b\xd0\xcf\x8f\xf6\
+\x07\xbf\x3b\x02\x1d\x3d\xc1\x75\xf4\x54\x18\xeb\x0e\x1f\x3e\xdc\
+\x1c\xf1\x24\x53\xef\xf3\xc4\xce\x79\xff\xf8\xe3\x8f\x1e\xcd\x97\
+\x3c\x78\xe0\xc0\x01\x81\x78\x2d\x6d\x42\xf1\x06\xe7\x1a\x15\x15\
+\x25\xf6\xef\xdf\x2f\xed\xc8\x53\x1d\xd0\x17\xf4\x7c\xc0\xcf\x2f\
+\xbc\xf0\x42\x09\xee\x3b\x8a\x78\xf0\x6c\xb7\xb1\x23\x97\x97\xe3\
+\x8c\x19\x33\xe2\xf5\xba\xe5\x67\xe4\x3c\x92\xdb\x2b\x2b\x45\x45\
+\x45\x22\x27\x27\x47\x20\x77\x93\x9c\xa0\xec\x81\x9f\x99\x03\xa1\
+\x56\xf6\xe8\x7e\xa8\x95\xc5\xa4\x49\x93\x9c\x6c\x80\xff\x7e\xe3\
+\x8d\x37\x2e\xc0\x46\xda\x7b\xc2\x85\x58\x07\x0d\xeb\xd4\x72\xf0\
+\xe0\xc1\xb9\x46\xf7\x04\x27\x4a\x0c\x55\x15\xf2\xd8\x37\xdf\x7c\
+\x23\x10\xb3\x25\x27\x28\x3f\x46\xbd\x2c\x39\xc4\x13\x21\x8f\x30\
+\x6f\xd4\x73\x01\xed\x02\x39\x67\x2a\x4e\xf1\x71\xb7\x9f\x00\xae\
+\xd7\x30\x87\xde\xf0\xd5\x22\x47\xfc\xbc\x37\xf4\x29\x9f\xe5\x4d\
+\xa1\xef\x33\xd7\x23\x97\xa9\x18\x4a\xff\xa2\x6e\x3c\xe1\xc6\x2d\
+\x5b\xb6\xc8\x1c\x49\x6f\xaf\xc8\x0d\xcf\x22\x86\xfd\x13\x31\xb8\
+\x42\xec\xa8\x69\xb4\x73\xe7\xce\x35\x0e\x0f\x0f\x4f\xd7\xfb\x3d\
+\xfd\x74\xd5\xaa\x55\x5e\xc5\xae\xa4\xb8\xb8\x58\x72\x03\xf3\x1b\
+\xc5\x0b\xcc\x1d\xc8\x6f\xee\x72\x02\xe3\xcf\xa8\x51\xa3\x9c\x6c\
+\x00\x3c\x50\x8c\xba\x62\x24\xf1\xe1\x5e\x2e\xf1\x23\x6e\x92\xf3\
+\x5b\xb1\xef\x60\xb4\xf6\x8c\x6f\xd5\x29\x67\xce\x9c\x11\x63\xc7\
+\x8e\x2d\xf3\x07\xe4\xf6\xb2\x7e\xa0\x7e\xdc\x91\x8c\x8c\x0c\x59\
+\x23\x3b\xe2\xe7\xbd\x50\x9f\xef\xcf\xcf\xcf\x6f\x8c\xba\xcb\x14\
+\x3b\x2e\xd7\x60\x83\x5a\x4c\x4c\x4c\x2c\x74\xe6\xe4\xf7\xc8\xfd\
+\xab\x15\xbb\x12\xf2\x1f\xeb\x44\xa5\x03\xf2\xe2\xe6\xcd\x9b\xdd\
+\xf2\x05\x5e\x8b\x98\x55\xce\x06\x38\xf7\xd7\x5e\x7b\xed\x1a\xb0\
+\xfb\xb3\x6e\x37\x13\xc6\x3c\xd8\x47\x23\xe8\x6a\x8f\x1e\x3b\xe7\
+\xc0\x9a\xac\xa6\x04\x5c\x25\x12\x13\x13\xcb\x74\x40\x5f\xd8\xb7\
+\x6f\x9f\x5b\xd7\x32\xef\xd2\xe3\x67\xcc\x82\x5d\x85\x87\x84\x84\
+\x68\xb0\x61\x43\xfc\xcb\x96\x2d\xd3\x50\x87\x37\xef\xd9\xb3\x67\
+\x39\xde\xa7\x2f\x22\x16\x88\xeb\xd7\xaf\x57\x2f\x68\x9d\x50\x07\
+\x56\xab\xb5\xcc\xff\xc0\xcb\x02\xb1\xb9\xc2\xeb\xbe\xfb\xee\x3b\
+\xf6\x47\x9c\xb8\x0b\xb5\xf8\x5a\xfc\x5c\x1f\x3c\x69\x88\x1f\x35\
+\x0e\x8f\xd0\xe0\xe0\xe0\x62\x47\xfd\xf1\x33\x63\x5e\x6d\x08\xed\
+\x99\x7c\xc0\x39\xf0\x60\x3e\x7d\xf1\xe2\x45\x97\xd7\xfc\xf1\xc7\
+\x1f\xe4\xfc\x72\x36\x40\x3b\xc2\xba\x6e\x87\x6e\x1e\x40\xbe\x6e\
+\x88\x1f\x71\x98\x87\x05\xb6\x52\xae\x97\xc5\x6b\x37\x6e\xdc\x58\
+\x43\x88\x9d\xe5\xb7\xdf\x7e\x13\x03\x07\x0e\x94\x78\x38\x97\x59\
+\xb3\x66\xb9\xcc\x3f\xf8\x1b\x38\xac\x5c\xef\xc8\xce\xdf\xff\x45\
+\x6e\xf3\x2c\xea\x50\x27\xec\x27\x4e\x9c\x90\x23\xce\x19\xa6\xef\
+\x6d\x30\x87\x40\x2e\x5c\x83\x88\x9d\xe5\xe0\xc1\x83\xb2\xaf\x42\
+\x1c\xf4\x65\xc4\x69\x97\xe7\x23\x77\x15\x7a\x1b\x06\x07\xda\x52\
+\x52\x52\x7c\x8d\xfa\x64\x47\x8f\x1e\x95\xbd\xdc\xa4\xa4\xa4\x4d\
+\x8e\x75\x2e\xed\x80\xdc\x03\xfd\xd4\x0c\x50\x13\x21\xf7\x83\x9f\
+\x04\xe7\xc6\x75\x65\xed\x45\x3b\x37\x93\xcf\x3f\xff\xdc\x89\x03\
+\x91\xcb\xdb\xe0\x3f\xbe\xc8\x11\x9c\xf0\x83\x5b\x25\x7e\xd4\x26\
+\xdb\x1c\xf1\xf3\x1e\xf0\x1b\x91\x97\x97\x57\x73\x60\x4d\x84\xfc\
+\x3b\x7a\xf4\xe8\xb2\x9a\x69\xe9\xd2\xa5\xa6\xe7\xd2\x5f\xf5\xf8\
+\x91\xcf\xda\xfa\xf6\xed\xeb\x8b\x3c\xd9\x09\xff\xe2\xc5\x8b\x25\
+\x7e\xe4\xbd\xdb\x1c\xed\xff\xaf\x84\x9f\x42\x6e\x67\x4d\x46\x1d\
+\xbc\xfe\xfa\xeb\x32\x5f\x32\x12\x3d\x7e\x3b\x8f\xd9\x80\xcd\x17\
+\x87\x13\x7e\xe4\x99\x12\xff\x7b\xef\xbd\xf7\x97\xc6\x4f\x6e\x9b\
+\x3c\x79\x72\x59\x9f\x8d\x7d\x35\xa3\xbc\xc8\x08\x3f\x78\xcc\x06\
+\x2c\xbe\xcc\x01\xcc\xfc\x7f\xca\x94\x29\xdb\xf4\xfe\xcf\xbd\xc9\
+\x8a\xfa\x1c\x66\xc2\xdc\x9d\xbd\x2e\xf2\x07\xfb\xda\xac\xd7\xab\
+\x2a\xac\x0d\x91\x9f\x4b\x1b\x60\x9d\x84\xbc\xd6\xe9\x9c\x2f\xbe\
+\xf8\xc2\xc9\xfe\xbb\x74\xe9\x62\x1b\x3e\x7c\xb8\x2f\x38\xc0\x09\
+\x3f\xd6\x57\x8e\xe0\x86\x09\x8e\x75\x8f\xdd\x6f\x44\x76\x76\xb6\
+\xc7\xf3\xfc\xfd\xf7\xdf\x65\x1f\x9c\xfb\xbd\xac\xed\xc2\xc2\xc2\
+\x04\xf2\x0b\xf1\xe7\x9f\x7f\x56\x09\x3f\x6b\x01\xda\x80\xe2\x81\
+\xf5\xeb\xd7\x3b\x9d\x03\x9e\x77\xc2\x8f\xbc\xc6\x86\xf5\xf5\x9d\
+\x3e\x7d\xba\x73\xf0\xbf\x1f\xfb\x78\x58\x90\xfb\x97\x8b\xff\x7c\
+\xc6\xf6\xed\xdb\x3d\x9a\x23\x31\x32\x87\x57\x79\x8b\xea\x09\xb3\
+\x36\x61\xbf\xa6\xaa\xc2\x78\xcc\x9c\x9c\xbd\xd5\xb7\xdf\x7e\x5b\
+\xd8\x6c\xb6\x72\xfa\x41\x1d\xe7\x14\xff\xa1\xff\x1b\xbb\x76\xed\
+\x6a\x97\x95\x95\x65\x88\x9f\xf5\x71\x6a\x6a\xaa\x05\xf6\x5e\xaa\
+\xaf\xfd\xa8\x4f\x4f\x84\xf6\xc2\x3e\xb0\xbe\x7f\xc2\x39\xb1\x3e\
+\xe1\xbe\x46\x55\x84\x7d\x45\xe6\x82\xc4\x4f\xdb\x72\xcc\x8b\x99\
+\x37\xeb\x6b\x20\x1e\xc0\x95\x05\xfe\x6c\x62\x96\xff\xa5\xa5\xa5\
+\x69\xe0\x8d\x67\xba\x77\xef\x9e\xaf\xcf\xff\xd9\x93\x61\x9f\xc9\
+\x5d\xc9\xcc\xcc\x74\xaa\x43\x95\x1d\xd2\x77\xd9\x33\xae\xaa\x30\
+\xc6\xab\x7b\x2e\x5f\xbe\xbc\xec\x7b\xea\x42\xdf\xb7\xa3\x0d\xc3\
+\xb7\xb7\xe2\xe7\xfa\x88\x9b\x86\xf8\x57\xad\x5a\xa5\xe5\xe4\xe4\
+\x3c\x14\x19\x19\x79\x58\x3f\x67\x4f\x73\x20\xda\x27\xf3\x34\xa3\
+\xbe\x31\x73\x73\x57\xb9\x8b\xbb\xc2\xfe\x2b\x71\xd2\x06\x58\x23\
+\xa8\xbd\x36\xa5\x17\x7d\x0e\x8b\x9c\x38\x86\x38\x7f\xfe\xf9\x67\
+\x43\xfc\x88\xa5\x72\x84\x3f\x4d\x66\x1f\x49\xdf\x43\xf0\xa4\xf7\
+\xc3\x5e\xcc\x98\x31\x63\xe4\xdc\x94\x0e\xd4\xbe\x15\x7d\xa9\xaa\
+\xfb\x61\xea\x19\xac\x4b\xf9\x0c\xd6\x86\xec\xcd\xd0\x46\xc9\x07\
+\x8e\xbe\xcf\x67\xf6\xe8\xd1\xe3\xee\x8a\x15\x2b\x7a\x54\xd4\x0b\
+\x8f\x8e\x8e\xd6\x26\x4d\x9a\xd4\x15\xbe\x7b\x43\xef\x03\xdc\xc7\
+\xba\x71\xe3\x86\xdb\xf3\x3b\x7d\xfa\xb4\xd4\x01\xe3\x07\xed\x8f\
+\x7e\xca\x3a\xb2\x32\xbd\x7e\x23\xa1\x0e\x93\x93\x93\xe5\xdc\xd8\
+\xaf\x21\xe7\xb0\x47\xc1\x9e\x91\xde\xee\x06\x0d\x1a\x74\x1c\xbe\
+\xff\xd8\x57\x5f\x7d\xe5\x12\x3f\x62\x89\x06\x8e\x7c\xac\x5f\xbf\
+\x7e\x4e\x3e\x40\x1b\xe2\xbe\x8e\x27\xc2\x35\x42\x6e\x21\xbe\xfd\
+\xf6\x5b\xf1\xcb\x2f\xbf\xc8\x9e\xaf\x37\x85\xb1\x4f\xbd\x0b\xc0\
+\x77\x08\x3e\xfa\xe8\x23\x27\xde\xa3\x2d\x8f\x1f\x3f\x7e\x0a\x4e\
+\xd7\x90\x8b\xb8\xc4\x4f\x81\xad\x73\x9f\x7f\x24\xf8\xab\x44\xef\
+\xbb\xe4\xdc\x9a\xee\x83\xb8\x12\xf6\x4c\x55\xaf\x8e\x7b\x71\xdc\
+\x57\xd1\xf7\x7f\x61\xfb\x97\xa6\x4d\x9b\xd6\x2a\x21\x21\xa1\x42\
+\xec\x94\x75\xeb\xd6\xf1\x5d\xae\xe7\x58\x2f\xeb\xed\x88\xb9\xa1\
+\x37\xe2\xb7\xb7\x84\x36\xc5\xba\x58\xbd\x53\xa3\xe7\x3d\xce\x37\
+\x36\x36\x96\xbc\xdf\xd8\x8c\xf7\xf4\x02\x1f\x97\xb9\x30\xf7\x0d\
+\xf4\x7d\x50\xda\x00\xf2\x28\x71\xec\xd8\xb1\xda\x86\x2e\x85\xb9\
+\x35\xf3\x4b\xa3\x7d\x60\xea\x04\xbf\xd9\x56\xae\x5c\x19\x02\x4e\
+\x73\x0b\xbb\xa3\x0d\x80\x2b\x5a\x23\x56\x9d\x34\x8a\x61\xf4\x03\
+\x6f\xc4\xb0\xaa\x0a\x73\x1d\xd6\x00\x46\xf8\xfd\xfc\xfc\x18\x1f\
+\xe6\xe0\xb4\x07\x2f\x5f\xbe\xec\x11\x7e\xf6\xc9\xe1\xff\x1a\xea\
+\xc1\x91\x7c\xbf\xc6\x68\x1f\x8c\xf9\xad\x27\xf1\xa0\x3a\x84\x9c\
+\xaf\xec\x5f\x8f\x1f\xb5\xfe\xd9\xb9\x73\xe7\x3e\x0d\xdf\xf7\x08\
+\xbb\x92\xd9\xb3\x67\x6b\xbb\x77\xef\x6e\x08\x1d\xae\x31\xca\xe5\
+\xc8\xb9\x7c\x17\xa3\xb6\xf8\x90\xf9\x4f\xff\xfe\xfd\x0d\xf7\x3d\
+\x11\x73\x6f\x26\x26\x26\x8e\xc2\x69\xf5\x54\x5e\x53\x19\x61\xaf\
+\x08\x35\xc1\x73\xe0\xd0\x23\x46\xfe\x45\x1d\x70\x3f\x9b\xb5\x5e\
+\x4d\x09\xe3\xfe\xa1\x43\x87\xca\xf6\xca\x8c\xe2\x34\x72\xd8\xd4\
+\x05\x0b\x16\xf8\x8c\x18\x31\xa2\xd2\xd8\x29\xe0\x4e\x0d\x35\xa3\
+\x96\x94\x94\x14\x12\x1a\x1a\x7a\xd3\xec\x5d\x3f\x3c\x47\xe6\xdd\
+\xde\xc8\xeb\x5c\x09\xeb\x4a\xf6\x36\xb0\x1e\x86\x3e\xcf\xf5\xb0\
+\x58\x2c\xe9\xe0\xaf\x27\x61\x9b\x55\xc2\xae\xc4\xde\x1b\xf1\x41\
+\xcd\x3d\x1a\xb5\x91\xa1\x0e\x38\x17\xce\x89\xef\x72\x90\x93\xbc\
+\x2d\xd4\x2b\x6b\x26\x72\x0e\xd7\xd7\x0c\x3b\x72\xcc\x74\xe4\xa9\
+\x2d\x30\x4f\xed\x87\x1f\x7e\xf0\x0a\x7e\x8a\x7d\x6f\xcc\xc7\x6a\
+\xb5\x52\x07\xb7\xcc\x74\xc0\x78\xcb\xfd\x7c\xbe\x1f\xe1\x0d\x3d\
+\xb0\x5f\xc4\xfd\xf6\x4f\x3f\xfd\x94\xfd\x6b\xd3\x77\x63\x89\x1d\
+\xb5\x50\x3a\x38\xef\x49\xee\xdf\x57\x87\x50\x9f\x98\x92\x0f\x7c\
+\x61\x34\xe6\x72\xdd\xcc\x17\x98\x8f\x33\xe7\x64\x8f\x1a\xf5\x86\
+\x40\xde\x21\xeb\x12\x77\x7d\x83\x98\x59\x23\xb0\xe7\xcf\x7a\x81\
+\x7d\x4e\xa5\x5f\xa3\xe7\x91\x9b\x7b\xf6\xec\x99\x01\x3e\x68\x01\
+\x1f\xad\x16\xec\x4a\x72\x73\x73\xa9\x83\x07\xc6\x8d\x1b\x17\x08\
+\x7b\x3f\xcc\x67\x9b\xe9\x41\xad\x15\x73\x52\xbe\xfb\xc4\x77\x22\
+\xb9\x8f\xcb\x5a\x80\xef\x44\xb1\x3e\x52\x07\xb9\xe3\xeb\xaf\xbf\
+\x96\x7d\x3b\xee\x7b\x92\xdb\x98\x7b\xa9\xfe\x91\xd1\xfd\x79\x6f\
+\x7f\x7f\xff\x42\xd4\x7b\x5b\xa0\xa7\x16\xdc\xbb\xc7\x3d\xaa\x15\
+\xbf\x92\x79\xf3\xe6\xf1\xdd\xba\xa7\xc3\xc2\xc2\x96\x20\x3f\x28\
+\x74\xe7\xdd\x6f\xb5\x7f\xc5\x7a\x90\x31\x9b\x7d\x10\x75\xb0\x36\
+\x54\xef\x30\xa9\x73\x5d\xdd\x8f\xf6\x8e\xeb\xce\x81\x77\x63\xf6\
+\xee\xdd\xdb\x74\xd6\xac\x59\x35\x82\xdb\x51\x96\x2c\x59\xc2\xf7\
+\xce\x1b\xc5\xc4\xc4\x0c\x40\xad\x70\x82\xeb\xe5\xce\xdf\x3b\x54\
+\xf4\xb7\x1f\xae\xae\xb3\xff\x5d\x88\x2d\x22\x22\x62\x6b\x7c\x7c\
+\x7c\x1b\xd8\x62\xfd\x82\x82\x82\x1a\xc7\xae\x44\xd8\xdf\x87\x87\
+\x1e\xfe\x15\x17\x17\x37\x05\xb1\x27\x8f\x7f\xd3\xa3\xe6\x5b\x11\
+\x26\x77\x30\xab\xf5\x0e\x08\x08\xb8\x0d\x2e\xd8\x8a\x35\x0f\x5e\
+\xba\x74\x69\x43\x70\x6d\xa5\xdf\x6d\xf4\xb6\x70\xff\x94\x6b\x91\
+\x96\x96\xf6\x0c\x6a\xed\x7f\xc3\x1e\xb2\x10\x27\x0a\x99\x83\x3b\
+\x72\x81\xa7\x98\xb9\x8f\x1f\x14\x14\x54\x00\xfe\xd8\x8c\xfb\x86\
+\xc0\xce\x1b\x83\x7f\x6b\x1b\xae\xa9\x70\x1f\x81\x6b\xb2\x6f\xdf\
+\xbe\x47\x16\x2d\x5a\x14\x14\x1e\x1e\x1e\x83\x1c\x75\x27\x78\xe2\
+\x0a\x7c\xdc\x86\xb8\x50\x48\x3f\x61\x7c\x20\x77\x32\x5e\xf2\x33\
+\x7d\x1f\x47\x09\xbe\xe3\x1e\xcd\x1d\xd4\x98\xd9\xfc\x9b\x1a\xe4\
+\x5f\x51\xe4\x19\xf0\xe5\x83\xb5\x8d\xcd\x53\x51\xbe\x91\x9f\x9f\
+\xdf\x20\x2b\x2b\xab\x15\x78\xba\x03\xf2\x97\x88\x99\x33\x67\xce\
+\xc7\x5a\xa6\x44\x45\x45\xa5\x20\x5e\xa7\x44\x47\x47\xa7\x4c\x98\
+\x30\x61\x3e\x38\xdc\x8a\x7a\xb5\x13\x7e\xf7\x45\xdd\xf1\x38\xae\
+\xad\xa7\xee\x51\x27\x75\x52\x27\xde\x17\x37\xd2\x51\x6b\x3d\x39\
+\x14\x6b\x5a\x00\xc7\xeb\x9a\xd6\x94\x63\x96\xa6\xc9\x1f\xec\x77\
+\x29\xe5\x38\x51\x9e\xa6\x69\x2d\x85\xb8\xcb\xb1\xa9\x3c\x5d\xd3\
+\x1a\x08\x91\xc7\xd1\x47\x5e\x26\x2f\xb4\x3a\x8e\x9a\xf2\xf0\x89\
+\xa5\xe5\xc7\x80\xe2\xfb\x63\x4b\x35\xde\x2d\x3f\x36\x55\xe3\xf5\
+\xf2\x63\x03\xb3\x31\xcf\xcd\xb1\xa2\xfb\xa8\xe7\xe9\xe7\xa1\xe6\
+\xa7\x9f\xb7\x7d\x0c\x50\xb8\x14\xde\xb2\xd1\x2a\xc7\xff\xeb\x47\
+\x8e\x3e\x76\xbd\x35\xb0\xeb\xb1\xa9\x5d\xaf\x2d\xed\xfa\x0e\xb0\
+\xeb\x7f\xa2\xc3\x7a\xe4\xc9\xd3\xe5\x42\xb4\xbc\xbf\x7e\xae\x16\
+\xf9\x7f\xc9\xfd\x6d\x6a\
+\x00\x00\x08\x6a\
+\x00\
+\x00\x69\x06\x78\x9c\xed\x5c\x3b\x92\xdb\x38\x10\x05\x49\x51\x14\
+\xc5\x9f\x94\x38\x9d\x74\x83\xcd\x7c\x80\xf1\x05\x7c\x00\x5f\xc0\
+\xb5\xb9\x0f\x30\xba\x80\x53\x57\xf9\x02\xbe\x80\x2f\xa0\x0b\xf8\
+\x00\xce\x14\x39\x56\x95\x93\x09\x54\x33\x4b\x51\x20\x88\x06\xba\
+\xf1\x21\xc1\x19\xbb\x8a\x6f\x6b\xed\xaa\x67\x09\x7a\xec\x6e\x34\
+\x9a\x60\x83\x8c\x45\xed\x7f\x5f\xbe\xb0\xf6\xcf\x0d\x3b\xff\xc7\
+\xd8\x1b\xc6\xd8\x3f\xed\xff\x2d\xc5\xfe\x8d\x6e\xbc\x09\x6f\xdf\
+\xbe\x65\xef\xde\xbd\x63\xef\xdf\xbf\x67\x1f\x3e\x7c\x60\x1f\x3f\
+\x7e\x64\x9f\x3e\x7d\x62\x87\xc3\x81\x7d\xfe\xfc\x99\x7d\xfd\xfa\
+\x95\x7d\xfb\xf6\x8d\x7d\xff\xfe\x9d\x1d\x8f\x47\xf6\xe3\xc7\x0f\
+\xf6\xf3\xe7\x4f\xf6\xeb\xd7\x2f\xf6\xfb\xf7\x6f\xf6\xfc\xfc\x6c\
+\x1c\x7f\xc1\x82\x05\x0b\x16\x2c\x58\xb0\x60\x81\x0b\xea\x2a\xcf\
+\xd7\x69\x9a\x26\x51\x14\x25\xed\xdf\x59\x9e\x57\xf5\x2b\x4b\xda\
+\x66\xab\x08\xc7\x2a\xdb\xbe\x8e\xb8\xa6\x58\xc7\x84\xa6\x1e\xf1\
+\xba\x68\x5e\x58\xd4\x96\xb2\x93\x66\xb7\xed\xcb\x49\x2b\x52\x47\
+\x51\x37\xa4\xc5\x4b\x88\x6a\x36\x36\xf7\x21\x0e\xdd\xcc\x6d\xb4\
+\x26\xf3\x16\x75\x43\x36\xa7\xb2\xd1\xaa\xe6\x55\xb6\x99\xa0\xea\
+\x0a\xf3\xdd\xe9\x58\x14\xfe\x71\xa5\x22\x0e\x3f\x03\x1a\xbf\x39\
+\x48\x21\x0d\xec\xcc\xed\x74\x63\xdd\x10\x6f\x43\xca\x0a\x63\xac\
+\x1b\xd2\x60\xaa\x2a\xa3\xb1\x92\x34\x2f\xaa\x7a\xdf\xa3\xae\x8a\
+\xbc\x5b\xc3\x69\x93\x55\x61\x64\x6d\xe9\x9f\x58\x6d\xca\xdd\x1e\
+\xc3\xae\xdc\x18\x56\xaa\x20\xbe\x24\x73\x56\xbb\xf4\xa1\x9a\x7a\
+\x18\x16\xd1\x6c\xba\x2c\x62\xec\x24\x37\x8b\xe2\xd2\x72\xc2\xa3\
+\x93\x83\x0c\x97\x95\x16\x0e\xa2\x6e\x20\x16\xf9\xd5\x0c\xb2\xd2\
+\xca\x59\xd5\x15\x15\xaa\x6c\x92\x30\x4c\x56\xe2\xa7\xaa\x53\x86\
+\x79\x73\x82\x30\x44\x56\xbc\xf5\x16\xb5\xdd\xa4\xa8\xd9\x47\x0b\
+\x43\x46\x4b\x5d\xa2\x5d\xa0\x2e\x32\x53\x26\x1b\x29\x4c\x0f\x0b\
+\x1f\x63\xed\xcc\x9a\x3a\xac\xc7\xc8\xd2\xf3\xd6\xaa\xb6\xcb\xe9\
+\x45\xad\x6d\x9a\x3a\x8c\xc8\x63\x85\x3e\x08\x9e\xda\x75\x94\x6e\
+\xa2\xae\xf0\x2e\x7c\x6a\x6d\x88\xdc\x4d\x14\x99\x4a\x71\xf8\xde\
+\x64\x6a\x83\xbb\x65\xd2\x1a\x5d\xb5\xda\x7b\xf0\xa2\xea\xd2\x8b\
+\xe6\x85\xc4\x4f\x96\xe6\x09\x27\x59\x48\x06\x4d\xf3\x12\x4c\x61\
+\x4d\x98\x57\xec\x97\x63\x64\xd5\xaa\xaa\xd5\x06\x49\xc1\x9a\xb0\
+\xd2\x43\x97\x5a\x70\x39\xc8\x52\xef\x95\xc8\x6a\x43\x15\x16\x8f\
+\xf7\xa2\x5d\xd6\x2e\x07\x97\x62\xac\x36\x54\x61\xce\x9e\xac\x94\
+\x2f\x6e\xac\xb2\xe0\x02\x98\x96\xe6\x4f\xab\x73\xc3\xb5\x7e\x55\
+\xe6\xe2\xda\x6a\x2c\x60\xdf\xcc\xbe\x54\x29\x81\xe8\x38\x27\x73\
+\xe5\x5b\xb6\x74\x5a\xca\x2e\x74\x50\xd5\x5e\x88\x72\xe5\xb9\x93\
+\x2e\x25\xe8\x2d\x8b\xcf\x4e\xbe\x0b\x77\x52\xd5\x42\xc9\xda\x4e\
+\xa1\xaf\x98\xcb\x92\xe6\x6b\xa9\xe8\xf0\xa8\x17\xd5\x1f\xf1\x36\
+\xd7\xca\x3c\xbe\xb4\x39\x10\xbb\xd7\xd6\x2d\x60\x0d\xe5\x60\x30\
+\xe5\x4a\xcc\x5e\x94\x66\xd6\xc6\x75\x55\xbf\x41\xf1\xa4\xdd\x60\
+\xd0\x5c\x46\x2f\xee\x86\x8b\xf6\x2f\xae\xe1\xf5\x5b\x0d\x06\x93\
+\x5e\x6c\x32\x82\x14\x5a\x6b\x3f\x63\x75\x17\x05\x0d\x60\x2b\x78\
+\xa0\xdf\x4d\x21\x53\x8b\x81\xfd\x22\xab\x07\xb4\x80\xa5\xa6\x86\
+\x6e\x4f\x0c\xc3\x0e\x59\xcb\xbd\x8c\x85\x80\x49\xcc\x5c\x88\xc1\
+\x25\xc2\x60\x87\xe1\x6a\x47\xf8\x50\x1d\xe2\x0a\x73\x49\x0d\x57\
+\x5f\x97\x31\x1d\xcb\x58\x0c\xc0\x60\xc6\xc8\x87\x75\x17\xfd\x93\
+\x83\xac\x51\xa1\xc5\x01\xa7\xa4\xa9\x0e\x83\x6e\x24\x1d\x24\x64\
+\xc5\x23\x43\xeb\x86\x9d\xb3\x23\x81\x1b\x33\x6a\xbc\x3a\x8c\x2c\
+\xa5\xe0\x31\x38\x12\xce\x46\xaa\x8a\x12\x09\x62\xaa\xac\x3d\x0c\
+\x1b\x7a\x46\x02\x87\xc7\xc4\x60\xbb\x60\xb2\xf6\x7b\xe0\x1f\x7a\
+\x2d\x02\xf5\x1a\xe1\x46\xb1\xf8\x04\x90\x05\x1d\x49\xef\xd5\xb9\
+\xb8\x71\x1d\x50\x96\xe2\x48\x4a\x16\xac\xeb\xf1\x91\xf2\x90\xb2\
+\xf6\x7b\xf0\x8b\x54\x9d\x0f\x36\x9e\x53\x74\x1c\x21\xdd\x72\x6b\
+\xe1\x0a\x10\x39\xd4\x36\x35\xf0\x36\x9a\x54\x45\xcc\x4f\x49\xa7\
+\x32\xc0\x4c\xa3\x32\x18\x10\x8f\x16\x54\xfd\x27\xc8\xd4\xe6\x0b\
+\x10\x3a\x54\xe0\x03\x67\x63\xc9\xbe\x77\xb4\xa5\xb8\xf6\x00\x4c\
+\xf9\x0e\xba\xb0\xec\xd5\xa7\x5d\x63\xb5\xe8\x89\xd8\xae\x0b\xda\
+\x14\x19\xa3\xcf\x5c\xfe\x1b\xd2\x34\x60\xec\xd8\x75\x21\xf7\xfe\
+\x5b\xfa\x9f\xc6\x63\x63\xd7\x05\xd2\x84\x3e\x1d\x9b\x38\x74\x70\
+\x5d\x01\x26\x24\x9e\x28\xc0\x47\xf4\x44\xd0\x27\xfa\x30\x09\xb5\
+\x07\x28\x5a\xf1\x15\x12\xe8\xd2\x62\xa8\xf7\xf2\x84\xfa\x14\x43\
+\x35\x55\x57\x32\x87\x17\x9d\x74\x65\x26\x5d\x5b\x4a\x6f\x48\x5d\
+\x78\xc2\x37\xa5\xfb\x7e\x01\x0a\x96\xe8\x51\x5d\x78\xc2\x37\xe9\
+\xe2\x3e\x0e\x99\x51\x43\xe8\xea\xcd\x15\x38\xe8\xdd\x74\x19\xe2\
+\x9e\xff\x93\x75\xeb\x70\xa2\x2e\xdf\xf9\xd8\x9b\x2b\x54\x75\x13\
+\x4a\x17\x9f\x8c\xa6\xed\x8a\x97\xd2\x05\x22\x29\x99\xcd\x5c\x70\
+\x1d\xc2\x75\x95\x94\xae\x62\x3e\x73\x41\x5d\xf8\x56\x00\x59\xe7\
+\xa4\x88\x09\x43\x01\x6c\xfd\xe3\xf5\x44\x23\x7f\x44\x5a\x6f\x38\
+\x1f\x3e\x77\x5d\x01\xf6\x01\x89\x26\x2c\xf9\x23\xd2\x6d\x1a\x2f\
+\x91\x82\xa7\xfa\x0e\xe0\x37\x71\x59\x70\x0f\x73\x28\x67\x78\xd4\
+\x7b\x75\x02\xb8\x02\xec\x88\x50\xcf\x63\x80\xaf\xc5\xe4\x2b\xf5\
+\x80\x0b\x07\x50\x7e\x51\xf7\x43\xf0\x66\xae\xff\x6a\xa6\xe8\x0c\
+\x0a\x78\xcb\x4a\xe8\x02\x89\x42\x64\x05\x9e\xeb\x67\x89\x7a\xb8\
+\x95\x49\xed\x18\x82\x09\xd9\xc7\x53\x39\x67\xd4\x2b\xbf\x48\xe8\
+\x82\x0f\x1e\x79\x6f\x09\x9f\x8d\x81\xf6\x23\x14\x80\x5b\x1d\xfa\
+\x31\x24\xf0\x36\xcf\x60\x5c\xeb\x2c\xb2\x60\xf6\xa2\x37\x58\xe1\
+\x8e\x7a\xe7\x48\x6e\x69\xeb\x33\xdb\x51\x80\x6e\x34\x3c\x8a\x01\
+\x9f\xeb\x1c\xc9\xa5\xce\x33\x1b\x61\x47\x25\x2d\x0b\x66\xd6\x6e\
+\x46\x66\x92\xed\x82\x03\xc4\xb3\xe9\x09\x11\xbc\x80\x4a\x7c\x75\
+\x96\x52\x02\xd6\x5e\xc6\xe6\x51\xe8\xf0\xb5\x88\x80\x79\xb2\x04\
+\x6c\xd3\x30\x76\x4e\xc3\xc7\x7c\x4d\x9f\xbd\x66\x09\x2f\x68\x04\
+\xf3\x83\x3e\xe5\x19\x57\x5f\xb6\x85\xdd\x93\xe0\x50\x9e\xdd\x19\
+\x75\x29\x8f\x91\x1b\x6e\xea\x39\x64\x41\x73\xd9\x1e\x24\xc3\x8b\
+\x58\xdf\xfc\x1a\x7a\x53\xa2\x03\x8c\x2e\x5b\x47\x9f\xde\x27\x17\
+\xcd\x13\xf6\x4a\x13\x90\xf5\xbc\x00\xd6\x9c\x3b\x47\x65\x0f\x67\
+\x98\xbd\x5f\x5a\x6d\x66\xea\x62\x32\xbc\x2c\xa5\x4d\xc3\xa1\xa5\
+\x09\x31\x58\xe8\xcd\x25\xad\xad\xc3\xa5\xbd\x1c\x31\x58\xf8\x34\
+\xa1\xb4\x12\x3b\x75\x80\xe9\x06\x0b\x2e\x4b\x39\x89\xe4\xd6\x8d\
+\xaf\x4f\xc9\xd0\xb2\xd4\x4e\x3e\xc7\x26\x56\xed\x5c\x55\x60\x59\
+\xb5\xd2\x61\xe6\x7c\x0e\x4b\x6d\xc7\x0c\x7b\xcf\xa1\x74\xe6\x78\
+\x34\x64\xaa\xed\xab\xab\x90\xc2\x76\x6a\xfb\xbc\x47\x03\xab\xda\
+\x28\x1a\x50\x98\x26\xcb\xab\xe1\x57\xf5\x64\x30\x61\x9a\x2c\x8f\
+\xb6\x5a\xc4\x93\xa1\x84\x69\xb2\xbc\xda\x90\x19\x32\x27\x83\x08\
+\x6b\x34\x59\xde\x67\x22\xb5\x11\x02\x74\x00\xa8\x09\x62\xd4\x11\
+\x0f\x6d\x8c\x71\x6d\x71\x12\xf4\x23\x10\x7e\xc1\x75\x83\x7e\x71\
+\xee\x27\x29\x30\xec\xf4\x23\x03\xf1\xa8\x23\xf1\x5a\xec\x8f\x3a\
+\xd3\xd4\x03\x3b\xdb\xe4\x19\xf3\x3d\x74\xbb\x7b\xb7\xa9\x0a\x63\
+\x61\x67\x86\x47\x9f\xb6\xc5\x84\x25\x63\xa2\xac\xc0\xce\xa2\x4c\
+\x38\x04\x8c\x09\xf3\x3d\x36\x47\x1d\x9c\x9b\x74\x36\x19\x15\xe6\
+\xa7\x0c\x57\x35\x4d\x16\x25\xac\xf5\xa6\x5b\x9c\xed\x50\x0f\x4e\
+\x97\x45\x1f\xfa\x8d\x33\xfb\x16\x62\x99\x51\x5f\x0e\x70\xf4\xb7\
+\x26\xcf\x4f\xb5\xd2\x68\xab\xed\x48\x51\xad\xb5\xc3\xbc\xca\xc3\
+\x74\x7a\x7b\xb5\x29\xf4\x60\xab\x0a\xd3\x69\xe4\x70\x27\xb8\x73\
+\xc3\x8f\x74\xd7\x9f\xae\xf3\x1e\x6b\xf3\xe1\xed\xc8\xf5\x34\x87\
+\x13\xd0\x83\xa8\xe3\x90\x04\x3a\x55\xce\x31\xf5\x1d\x0f\x3d\x82\
+\xbf\xeb\x21\x88\xc9\x02\x1b\xeb\x86\x9c\x9c\x5f\x8e\x88\x03\x46\
+\x96\x8c\x49\xaf\x11\x99\xf5\x15\x27\x13\x94\xcd\xfa\xe2\x95\xd1\
+\xca\x66\x56\xd5\x61\xeb\x3b\x03\x92\xa0\xef\xe8\x30\xa0\xa2\x97\
+\x18\x0d\x71\x36\xc7\x1c\x24\x51\xda\x4f\x8d\x5f\x2d\x95\x8d\x2c\
+\x95\xa7\xa0\xde\x1a\xdf\x68\x15\xaf\x5f\xe9\x4d\x5b\x57\x34\x65\
+\xbb\x20\x6a\x92\xda\xe5\xb2\x7c\xe1\x37\x6c\xe1\xa8\xab\xaa\x2a\
+\xda\x45\xbb\x68\xff\xfe\x23\x04\x2d\x58\xb0\x60\xc1\x82\xbf\x04\
+\xcf\x1a\x2e\x7f\x0d\x77\x64\x91\xca\x3d\xb6\x97\xd4\x28\xdc\x61\
+\xb8\xce\x8b\xf8\xfb\x8a\x3b\xc0\x9d\x3b\x2e\x03\xdc\x41\x32\x12\
+\xe7\x9e\xb8\xe1\xee\x25\xee\x91\x73\x8d\xc4\x9d\x39\x97\x49\xdc\
+\x91\x73\x91\xc4\x09\x4f\x3c\x08\xee\x49\x70\xf7\x82\xbb\x08\xee\
+\x4e\x70\x67\xc1\x65\x82\x3b\x09\x2e\x11\xdc\x51\x70\x91\xe0\x0e\
+\x20\x04\x6e\x9c\x14\x16\x0f\x9c\x7b\x92\xb8\x7b\xce\x5d\x24\xee\
+\x8e\x73\x67\x89\xcb\x0c\xdc\x49\xe2\x12\xce\x1d\x25\x2e\xe2\x9c\
+\x24\xef\x2a\xf0\xa2\xbd\x73\xff\x81\xe4\x9e\x00\x77\xdf\x71\x17\
+\xc0\xdd\x91\xdc\x23\xe0\x9a\x8e\x3b\x03\x2e\x23\xb9\x13\xe0\x12\
+\x92\x3b\x02\x2e\x22\xb9\x03\xe0\x18\xc9\x41\x8a\x3d\x10\xdc\x93\
+\xc2\xdd\x7b\x70\x17\x85\xbb\xf3\xe0\x1e\x15\xae\x99\xc8\x9d\x15\
+\x2e\x7b\x21\xee\xa4\x70\xc9\xc2\x4d\xe6\x5e\xcb\x97\x53\xe2\x6f\
+\xca\x5c\xc0\x38\xd7\x39\xe8\x3a\xcf\x51\xee\x00\x39\x32\x97\x1c\
+\x01\x45\xe7\xa6\x13\xe0\xe8\x5c\x87\xe5\x49\x2c\xc7\x62\x1c\x96\
+\x9f\xb1\xdc\x8e\x71\xe8\x5a\x71\x90\x39\xc3\xda\x83\x71\xf2\xc5\
+\x25\x86\xf5\x4d\xbe\x90\xc6\xb0\x5e\x62\xeb\x2a\xb6\xfe\xa2\xeb\
+\xf4\x20\x70\x58\xcf\xb1\x5a\x60\x10\xd3\x18\xeb\x08\xac\x06\x19\
+\x7e\x58\xaa\x55\x7a\x2b\x24\x96\x3a\xe7\x22\xfd\x84\xa8\xa5\xa4\
+\x9f\x10\xdc\x69\x18\x4e\x70\x8f\x42\xb1\x54\xc3\x0d\x5f\x1d\xb8\
+\x93\xf8\xea\xc0\x3d\x31\x5e\x99\xc9\x75\xe2\x85\x57\x7a\x7f\x42\
+\xcd\x1a\x8a\xfb\x1f\xa7\x3b\xd1\x3c\
 "
 
 qt_resource_name = b"\
@@ -1218,10 +1443,6 @@ qt_resource_name = b"\
 \x00\x71\
 \x00\x67\x00\x69\x00\x73\x00\x2d\x00\x73\x00\x74\x00\x72\x00\x75\x00\x63\x00\x74\x00\x75\x00\x72\x00\x61\x00\x6c\x00\x2d\x00\x67\
 \x00\x65\x00\x6f\x00\x6c\x00\x6f\x00\x67\x00\x79\
-\x00\x0e\
-\x0f\x68\x39\xbf\
-\x00\x70\
-\x00\x6c\x00\x61\x00\x6e\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x69\x00\x63\x00\x6f\
 \x00\x0d\
 \x00\x68\x25\xdf\
 \x00\x6c\
@@ -1230,15 +1451,25 @@ qt_resource_name = b"\
 \x0b\xdf\x39\x9f\
 \x00\x73\
 \x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x11\
+\x0c\xf3\x0b\x1f\
+\x00\x70\
+\x00\x6f\x00\x6c\x00\x65\x00\x5f\x00\x74\x00\x6f\x00\x5f\x00\x70\x00\x6c\x00\x61\x00\x6e\x00\x65\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\
+\x00\x0e\
+\x0f\x68\x39\xbf\
+\x00\x70\
+\x00\x6c\x00\x61\x00\x6e\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x69\x00\x63\x00\x6f\
 "
 
 qt_resource_struct_v1 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x03\x00\x00\x00\x03\
-\x00\x00\x00\x6a\x00\x01\x00\x00\x00\x01\x00\x00\x08\x6e\
-\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x10\xa7\
+\x00\x00\x00\x14\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
 \x00\x00\x00\x48\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x00\x08\x39\
+\x00\x00\x00\x86\x00\x01\x00\x00\x00\x01\x00\x00\x41\xf3\
+\x00\x00\x00\xae\x00\x01\x00\x00\x00\x01\x00\x00\x4f\xde\
 "
 
 qt_resource_struct_v2 = b"\
@@ -1246,14 +1477,16 @@ qt_resource_struct_v2 = b"\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x03\x00\x00\x00\x03\
+\x00\x00\x00\x14\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x6a\x00\x01\x00\x00\x00\x01\x00\x00\x08\x6e\
-\x00\x00\x01\x7e\x97\x17\x2f\x93\
-\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x10\xa7\
-\x00\x00\x01\x7e\x97\x1b\xfc\xb7\
 \x00\x00\x00\x48\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x7e\x97\x18\x5e\xe8\
+\x00\x00\x01\x88\xd5\x1c\x2e\xb0\
+\x00\x00\x00\x68\x00\x00\x00\x00\x00\x01\x00\x00\x08\x39\
+\x00\x00\x01\x88\xd5\x1c\x2e\xb0\
+\x00\x00\x00\x86\x00\x01\x00\x00\x00\x01\x00\x00\x41\xf3\
+\x00\x00\x01\x88\xd5\x1c\x2e\xb0\
+\x00\x00\x00\xae\x00\x01\x00\x00\x00\x01\x00\x00\x4f\xde\
+\x00\x00\x01\x88\xd5\x1c\x2e\xb0\
 "
 
 qt_version = [int(v) for v in QtCore.qVersion().split('.')]
@@ -0,0 +1,169 @@
+"""
+Detection of the orientation fields of the layers.
+
+The field names of a layer are matched against a table of aliases
+for each orientation role, ignoring case, spaces and punctuation,
+so that "Dip Direction", "DIP_DIR" and "dipdir" all name the dip direction.
+The result is cached per layer until its fields change.
+"""
+import re
+import threading
+
+# aliases of the orientation fields, by decreasing priority
+FIELD_ALIASES = {
+    "trend": (
+        "trend",
+        "trd",
+        "plunge_direction",
+        "plunge_dir",
+        "plunge_azimuth",
+        "lineation_trend",
+    ),
+    "plunge": ("plunge", "plg", "lineation_plunge"),
+    "strike": ("strike", "strike_rhr", "rhr_strike", "stk", "str"),
+    "dip": ("dip_angle", "dip", "dip_ang", "inclination"),
+    "dip_dir": (
+        "dip_dir",
+        "dip_direction",
+        "dip_azimuth",
+        "dip_az",
+        "azimuth_of_dip",
+        "dd",
+    ),
+}
+
+
+def normalize_field_name(name):
+    """
+    Key of a field name in the alias table:
+    lower case without spaces or punctuation
+    """
+    return re.sub(r"[\W_]+", "", name).lower()
+
+
+def alias_lookup(aliases):
+    """
+    Map the normalized aliases of a table to their (role, priority)
+    """
+    lookup = {}
+    for role, names in aliases.items():
+        for priority, name in enumerate(names):
+            lookup.setdefault(normalize_field_name(name), (role, priority))
+    return lookup
+
+
+class LayerSchema:
+    """
+    Orientation fields of a layer, by role. Roles which no field
+    of the layer matches are missing from fields.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    @classmethod
+    def resolve(cls, field_names, lookup):
+        """
+        Match field_names against a lookup made by alias_lookup,
+        keeping for each role the field of the highest priority alias
+        """
+        best = {}
+        for name in field_names:
+            match = lookup.get(normalize_field_name(name))
+            if match is None:
+                continue
+            role, priority = match
+            if role not in best or priority < best[role][0]:
+                best[role] = (priority, name)
+        return cls({role: name for role, (_, name) in best.items()})
+
+    def field(self, role):
+        return self.fields.get(role)
+
+    def planar_format(self):
+        """
+        "strike" or "dip_dir" if the layer has the fields of planes in
+        strike/dip or dip direction/dip format, strike first, None otherwise
+        """
+        if "dip" not in self.fields:
+            return None
+        if "strike" in self.fields:
+            return "strike"
+        if "dip_dir" in self.fields:
+            return "dip_dir"
+        return None
+
+    def has_lines(self):
+        return "trend" in self.fields and "plunge" in self.fields
+
+
+class SchemaCache:
+    """
+    LayerSchema of the layers, keyed on the layer id and dropped
+    when the fields of the layer change or the layer is deleted
+    """
+
+    def __init__(self, aliases=None):
+        self._lock = threading.Lock()
+        self._schemas = {}
+        self._connections = {}
+        self.set_aliases(FIELD_ALIASES if aliases is None else aliases)
+
+    def set_aliases(self, aliases):
+        """
+        Replace the alias table, which resolves all the layers again
+        """
+        with self._lock:
+            self.aliases = aliases
+            self._lookup = alias_lookup(aliases)
+            self._schemas.clear()
+
+    def schema(self, layer):
+        """
+        LayerSchema of a vector layer, resolved on first use
+        """
+        layer_id = layer.id()
+        with self._lock:
+            schema = self._schemas.get(layer_id)
+            lookup = self._lookup
+        if schema is not None:
+            return schema
+
+        if layer_id not in self._connections:
+            connections = [
+                (layer.updatedFields, lambda: self.invalidate(layer_id)),
+                (layer.willBeDeleted, lambda: self.forget(layer_id)),
+            ]
+            for signal, slot in connections:
+                signal.connect(slot)
+            self._connections[layer_id] = connections
+
+        schema = LayerSchema.resolve(layer.fields().names(), lookup)
+        with self._lock:
+            self._schemas[layer_id] = schema
+        return schema
+
+    def invalidate(self, layer_id):
+        with self._lock:
+            self._schemas.pop(layer_id, None)
+
+    def forget(self, layer_id):
+        """
+        Drop the schema of a layer which is being deleted
+        """
+        self.invalidate(layer_id)
+        self._connections.pop(layer_id, None)
+
+    def clear(self):
+        """
+        Drop all schemas and stop tracking the layers
+        """
+        for connections in self._connections.values():
+            for signal, slot in connections:
+                try:
+                    signal.disconnect(slot)
+                except (RuntimeError, TypeError):
+                    pass
+        self._connections.clear()
+        with self._lock:
+            self._schemas.clear()
@@ -0,0 +1,257 @@
+from qgis.PyQt.QtGui import QColor
+from qgis.gui import QgsFieldComboBox
+from qgis.PyQt.QtWidgets import QDialog, QDialogButtonBox, QButtonGroup
+
+from .stereoplot import info
+from .ui_settings_dialog import Ui_SettingsDialog
+
+
+class SettingsDialog(QDialog, Ui_SettingsDialog):
+    def __init__(self, options: dict, iface, parent=None):
+        """
+        Setup the SettingsDialog according to the options provided.
+        The dialog can be shown again after refresh() with the current options.
+        """
+        self.iface = iface  # alias the iface
+
+        # setup parent class
+        super(SettingsDialog, self).__init__(parent)
+        self.setupUi(self)
+
+        self.planar_data_group = QButtonGroup(self)
+        self.planar_data_group.addButton(self.use_dip_dir_radio)
+        self.planar_data_group.addButton(self.use_strike_radio)
+        self.planar_data_group.setExclusive(True)
+        self.planar_data_group.buttonClicked.connect(self.toggle_planar_data_format)
+
+        self.marker_group = QButtonGroup(self)
+        self.marker_group.addButton(self.color_by_single_color_radio)
+        self.marker_group.addButton(self.color_by_data_field_radio)
+        self.marker_group.setExclusive(True)
+        self.marker_group.buttonClicked.connect(self.toggle_marker_color)
+
+        self.marker_cmap_center_checkbox.clicked.connect(self.toggle_marker_cmap_center)
+        self.contour_checkbox.stateChanged.connect(self.toggle_contour)
+
+        # ------------------------
+        # SAVE or REJECT settings
+        # ------------------------
+        self.button_box.clicked.connect(self.save_or_reject_settings)
+
+        self.refresh(options)
+
+    def refresh(self, options: dict):
+        """
+        Show the values of options in the widgets,
+        and the fields of the current layer in the field combo boxes
+        """
+        self.options = options
+
+        # GENERAL tab
+        self.init_field_combobox(self.trend_field, options["trend_field"])
+        self.init_field_combobox(self.plunge_field, options["plunge_field"])
+        self.init_field_combobox(self.dip_dir_field, options["dip_dir_field"])
+        self.init_field_combobox(self.dip_angle_field, options["dip_angle_field"])
+        self.init_field_combobox(self.strike_field, options["strike_field"])
+
+        self.use_dip_dir_radio.setChecked(options["use_dip_dir"])
+        self.use_strike_radio.setChecked(not options["use_dip_dir"])
+        self.toggle_planar_data_format()
+
+        self.plot_mean_plane_checkbox.setChecked(options["plot_mean_plane"])
+        self.plot_intersection_point_checkbox.setChecked(
+            options["plot_intersection_point"]
+        )
+        self.float32_storage_checkbox.setChecked(options["float32_storage"])
+        self.profile_next_plot_checkbox.setChecked(options["profile_next_plot"])
+
+        # MARKER tab
+        index = self.marker_combobox.findText(options["marker"])
+        self.marker_combobox.setCurrentIndex(index)
+        self.marker_size_spinbox.setValue(options["marker_size"])
+        self.marker_raster_threshold_spinbox.setValue(
+            options["marker_raster_threshold"]
+        )
+        self.marker_colorbutton.setColor(QColor(options["marker_color"]))
+
+        use_single_color = not bool(options["marker_color_field"])
+        self.color_by_single_color_radio.setChecked(use_single_color)
+        self.color_by_data_field_radio.setChecked(not use_single_color)
+        self.toggle_marker_color()
+
+        self.init_field_combobox(self.marker_color_field, options["marker_color_field"])
+
+        index = self.marker_colormap_combobox.findText(options["marker_cmap"])
+        self.marker_colormap_combobox.setCurrentIndex(index)
+        if options["marker_cmap_limits"] is not None:
+            self.marker_lowlimit_dspinbox.setValue(options["marker_cmap_limits"][0])
+            self.marker_upplimit_dspinbox.setValue(options["marker_cmap_limits"][1])
+        else:
+            self.marker_lowlimit_dspinbox.setValue(0.0)
+            self.marker_upplimit_dspinbox.setValue(0.0)
+
+        self.marker_cmap_center_checkbox.setChecked(
+            options["marker_cmap_center"] is not None
+        )
+        if options["marker_cmap_center"] is not None:
+            self.marker_cmap_center_dspinbox.setValue(options["marker_cmap_center"])
+        self.toggle_marker_cmap_center()
+
+        # CONTOUR tab
+        self.contour_checkbox.setChecked(options["plot_contours"])
+        self.toggle_contour()
+        index = self.contour_cmap_combobox.findText(options["contour_cmap"])
+        self.contour_cmap_combobox.setCurrentIndex(index)
+        if options["contour_limits"] is not None:
+            self.contour_lowlimit_dspinbox.setValue(options["contour_limits"][0])
+            self.contour_upplimit_dspinbox.setValue(options["contour_limits"][1])
+        else:
+            self.contour_lowlimit_dspinbox.setValue(0.0)
+            self.contour_upplimit_dspinbox.setValue(0.0)
+        index = self.contour_k_mode_combobox.findText(options["contour_k_mode"])
+        self.contour_k_mode_combobox.setCurrentIndex(index)
+        self.contour_workers_spinbox.setValue(options["contour_workers"])
+
+        # STATISTICS tab
+        self.bootstrap_replicates_spinbox.setValue(options["bootstrap_replicates"])
+        self.bootstrap_confidence_dspinbox.setValue(
+            100.0 * options["bootstrap_confidence"]
+        )
+        self.init_field_combobox(
+            self.group_by_field, options["group_by_field"], allow_empty_field=True
+        )
+
+    def init_field_combobox(
+        self,
+        combobox: QgsFieldComboBox,
+        default_fieldname: str = "",
+        allow_empty_field: bool = False,
+        layer=None,
+    ):
+        if layer is None:
+            layer = self.iface.layerTreeView().currentLayer()
+        # setting the same layer again would list its fields again
+        if combobox.layer() is not layer:
+            combobox.setLayer(layer)
+        combobox.setAllowEmptyFieldName(allow_empty_field)
+        combobox.setField(default_fieldname)
+
+    def toggle_planar_data_format(self):
+        use_dip_dir = self.use_dip_dir_radio.isChecked()
+        self.dip_dir_field.setEnabled(use_dip_dir)
+        self.strike_field.setEnabled(not use_dip_dir)
+
+    def toggle_marker_color(self):
+        single_color = self.color_by_single_color_radio.isChecked()
+        self.marker_colorbutton.setEnabled(single_color)
+        self.marker_color_field.setEnabled(not single_color)
+        self.marker_cmap_center_checkbox.setEnabled(not single_color)
+        self.marker_colormap_label.setEnabled(not single_color)
+        self.marker_colormap_combobox.setEnabled(not single_color)
+        self.marker_lower_label.setEnabled(not single_color)
+        self.marker_upper_label.setEnabled(not single_color)
+        self.marker_upplimit_dspinbox.setEnabled(not single_color)
+        self.marker_lowlimit_dspinbox.setEnabled(not single_color)
+
+    def toggle_marker_cmap_center(self):
+        self.marker_cmap_center_dspinbox.setEnabled(
+            self.marker_cmap_center_checkbox.isChecked()
+        )
+
+    def toggle_contour(self):
+        state = self.contour_checkbox.isChecked()
+        self.contour_colors_label.setEnabled(state)
+        self.contour_limits_label.setEnabled(state)
+        self.lower_label.setEnabled(state)
+        self.upper_label.setEnabled(state)
+        self.contour_cmap_combobox.setEnabled(state)
+        self.contour_lowlimit_dspinbox.setEnabled(state)
+        self.contour_upplimit_dspinbox.setEnabled(state)
+        self.contour_k_mode_label.setEnabled(state)
+        self.contour_k_mode_combobox.setEnabled(state)
+        self.contour_workers_label.setEnabled(state)
+        self.contour_workers_spinbox.setEnabled(state)
+
+    def save_or_reject_settings(self, button):
+        sb = self.button_box.standardButton(button)
+        if sb == QDialogButtonBox.Save:
+            self.accept()
+        else:
+            self.reject()
+
+    def accept(self):
+        """
+        Collect all settings in the SettingsDialog
+        into the options dictionary
+        """
+        # GENERAL
+        self.options["trend_field"] = self.trend_field.currentField()
+        self.options["plunge_field"] = self.plunge_field.currentField()
+        self.options["dip_dir_field"] = self.dip_dir_field.currentField()
+        self.options["strike_field"] = self.strike_field.currentField()
+        self.options["dip_angle_field"] = self.dip_angle_field.currentField()
+        self.options["use_dip_dir"] = self.use_dip_dir_radio.isChecked()
+
+        self.options["plot_mean_plane"] = self.plot_mean_plane_checkbox.isChecked()
+        self.options[
+            "plot_intersection_point"
+        ] = self.plot_intersection_point_checkbox.isChecked()
+        self.options["float32_storage"] = self.float32_storage_checkbox.isChecked()
+        self.options[
+            "profile_next_plot"
+        ] = self.profile_next_plot_checkbox.isChecked()
+
+        # MARKER
+        if self.marker_upplimit_dspinbox.value() > 0.0:
+            self.options["marker_cmap_limits"] = [
+                self.marker_lowlimit_dspinbox.value(),
+                self.marker_upplimit_dspinbox.value(),
+            ]
+        else:
+            self.options["marker_cmap_limits"] = None
+
+        self.options["marker"] = self.marker_combobox.currentText()
+        self.options["marker_size"] = self.marker_size_spinbox.value()
+        self.options[
+            "marker_raster_threshold"
+        ] = self.marker_raster_threshold_spinbox.value()
+        self.options["marker_color"] = self.marker_colorbutton.color().name()
+
+        if self.color_by_data_field_radio.isChecked():
+            self.options["marker_color_field"] = self.marker_color_field.currentField()
+        else:
+            self.options["marker_color_field"] = ""
+
+        if self.marker_cmap_center_checkbox.isChecked():
+            self.options[
+                "marker_cmap_center"
+            ] = self.marker_cmap_center_dspinbox.value()
+        else:
+            self.options["marker_cmap_center"] = None
+
+        self.options["marker_cmap"] = self.marker_colormap_combobox.currentText()
+
+        # COUTOURS
+        self.options["plot_contours"] = self.contour_checkbox.isChecked()
+        self.options["contour_cmap"] = self.contour_cmap_combobox.currentText()
+
+        if self.contour_upplimit_dspinbox.value() > 0.0:
+            self.options["contour_limits"] = [
+                self.contour_lowlimit_dspinbox.value(),
+                self.contour_upplimit_dspinbox.value(),
+            ]
+        else:
+            self.options["contour_limits"] = None
+
+        self.options["contour_k_mode"] = self.contour_k_mode_combobox.currentText()
+        self.options["contour_workers"] = self.contour_workers_spinbox.value()
+
+        # STATISTICS
+        self.options["bootstrap_replicates"] = self.bootstrap_replicates_spinbox.value()
+        self.options["bootstrap_confidence"] = (
+            self.bootstrap_confidence_dspinbox.value() / 100.0
+        )
+        self.options["group_by_field"] = self.group_by_field.currentField()
+
+        # print current options to message log
+        info("Saved settings: \n" + str(self.options))
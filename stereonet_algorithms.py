@@ -0,0 +1,950 @@
+import numpy as np
+
+from qgis.PyQt.QtCore import QCoreApplication, QVariant
+from qgis.core import (
+    NULL,
+    QgsCoordinateReferenceSystem,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsFeatureSink,
+    QgsField,
+    QgsFields,
+    QgsGeometry,
+    QgsProcessing,
+    QgsProcessingAlgorithm,
+    QgsProcessingException,
+    QgsProcessingParameterBoolean,
+    QgsProcessingParameterEnum,
+    QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterField,
+    QgsProcessingParameterExtent,
+    QgsProcessingParameterNumber,
+    QgsProcessingParameterRasterDestination,
+    QgsRectangle,
+    QgsWkbTypes,
+)
+
+# the computations using scipy and gdal are imported by the algorithms
+# which run them, as the provider loads this module at QGIS startup
+from .defaults import DEFAULT_RESOLUTION, K_OPTIMIZATION_MODES
+from .extraction import extract_attributes, extract_points, to_numbers
+from .orientation import (
+    OrientationTensor,
+    cartesian_to_lines,
+    filter_measurements,
+    lines_to_cartesian,
+    measurement_vectors,
+    planes_from_poles,
+    poles_from_planes,
+    strike_from_direction,
+    unproject_equal_area,
+)
+from .parallel import default_workers
+
+# formats of the orientation data read by the algorithms
+LINES, PLANES_DIP_DIRECTION, PLANES_STRIKE = range(3)
+DATA_TYPE_NAMES = {
+    LINES: "Lines (trend/plunge)",
+    PLANES_DIP_DIRECTION: "Planes (dip direction/dip)",
+    PLANES_STRIKE: "Planes (strike/dip)",
+}
+
+
+def tr(string):
+    return QCoreApplication.translate("Processing", string)
+
+
+def double_fields(*names):
+    fields = QgsFields()
+    for name in names:
+        fields.append(QgsField(name, QVariant.Double))
+    return fields
+
+
+class StereonetAlgorithm(QgsProcessingAlgorithm):
+    """
+    Base of the algorithms computing stereonet statistics
+    of the orientation data in a vector layer
+    """
+
+    INPUT = "INPUT"
+    DATA_TYPE = "DATA_TYPE"
+    AZIMUTH_FIELD = "AZIMUTH_FIELD"
+    ANGLE_FIELD = "ANGLE_FIELD"
+    OUTPUT = "OUTPUT"
+
+    # data formats accepted by the algorithm
+    data_types = (LINES, PLANES_DIP_DIRECTION, PLANES_STRIKE)
+
+    # type and description of the output layer
+    output_type = QgsProcessing.TypeVector
+    output_description = "Output table"
+
+    def createInstance(self):
+        return type(self)()
+
+    def group(self):
+        return tr("Stereonet statistics")
+
+    def groupId(self):
+        return "stereonetstatistics"
+
+    def initAlgorithm(self, config=None):
+        self.addParameter(
+            QgsProcessingParameterFeatureSource(
+                self.INPUT, tr("Input layer"), [QgsProcessing.TypeVector]
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                self.DATA_TYPE,
+                tr("Data format"),
+                options=[tr(DATA_TYPE_NAMES[i]) for i in self.data_types],
+                defaultValue=0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterField(
+                self.AZIMUTH_FIELD,
+                tr("Trend, dip direction or strike field"),
+                parentLayerParameterName=self.INPUT,
+                type=QgsProcessingParameterField.Numeric,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterField(
+                self.ANGLE_FIELD,
+                tr("Plunge or dip field"),
+                parentLayerParameterName=self.INPUT,
+                type=QgsProcessingParameterField.Numeric,
+            )
+        )
+        self.init_parameters()
+        self.init_output()
+
+    def init_parameters(self):
+        """
+        Add the parameters specific to the algorithm
+        """
+
+    def init_output(self):
+        self.addParameter(
+            QgsProcessingParameterFeatureSink(
+                self.OUTPUT, tr(self.output_description), self.output_type
+            )
+        )
+
+    def input_source(self, parameters, context):
+        source = self.parameterAsSource(parameters, self.INPUT, context)
+        if source is None:
+            raise QgsProcessingException(
+                self.invalidSourceError(parameters, self.INPUT)
+            )
+        return source
+
+    def input_format(self, parameters, context):
+        """
+        Return the data type and the orientation field names of the input
+        """
+        data_type = self.data_types[
+            self.parameterAsEnum(parameters, self.DATA_TYPE, context)
+        ]
+        field_names = [
+            self.parameterAsString(parameters, self.AZIMUTH_FIELD, context),
+            self.parameterAsString(parameters, self.ANGLE_FIELD, context),
+        ]
+        return data_type, field_names
+
+    def read_orientations(self, parameters, context, feedback):
+        """
+        Read the orientation data of the input layer.
+        Return (source, data_type, data) where data is an (N, 2) array
+        of trend/plunge or strike/dip, or None if canceled.
+        """
+        source = self.input_source(parameters, context)
+        data_type, field_names = self.input_format(parameters, context)
+
+        extracted = extract_attributes(
+            source,
+            source.fields(),
+            field_names,
+            feedback=feedback,
+            expected=max(source.featureCount(), 0),
+        )
+        if feedback.isCanceled():
+            return None
+        if extracted is None:
+            raise QgsProcessingException(tr("Orientation fields not found."))
+
+        _, values, null = extracted
+        data, _ = self.validate_orientations(data_type, values, null, feedback)
+        if not len(data):
+            raise QgsProcessingException(tr("No orientation data in the input."))
+
+        if data_type != LINES:
+            stk = strike_from_direction(data[:, 0], data_type == PLANES_DIP_DIRECTION)
+            data = np.column_stack((stk, data[:, 1]))
+        return source, data_type, data
+
+    def read_lines(self, parameters, context, feedback):
+        """
+        Same as read_orientations, with planes converted to their poles
+        """
+        read = self.read_orientations(parameters, context, feedback)
+        if read is None:
+            return None
+        source, data_type, data = read
+        if data_type != LINES:
+            data = poles_from_planes(data[:, 0], data[:, 1])
+        return source, data_type, data
+
+    def read_points(self, parameters, context, feedback):
+        """
+        Read the orientation data of the input layer with the points
+        of the features. Return (source, data_type, vectors, points),
+        or None if canceled.
+        """
+        source = self.input_source(parameters, context)
+        data_type, field_names = self.input_format(parameters, context)
+        extracted = extract_points(
+            source,
+            source.fields(),
+            field_names,
+            feedback=feedback,
+            expected=max(source.featureCount(), 0),
+        )
+        if feedback.isCanceled():
+            return None
+        if extracted is None:
+            raise QgsProcessingException(tr("Orientation fields not found."))
+
+        _, values, null, points = extracted
+        vectors, rows = self.measurement_vectors(data_type, values, null, feedback)
+        return source, data_type, vectors, points[rows]
+
+    def validate_orientations(self, data_type, values, null, feedback):
+        """
+        Drop the NULL and invalid rows of an (N, 2) array of orientation
+        data and report them. Return (measurements, rows) where measurements
+        are the normalized rows kept and rows the indices they come from.
+        """
+        measurements, rows, rejected = filter_measurements(
+            values, null, data_type != LINES
+        )
+        feedback.pushInfo(f"{len(measurements)} measurements read.")
+        for reason, count in rejected.items():
+            if count:
+                feedback.pushInfo(f"{count} measurements rejected: {reason}.")
+        return measurements, rows
+
+    def measurement_vectors(self, data_type, values, null, feedback):
+        """
+        Same as validate_orientations, returning (vectors, rows) where
+        vectors are the unit vectors of the lines or poles
+        """
+        measurements, rows = self.validate_orientations(
+            data_type, values, null, feedback
+        )
+        vectors = measurement_vectors(
+            measurements, data_type != LINES, data_type == PLANES_DIP_DIRECTION
+        )
+        return vectors, rows
+
+    def write_table(
+        self,
+        parameters,
+        context,
+        fields,
+        rows,
+        geometries=None,
+        wkb_type=QgsWkbTypes.NoGeometry,
+        crs=None,
+        keys=None,
+    ):
+        """
+        Write rows of numbers to the output, after their key in keys
+        if given, with their geometries of wkb_type in crs if given
+        """
+        sink, dest_id = self.parameterAsSink(
+            parameters,
+            self.OUTPUT,
+            context,
+            fields,
+            wkb_type,
+            QgsCoordinateReferenceSystem() if crs is None else crs,
+        )
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+        for i, row in enumerate(rows):
+            feature = QgsFeature(fields)
+            attributes = [float(value) for value in row]
+            if keys is not None:
+                attributes.insert(0, keys[i])
+            feature.setAttributes(attributes)
+            if geometries is not None:
+                feature.setGeometry(geometries[i])
+            sink.addFeature(feature, QgsFeatureSink.FastInsert)
+        return {self.OUTPUT: dest_id}
+
+
+def eigen_of_lines(data):
+    tensor = OrientationTensor()
+    tensor.add_lines(data[:, 0], data[:, 1])
+    vectors, values = tensor.eigen()
+    return cartesian_to_lines(vectors), values, tensor.count
+
+
+class BestFitPlaneAlgorithm(StereonetAlgorithm):
+    """
+    Plane best fitting a girdle of lines, as in the line plot
+    """
+
+    data_types = (LINES,)
+
+    def name(self):
+        return "bestfitplane"
+
+    def displayName(self):
+        return tr("Best-fit plane")
+
+    def shortHelpString(self):
+        return tr(
+            "Plane best fitting the lines of a layer, "
+            "normal to the eigenvector of the smallest eigenvalue "
+            "of their orientation tensor."
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        read = self.read_lines(parameters, context, feedback)
+        if read is None:
+            return {}
+        lines, values, count = eigen_of_lines(read[2])
+        strike, dip = planes_from_poles(*lines[0])[0]
+        feedback.pushInfo(f"Best-fit plane strike/dip = {strike} / {dip}")
+        fields = double_fields("strike", "dip", "count")
+        return self.write_table(parameters, context, fields, [(strike, dip, count)])
+
+
+class AveragePlaneAlgorithm(StereonetAlgorithm):
+    """
+    Average of planes, as in the poles to plane plot
+    """
+
+    data_types = (PLANES_DIP_DIRECTION, PLANES_STRIKE)
+
+    def name(self):
+        return "averageplane"
+
+    def displayName(self):
+        return tr("Average plane")
+
+    def shortHelpString(self):
+        return tr(
+            "Average of the planes of a layer, whose pole is the eigenvector "
+            "of the largest eigenvalue of the orientation tensor of their poles."
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        read = self.read_lines(parameters, context, feedback)
+        if read is None:
+            return {}
+        lines, values, count = eigen_of_lines(read[2])
+        strike, dip = planes_from_poles(*lines[2])[0]
+        feedback.pushInfo(f"Average plane strike/dip = {strike} / {dip}")
+        fields = double_fields("strike", "dip", "count")
+        return self.write_table(parameters, context, fields, [(strike, dip, count)])
+
+
+class AverageIntersectionAlgorithm(StereonetAlgorithm):
+    """
+    Best-fit intersection of planes, as in the plane plot
+    """
+
+    data_types = (PLANES_DIP_DIRECTION, PLANES_STRIKE)
+
+    def name(self):
+        return "averageintersection"
+
+    def displayName(self):
+        return tr("Average intersection")
+
+    def shortHelpString(self):
+        return tr(
+            "Best-fit intersection line of the planes of a layer, "
+            "the eigenvector of the smallest eigenvalue "
+            "of the orientation tensor of their poles."
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        read = self.read_lines(parameters, context, feedback)
+        if read is None:
+            return {}
+        lines, values, count = eigen_of_lines(read[2])
+        trend, plunge = lines[0]
+        feedback.pushInfo(f"Average intersection trend/plunge = {trend} / {plunge}")
+        fields = double_fields("trend", "plunge", "count")
+        return self.write_table(parameters, context, fields, [(trend, plunge, count)])
+
+
+class EigenAnalysisAlgorithm(StereonetAlgorithm):
+    """
+    Eigenvalues and eigenvectors of the orientation tensor
+    """
+
+    def name(self):
+        return "eigenanalysis"
+
+    def displayName(self):
+        return tr("Orientation tensor eigen analysis")
+
+    def shortHelpString(self):
+        return tr(
+            "Normalized eigenvalues and eigenvectors of the orientation tensor "
+            "of lines, or of the poles of planes, from the largest eigenvalue down."
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        read = self.read_lines(parameters, context, feedback)
+        if read is None:
+            return {}
+        lines, values, count = eigen_of_lines(read[2])
+        rows = [
+            (rank + 1, values[i], lines[i][0], lines[i][1], count)
+            for rank, i in enumerate((2, 1, 0))
+        ]
+        fields = double_fields("rank", "eigenvalue", "trend", "plunge", "count")
+        return self.write_table(parameters, context, fields, rows)
+
+
+class DensityGridAlgorithm(StereonetAlgorithm):
+    """
+    Fisher density grid, as contoured by the plots
+    """
+
+    RESOLUTION = "RESOLUTION"
+    K = "K"
+    K_MODE = "K_MODE"
+
+    def name(self):
+        return "densitygrid"
+
+    def displayName(self):
+        return tr("Fisher density grid")
+
+    def shortHelpString(self):
+        return tr(
+            "Fisher density of lines, or of the poles of planes, in multiples of "
+            "uniform density on a regular grid over the lower-hemisphere equal-area "
+            "stereonet of unit radius. Leave k at 0 to optimize it."
+        )
+
+    def init_parameters(self):
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.RESOLUTION,
+                tr("Grid nodes across the stereonet"),
+                type=QgsProcessingParameterNumber.Integer,
+                defaultValue=DEFAULT_RESOLUTION,
+                minValue=10,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.K,
+                tr("Fisher k (0 to optimize)"),
+                type=QgsProcessingParameterNumber.Double,
+                defaultValue=0.0,
+                minValue=0.0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                self.K_MODE,
+                tr("k optimization"),
+                options=list(K_OPTIMIZATION_MODES),
+                defaultValue=list(K_OPTIMIZATION_MODES).index("balanced"),
+            )
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        from .density import density_grid
+
+        read = self.read_lines(parameters, context, feedback)
+        if read is None:
+            return {}
+        data = read[2]
+        k = self.parameterAsDouble(parameters, self.K, context) or None
+        k_mode = list(K_OPTIMIZATION_MODES)[
+            self.parameterAsEnum(parameters, self.K_MODE, context)
+        ]
+        grid = density_grid(
+            lines_to_cartesian(data[:, 0], data[:, 1]),
+            k=k,
+            resolution=self.parameterAsInt(parameters, self.RESOLUTION, context),
+            k_mode=k_mode,
+        )
+        feedback.pushInfo(f"Fisher density computed with k = {grid.k:.1f}")
+
+        inside = ~np.isnan(grid.density)
+        x, y = grid.x[inside], grid.y[inside]
+        nodes = cartesian_to_lines(unproject_equal_area(x, y))
+        rows = np.column_stack(
+            (x, y, nodes, grid.density[inside], np.full(len(x), grid.k))
+        )
+        fields = double_fields("x", "y", "trend", "plunge", "density", "k")
+        return self.write_table(parameters, context, fields, rows)
+
+
+def domain_columns(statistics, data_type):
+    """
+    Columns of the normalized eigenvalues, average plane and average
+    line of the domains of a DomainStatistics, and their names
+    """
+    columns = [statistics.counts, statistics.values[:, ::-1]]
+    if data_type == LINES:
+        # best-fit plane normal to the smallest eigenvector, mean line
+        columns += [planes_from_poles(*statistics.lines(0).T), statistics.lines(2)]
+    else:
+        # average plane normal to the largest eigenvector, intersection
+        columns += [planes_from_poles(*statistics.lines(2).T), statistics.lines(0)]
+    names = ["count", "e1", "e2", "e3", "strike", "dip", "trend", "plunge"]
+    return columns, names
+
+
+def polygon_rings(geometry):
+    """
+    Rings of all the parts of a polygon geometry as (M, 2) arrays of x/y
+    """
+    if geometry.isMultipart():
+        parts = geometry.asMultiPolygon()
+    else:
+        parts = [geometry.asPolygon()]
+    return [
+        np.array([(point.x(), point.y()) for point in ring])
+        for part in parts
+        for ring in part
+    ]
+
+
+class DomainStatisticsAlgorithm(StereonetAlgorithm):
+    """
+    Eigen statistics, and optionally density peaks, of the measurements
+    in each structural domain, polygons of a layer or cells of a grid
+    """
+
+    DOMAINS = "DOMAINS"
+    CELL_SIZE = "CELL_SIZE"
+    MIN_COUNT = "MIN_COUNT"
+    DENSITY = "DENSITY"
+
+    output_type = QgsProcessing.TypeVectorPolygon
+    output_description = "Domains"
+
+    def name(self):
+        return "domainstatistics"
+
+    def displayName(self):
+        return tr("Structural domain statistics")
+
+    def shortHelpString(self):
+        return tr(
+            "Statistics of the measurements of a layer in each structural domain: "
+            "the polygons of a domain layer, or the square cells of a grid if no "
+            "domain layer is given. For each domain with enough measurements, "
+            "the output has the normalized eigenvalues e1 >= e2 >= e3 of the "
+            "orientation tensor, the average plane (strike/dip) and the average "
+            "intersection (trend/plunge) of planes, or the best-fit plane and the "
+            "mean line of lines, and optionally the Fisher density peak."
+        )
+
+    def init_parameters(self):
+        self.addParameter(
+            QgsProcessingParameterFeatureSource(
+                self.DOMAINS,
+                tr("Domain polygons"),
+                [QgsProcessing.TypeVectorPolygon],
+                optional=True,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.CELL_SIZE,
+                tr("Grid cell size, without domain polygons (layer units)"),
+                type=QgsProcessingParameterNumber.Double,
+                defaultValue=1000.0,
+                minValue=0.0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.MIN_COUNT,
+                tr("Minimum number of measurements per domain"),
+                type=QgsProcessingParameterNumber.Integer,
+                defaultValue=3,
+                minValue=1,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.DENSITY, tr("Compute the Fisher density peaks"), defaultValue=False
+            )
+        )
+
+    def read_domains(self, parameters, context, crs):
+        """
+        Return (ids, geometries, rings) of the domain polygons in crs,
+        or None if no domain layer is given
+        """
+        domains = self.parameterAsSource(parameters, self.DOMAINS, context)
+        if domains is None:
+            return None
+        request = QgsFeatureRequest()
+        request.setNoAttributes()
+        request.setDestinationCrs(crs, context.transformContext())
+        ids, geometries, rings = [], [], []
+        for feature in domains.getFeatures(request):
+            geometry = feature.geometry()
+            if geometry.isEmpty():
+                continue
+            ids.append(feature.id())
+            rings.append(polygon_rings(geometry))
+            geometry.convertToMultiType()
+            geometries.append(geometry)
+        return ids, geometries, rings
+
+    def processAlgorithm(self, parameters, context, feedback):
+        from .domains import (
+            assign_grid,
+            assign_polygons,
+            domain_densities,
+            domain_statistics,
+        )
+
+        read = self.read_points(parameters, context, feedback)
+        if read is None:
+            return {}
+        source, data_type, vectors, points = read
+
+        domains = self.read_domains(parameters, context, source.sourceCrs())
+        if domains is not None:
+            ids, geometries, rings = domains
+            assigned = assign_polygons(points, rings, feedback)
+            if assigned is None:
+                return {}
+            rows, membership = assigned
+        else:
+            cell_size = self.parameterAsDouble(parameters, self.CELL_SIZE, context)
+            if cell_size <= 0.0:
+                raise QgsProcessingException(
+                    tr("Give domain polygons or a grid cell size.")
+                )
+            rows, membership, cells = assign_grid(points, cell_size)
+            ids = range(len(cells))
+            geometries = [
+                QgsGeometry.fromRect(QgsRectangle(x, y, x + cell_size, y + cell_size))
+                for x, y in cells
+            ]
+
+        statistics = domain_statistics(vectors, rows, membership, len(geometries))
+        columns, names = domain_columns(statistics, data_type)
+        columns.insert(0, np.asarray(ids, dtype=np.double))
+        names.insert(0, "domain")
+
+        keep = statistics.counts >= self.parameterAsInt(
+            parameters, self.MIN_COUNT, context
+        )
+        if self.parameterAsBool(parameters, self.DENSITY, context):
+            segments = [
+                segment if kept else segment[:0]
+                for segment, kept in zip(statistics.segments, keep)
+            ]
+            densities = domain_densities(
+                vectors, segments, workers=default_workers(), feedback=feedback
+            )
+            if densities is None:
+                return {}
+            columns.append(densities)
+            names += ["k", "peak_density", "peak_trend", "peak_plunge"]
+
+        table = np.column_stack(columns)[keep]
+        feedback.pushInfo(
+            f"{np.count_nonzero(keep)} of {len(geometries)} domains "
+            f"have enough measurements."
+        )
+        if domains is not None:
+            wkb_type = QgsWkbTypes.MultiPolygon
+        else:
+            wkb_type = QgsWkbTypes.Polygon
+        return self.write_table(
+            parameters,
+            context,
+            double_fields(*names),
+            table,
+            [geometry for geometry, kept in zip(geometries, keep) if kept],
+            wkb_type,
+            source.sourceCrs(),
+        )
+
+
+class GroupStatisticsAlgorithm(StereonetAlgorithm):
+    """
+    Eigen, Fisher and Woodcock statistics of the measurements
+    sharing each value of an attribute
+    """
+
+    GROUP_FIELD = "GROUP_FIELD"
+    MIN_COUNT = "MIN_COUNT"
+
+    def name(self):
+        return "groupstatistics"
+
+    def displayName(self):
+        return tr("Statistics by attribute value")
+
+    def shortHelpString(self):
+        return tr(
+            "Statistics of the measurements of a layer grouped by the value "
+            "of an attribute, such as the lithology, the outcrop or the campaign. "
+            "For each group with enough measurements, the output has the "
+            "normalized eigenvalues e1 >= e2 >= e3 of the orientation tensor, "
+            "the average plane (strike/dip) and the average intersection "
+            "(trend/plunge) of planes, or the best-fit plane and the mean line "
+            "of lines, the Fisher concentration kappa and 95% confidence cone "
+            "alpha95 of the mean, and the Woodcock shape K and strength C. "
+            "Measurements with a NULL group value form a group of their own."
+        )
+
+    def init_parameters(self):
+        self.addParameter(
+            QgsProcessingParameterField(
+                self.GROUP_FIELD,
+                tr("Group field"),
+                parentLayerParameterName=self.INPUT,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.MIN_COUNT,
+                tr("Minimum number of measurements per group"),
+                type=QgsProcessingParameterNumber.Integer,
+                defaultValue=3,
+                minValue=1,
+            )
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        from .domains import assign_groups, domain_statistics
+
+        source = self.input_source(parameters, context)
+        data_type, field_names = self.input_format(parameters, context)
+        group_field = self.parameterAsString(parameters, self.GROUP_FIELD, context)
+
+        # the group values are read along the orientations, as objects
+        extracted = extract_attributes(
+            source,
+            source.fields(),
+            field_names + [group_field],
+            feedback=feedback,
+            dtype=object,
+            expected=max(source.featureCount(), 0),
+        )
+        if feedback.isCanceled():
+            return {}
+        if extracted is None:
+            raise QgsProcessingException(tr("Orientation fields not found."))
+
+        _, values, null = extracted
+        vectors, rows = self.measurement_vectors(
+            data_type, to_numbers(values[:, :2]), null[:, :2], feedback
+        )
+        members, membership, groups = assign_groups(values[rows, 2])
+        statistics = domain_statistics(vectors, members, membership, len(groups))
+        columns, names = domain_columns(statistics, data_type)
+        columns += [statistics.fisher(), statistics.woodcock()]
+        names += ["kappa", "alpha95", "woodcock_k", "woodcock_c"]
+
+        keep = statistics.counts >= self.parameterAsInt(
+            parameters, self.MIN_COUNT, context
+        )
+        feedback.pushInfo(
+            f"{np.count_nonzero(keep)} of {len(groups)} groups "
+            f"have enough measurements."
+        )
+        fields = QgsFields()
+        fields.append(QgsField(source.fields().field(group_field)))
+        for field in double_fields(*names):
+            fields.append(field)
+        keys = [NULL if group is None else group for group in groups]
+        return self.write_table(
+            parameters,
+            context,
+            fields,
+            np.column_stack(columns)[keep],
+            keys=[key for key, kept in zip(keys, keep) if kept],
+        )
+
+
+class OrientationFieldAlgorithm(StereonetAlgorithm):
+    """
+    Raster of the average plane of the measurements around every pixel,
+    as in the poles to plane plot, and of the strength of their fabric
+    """
+
+    EXTENT = "EXTENT"
+    PIXEL_SIZE = "PIXEL_SIZE"
+    RADIUS = "RADIUS"
+    MIN_COUNT = "MIN_COUNT"
+
+    data_types = (PLANES_DIP_DIRECTION, PLANES_STRIKE)
+
+    def name(self):
+        return "orientationfield"
+
+    def displayName(self):
+        return tr("Orientation field raster")
+
+    def shortHelpString(self):
+        return tr(
+            "Raster of how the orientation of planes varies across an area. "
+            "For every pixel, the planes measured within the search radius of "
+            "its center are averaged as in the poles to plane plot. The bands are "
+            "the dip direction and dip of the average plane, the fabric strength "
+            "ln(e1 / e3) of Woodcock and the number of measurements. Pixels with "
+            "fewer measurements than the minimum are no data."
+        )
+
+    def init_parameters(self):
+        self.addParameter(
+            QgsProcessingParameterExtent(
+                self.EXTENT,
+                tr("Extent (the input layer extent if empty)"),
+                optional=True,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.PIXEL_SIZE,
+                tr("Pixel size (layer units)"),
+                type=QgsProcessingParameterNumber.Double,
+                defaultValue=100.0,
+                minValue=0.0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.RADIUS,
+                tr("Search radius (layer units)"),
+                type=QgsProcessingParameterNumber.Double,
+                defaultValue=500.0,
+                minValue=0.0,
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.MIN_COUNT,
+                tr("Minimum number of measurements per pixel"),
+                type=QgsProcessingParameterNumber.Integer,
+                defaultValue=3,
+                minValue=1,
+            )
+        )
+
+    def init_output(self):
+        self.addParameter(
+            QgsProcessingParameterRasterDestination(
+                self.OUTPUT, tr("Orientation field")
+            )
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        from osgeo import gdal
+
+        from .orientation_field import (
+            DEFAULT_TILE_SIZE,
+            FIELD_BANDS,
+            NODATA,
+            grid_shape,
+            orientation_field,
+        )
+
+        read = self.read_points(parameters, context, feedback)
+        if read is None:
+            return {}
+        source, _, vectors, points = read
+
+        crs = source.sourceCrs()
+        extent = self.parameterAsExtent(parameters, self.EXTENT, context, crs)
+        if extent.isNull():
+            extent = source.sourceExtent()
+        pixel_size = self.parameterAsDouble(parameters, self.PIXEL_SIZE, context)
+        radius = self.parameterAsDouble(parameters, self.RADIUS, context)
+        if pixel_size <= 0.0 or radius <= 0.0:
+            raise QgsProcessingException(
+                tr("The pixel size and the search radius must be positive.")
+            )
+        bounds = (
+            extent.xMinimum(),
+            extent.yMinimum(),
+            extent.xMaximum(),
+            extent.yMaximum(),
+        )
+        width, height = grid_shape(bounds, pixel_size)
+        feedback.pushInfo(f"Orientation field of {width} x {height} pixels.")
+
+        path = self.parameterAsOutputLayer(parameters, self.OUTPUT, context)
+        dataset = gdal.GetDriverByName("GTiff").Create(
+            path,
+            width,
+            height,
+            len(FIELD_BANDS),
+            gdal.GDT_Float32,
+            options=[
+                "TILED=YES",
+                f"BLOCKXSIZE={DEFAULT_TILE_SIZE}",
+                f"BLOCKYSIZE={DEFAULT_TILE_SIZE}",
+                "COMPRESS=DEFLATE",
+            ],
+        )
+        if dataset is None:
+            raise QgsProcessingException(tr("Cannot create ") + path)
+        dataset.SetGeoTransform(
+            (bounds[0], pixel_size, 0.0, bounds[3], 0.0, -pixel_size)
+        )
+        dataset.SetProjection(crs.toWkt())
+        bands = [dataset.GetRasterBand(i + 1) for i in range(len(FIELD_BANDS))]
+        for band, name in zip(bands, FIELD_BANDS):
+            band.SetDescription(name)
+            band.SetNoDataValue(NODATA)
+
+        def write(column, row, tile):
+            for band, values in zip(bands, tile):
+                band.WriteArray(values, column, row)
+
+        completed = orientation_field(
+            points,
+            vectors,
+            bounds,
+            pixel_size,
+            radius,
+            write,
+            self.parameterAsInt(parameters, self.MIN_COUNT, context),
+            feedback=feedback,
+        )
+        bands = None
+        dataset = None
+        if not completed:
+            return {}
+        return {self.OUTPUT: path}
+
+
+ALGORITHMS = (
+    BestFitPlaneAlgorithm,
+    AveragePlaneAlgorithm,
+    AverageIntersectionAlgorithm,
+    EigenAnalysisAlgorithm,
+    DensityGridAlgorithm,
+    DomainStatisticsAlgorithm,
+    GroupStatisticsAlgorithm,
+    OrientationFieldAlgorithm,
+)
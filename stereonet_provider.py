@@ -0,0 +1,31 @@
+from qgis.PyQt.QtGui import QIcon
+from qgis.core import QgsProcessingProvider
+
+from . import resources  # noqa: F401, registers the icons
+from .stereonet_algorithms import ALGORITHMS
+
+# prefix of the icons in the compiled resources, see resources.qrc
+RESOURCE_PREFIX = ":/plugins/qgis-structural-geology/"
+
+
+class StereonetProvider(QgsProcessingProvider):
+    """
+    Processing provider exposing the stereonet statistics
+    to the toolbox, graphical models, batch mode and qgis_process
+    """
+
+    def loadAlgorithms(self):
+        for algorithm in ALGORITHMS:
+            self.addAlgorithm(algorithm())
+
+    def id(self):
+        return "structuralgeology"
+
+    def name(self):
+        return "Structural geology"
+
+    def longName(self):
+        return "Structural geology toolkit"
+
+    def icon(self):
+        return QIcon(RESOURCE_PREFIX + "line_icon.ico")
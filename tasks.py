@@ -0,0 +1,34 @@
+from qgis.core import QgsTask
+
+
+class StereonetTask(QgsTask):
+    """
+    Run the computation of a stereonet in a background thread.
+
+    compute is called with the task itself, which provides
+    isCanceled() and setProgress() to the computation.
+    Its result is handed to on_finished in the main thread,
+    exceptions raised by compute to on_error.
+    """
+
+    def __init__(self, description, compute, on_finished, on_error):
+        super(StereonetTask, self).__init__(description, QgsTask.CanCancel)
+        self.compute = compute
+        self.on_finished = on_finished
+        self.on_error = on_error
+        self.result = None
+        self.exception = None
+
+    def run(self):
+        try:
+            self.result = self.compute(self)
+        except Exception as e:
+            self.exception = e
+            return False
+        return self.result is not None and not self.isCanceled()
+
+    def finished(self, result):
+        if result:
+            self.on_finished(self.result)
+        elif self.exception is not None:
+            self.on_error(self.exception)
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ui_settings_dialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_SettingsDialog(object):
+    def setupUi(self, SettingsDialog):
+        SettingsDialog.setObjectName("SettingsDialog")
+        SettingsDialog.resize(490, 446)
+        self.button_box = QtWidgets.QDialogButtonBox(SettingsDialog)
+        self.button_box.setGeometry(QtCore.QRect(290, 400, 171, 32))
+        self.button_box.setLocale(QtCore.QLocale(QtCore.QLocale.English, QtCore.QLocale.Canada))
+        self.button_box.setOrientation(QtCore.Qt.Horizontal)
+        self.button_box.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Save)
+        self.button_box.setCenterButtons(False)
+        self.button_box.setObjectName("button_box")
+        self.tabWidget = QtWidgets.QTabWidget(SettingsDialog)
+        self.tabWidget.setGeometry(QtCore.QRect(30, 20, 431, 371))
+        self.tabWidget.setObjectName("tabWidget")
+        self.general = QtWidgets.QWidget()
+        self.general.setObjectName("general")
+        self.line_groupbox = QtWidgets.QGroupBox(self.general)
+        self.line_groupbox.setGeometry(QtCore.QRect(0, 10, 411, 111))
+        self.line_groupbox.setObjectName("line_groupbox")
+        self.trend_field = QgsFieldComboBox(self.line_groupbox)
+        self.trend_field.setGeometry(QtCore.QRect(20, 40, 181, 27))
+        self.trend_field.setObjectName("trend_field")
+        self.plunge_field = QgsFieldComboBox(self.line_groupbox)
+        self.plunge_field.setGeometry(QtCore.QRect(220, 40, 181, 27))
+        self.plunge_field.setObjectName("plunge_field")
+        self.trend_label = QtWidgets.QLabel(self.line_groupbox)
+        self.trend_label.setGeometry(QtCore.QRect(30, 20, 61, 14))
+        self.trend_label.setObjectName("trend_label")
+        self.plunge_label = QtWidgets.QLabel(self.line_groupbox)
+        self.plunge_label.setGeometry(QtCore.QRect(230, 20, 61, 21))
+        self.plunge_label.setObjectName("plunge_label")
+        self.plot_mean_plane_checkbox = QtWidgets.QCheckBox(self.line_groupbox)
+        self.plot_mean_plane_checkbox.setGeometry(QtCore.QRect(30, 80, 291, 20))
+        self.plot_mean_plane_checkbox.setObjectName("plot_mean_plane_checkbox")
+        self.plane_groupbox = QtWidgets.QGroupBox(self.general)
+        self.plane_groupbox.setGeometry(QtCore.QRect(0, 140, 411, 141))
+        self.plane_groupbox.setObjectName("plane_groupbox")
+        self.dip_dir_field = QgsFieldComboBox(self.plane_groupbox)
+        self.dip_dir_field.setGeometry(QtCore.QRect(200, 20, 191, 27))
+        self.dip_dir_field.setObjectName("dip_dir_field")
+        self.use_dip_dir_radio = QtWidgets.QRadioButton(self.plane_groupbox)
+        self.use_dip_dir_radio.setGeometry(QtCore.QRect(30, 20, 131, 20))
+        self.use_dip_dir_radio.setObjectName("use_dip_dir_radio")
+        self.use_strike_radio = QtWidgets.QRadioButton(self.plane_groupbox)
+        self.use_strike_radio.setGeometry(QtCore.QRect(30, 50, 161, 20))
+        self.use_strike_radio.setObjectName("use_strike_radio")
+        self.strike_field = QgsFieldComboBox(self.plane_groupbox)
+        self.strike_field.setGeometry(QtCore.QRect(200, 50, 191, 27))
+        self.strike_field.setObjectName("strike_field")
+        self.label_3 = QtWidgets.QLabel(self.plane_groupbox)
+        self.label_3.setGeometry(QtCore.QRect(60, 80, 81, 20))
+        self.label_3.setObjectName("label_3")
+        self.dip_angle_field = QgsFieldComboBox(self.plane_groupbox)
+        self.dip_angle_field.setGeometry(QtCore.QRect(200, 80, 191, 27))
+        self.dip_angle_field.setObjectName("dip_angle_field")
+        self.plot_intersection_point_checkbox = QtWidgets.QCheckBox(self.plane_groupbox)
+        self.plot_intersection_point_checkbox.setGeometry(QtCore.QRect(30, 110, 341, 20))
+        self.plot_intersection_point_checkbox.setObjectName("plot_intersection_point_checkbox")
+        self.float32_storage_checkbox = QtWidgets.QCheckBox(self.general)
+        self.float32_storage_checkbox.setGeometry(QtCore.QRect(10, 290, 391, 22))
+        self.float32_storage_checkbox.setObjectName("float32_storage_checkbox")
+        self.profile_next_plot_checkbox = QtWidgets.QCheckBox(self.general)
+        self.profile_next_plot_checkbox.setGeometry(QtCore.QRect(10, 315, 391, 22))
+        self.profile_next_plot_checkbox.setObjectName("profile_next_plot_checkbox")
+        self.tabWidget.addTab(self.general, "")
+        self.markers = QtWidgets.QWidget()
+        self.markers.setObjectName("markers")
+        self.marker_size_spinbox = QtWidgets.QSpinBox(self.markers)
+        self.marker_size_spinbox.setGeometry(QtCore.QRect(300, 20, 98, 29))
+        self.marker_size_spinbox.setObjectName("marker_size_spinbox")
+        self.marker_combobox = QtWidgets.QComboBox(self.markers)
+        self.marker_combobox.setGeometry(QtCore.QRect(110, 20, 61, 31))
+        self.marker_combobox.setObjectName("marker_combobox")
+        self.marker_combobox.addItem("")
+        self.marker_combobox.addItem("")
+        self.marker_combobox.addItem("")
+        self.marker_combobox.addItem("")
+        self.marker_combobox.addItem("")
+        self.marker_combobox.addItem("")
+        self.marker_combobox.addItem("")
+        self.label_5 = QtWidgets.QLabel(self.markers)
+        self.label_5.setGeometry(QtCore.QRect(10, 20, 91, 21))
+        self.label_5.setObjectName("label_5")
+        self.label_6 = QtWidgets.QLabel(self.markers)
+        self.label_6.setGeometry(QtCore.QRect(200, 20, 91, 21))
+        self.label_6.setObjectName("label_6")
+        self.marker_color_field = QgsFieldComboBox(self.markers)
+        self.marker_color_field.setGeometry(QtCore.QRect(260, 110, 160, 29))
+        self.marker_color_field.setObjectName("marker_color_field")
+        self.color_by_data_field_radio = QtWidgets.QRadioButton(self.markers)
+        self.color_by_data_field_radio.setGeometry(QtCore.QRect(10, 110, 241, 22))
+        self.color_by_data_field_radio.setObjectName("color_by_data_field_radio")
+        self.marker_colorbutton = QgsColorButton(self.markers)
+        self.marker_colorbutton.setGeometry(QtCore.QRect(260, 70, 120, 28))
+        self.marker_colorbutton.setObjectName("marker_colorbutton")
+        self.color_by_single_color_radio = QtWidgets.QRadioButton(self.markers)
+        self.color_by_single_color_radio.setGeometry(QtCore.QRect(10, 70, 281, 22))
+        self.color_by_single_color_radio.setObjectName("color_by_single_color_radio")
+        self.marker_cmap_center_checkbox = QtWidgets.QCheckBox(self.markers)
+        self.marker_cmap_center_checkbox.setGeometry(QtCore.QRect(40, 270, 241, 22))
+        self.marker_cmap_center_checkbox.setObjectName("marker_cmap_center_checkbox")
+        self.marker_cmap_center_dspinbox = QtWidgets.QDoubleSpinBox(self.markers)
+        self.marker_cmap_center_dspinbox.setGeometry(QtCore.QRect(300, 270, 119, 29))
+        self.marker_cmap_center_dspinbox.setObjectName("marker_cmap_center_dspinbox")
+        self.marker_colormap_label = QtWidgets.QLabel(self.markers)
+        self.marker_colormap_label.setGeometry(QtCore.QRect(40, 150, 121, 16))
+        self.marker_colormap_label.setObjectName("marker_colormap_label")
+        self.marker_colormap_combobox = QtWidgets.QComboBox(self.markers)
+        self.marker_colormap_combobox.setGeometry(QtCore.QRect(160, 150, 181, 29))
+        self.marker_colormap_combobox.setObjectName("marker_colormap_combobox")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_colormap_combobox.addItem("")
+        self.marker_lower_label = QtWidgets.QLabel(self.markers)
+        self.marker_lower_label.setGeometry(QtCore.QRect(40, 190, 161, 21))
+        self.marker_lower_label.setObjectName("marker_lower_label")
+        self.marker_upper_label = QtWidgets.QLabel(self.markers)
+        self.marker_upper_label.setGeometry(QtCore.QRect(40, 230, 161, 21))
+        self.marker_upper_label.setObjectName("marker_upper_label")
+        self.marker_lowlimit_dspinbox = QtWidgets.QDoubleSpinBox(self.markers)
+        self.marker_lowlimit_dspinbox.setGeometry(QtCore.QRect(210, 190, 185, 29))
+        self.marker_lowlimit_dspinbox.setMinimum(-1e+37)
+        self.marker_lowlimit_dspinbox.setMaximum(1e+37)
+        self.marker_lowlimit_dspinbox.setProperty("value", 0.0)
+        self.marker_lowlimit_dspinbox.setObjectName("marker_lowlimit_dspinbox")
+        self.marker_raster_threshold_label = QtWidgets.QLabel(self.markers)
+        self.marker_raster_threshold_label.setGeometry(QtCore.QRect(10, 305, 281, 29))
+        self.marker_raster_threshold_label.setObjectName("marker_raster_threshold_label")
+        self.marker_raster_threshold_spinbox = QtWidgets.QSpinBox(self.markers)
+        self.marker_raster_threshold_spinbox.setGeometry(QtCore.QRect(300, 305, 95, 29))
+        self.marker_raster_threshold_spinbox.setMaximum(2147483647)
+        self.marker_raster_threshold_spinbox.setSingleStep(10000)
+        self.marker_raster_threshold_spinbox.setObjectName("marker_raster_threshold_spinbox")
+        self.marker_upplimit_dspinbox = QtWidgets.QDoubleSpinBox(self.markers)
+        self.marker_upplimit_dspinbox.setGeometry(QtCore.QRect(210, 230, 185, 29))
+        self.marker_upplimit_dspinbox.setMinimum(-1e+37)
+        self.marker_upplimit_dspinbox.setMaximum(1e+37)
+        self.marker_upplimit_dspinbox.setObjectName("marker_upplimit_dspinbox")
+        self.tabWidget.addTab(self.markers, "")
+        self.contour = QtWidgets.QWidget()
+        self.contour.setObjectName("contour")
+        self.contour_checkbox = QtWidgets.QCheckBox(self.contour)
+        self.contour_checkbox.setGeometry(QtCore.QRect(10, 20, 161, 22))
+        self.contour_checkbox.setTristate(False)
+        self.contour_checkbox.setObjectName("contour_checkbox")
+        self.contour_colors_label = QtWidgets.QLabel(self.contour)
+        self.contour_colors_label.setGeometry(QtCore.QRect(10, 50, 111, 16))
+        self.contour_colors_label.setObjectName("contour_colors_label")
+        self.contour_cmap_combobox = QtWidgets.QComboBox(self.contour)
+        self.contour_cmap_combobox.setGeometry(QtCore.QRect(130, 50, 181, 29))
+        self.contour_cmap_combobox.setObjectName("contour_cmap_combobox")
+        self.contour_cmap_combobox.addItem("")
+        self.contour_cmap_combobox.addItem("")
+        self.contour_cmap_combobox.addItem("")
+        self.contour_cmap_combobox.addItem("")
+        self.contour_limits_label = QtWidgets.QLabel(self.contour)
+        self.contour_limits_label.setGeometry(QtCore.QRect(10, 100, 111, 21))
+        self.contour_limits_label.setObjectName("contour_limits_label")
+        self.upper_label = QtWidgets.QLabel(self.contour)
+        self.upper_label.setGeometry(QtCore.QRect(220, 130, 41, 21))
+        self.upper_label.setObjectName("upper_label")
+        self.contour_lowlimit_dspinbox = QtWidgets.QDoubleSpinBox(self.contour)
+        self.contour_lowlimit_dspinbox.setGeometry(QtCore.QRect(60, 130, 127, 29))
+        self.contour_lowlimit_dspinbox.setMaximum(100.0)
+        self.contour_lowlimit_dspinbox.setObjectName("contour_lowlimit_dspinbox")
+        self.contour_upplimit_dspinbox = QtWidgets.QDoubleSpinBox(self.contour)
+        self.contour_upplimit_dspinbox.setGeometry(QtCore.QRect(270, 130, 119, 29))
+        self.contour_upplimit_dspinbox.setObjectName("contour_upplimit_dspinbox")
+        self.lower_label = QtWidgets.QLabel(self.contour)
+        self.lower_label.setGeometry(QtCore.QRect(10, 130, 51, 21))
+        self.lower_label.setObjectName("lower_label")
+        self.contour_k_mode_label = QtWidgets.QLabel(self.contour)
+        self.contour_k_mode_label.setGeometry(QtCore.QRect(10, 180, 111, 21))
+        self.contour_k_mode_label.setObjectName("contour_k_mode_label")
+        self.contour_k_mode_combobox = QtWidgets.QComboBox(self.contour)
+        self.contour_k_mode_combobox.setGeometry(QtCore.QRect(130, 176, 181, 29))
+        self.contour_k_mode_combobox.setObjectName("contour_k_mode_combobox")
+        self.contour_k_mode_combobox.addItem("")
+        self.contour_k_mode_combobox.addItem("")
+        self.contour_k_mode_combobox.addItem("")
+        self.contour_workers_label = QtWidgets.QLabel(self.contour)
+        self.contour_workers_label.setGeometry(QtCore.QRect(10, 220, 121, 21))
+        self.contour_workers_label.setObjectName("contour_workers_label")
+        self.contour_workers_spinbox = QtWidgets.QSpinBox(self.contour)
+        self.contour_workers_spinbox.setGeometry(QtCore.QRect(130, 216, 81, 29))
+        self.contour_workers_spinbox.setMinimum(1)
+        self.contour_workers_spinbox.setMaximum(64)
+        self.contour_workers_spinbox.setObjectName("contour_workers_spinbox")
+        self.tabWidget.addTab(self.contour, "")
+        self.statistics = QtWidgets.QWidget()
+        self.statistics.setObjectName("statistics")
+        self.bootstrap_replicates_label = QtWidgets.QLabel(self.statistics)
+        self.bootstrap_replicates_label.setGeometry(QtCore.QRect(10, 20, 281, 29))
+        self.bootstrap_replicates_label.setObjectName("bootstrap_replicates_label")
+        self.bootstrap_replicates_spinbox = QtWidgets.QSpinBox(self.statistics)
+        self.bootstrap_replicates_spinbox.setGeometry(QtCore.QRect(300, 20, 95, 29))
+        self.bootstrap_replicates_spinbox.setMaximum(1000000)
+        self.bootstrap_replicates_spinbox.setSingleStep(100)
+        self.bootstrap_replicates_spinbox.setObjectName("bootstrap_replicates_spinbox")
+        self.bootstrap_confidence_label = QtWidgets.QLabel(self.statistics)
+        self.bootstrap_confidence_label.setGeometry(QtCore.QRect(10, 60, 281, 29))
+        self.bootstrap_confidence_label.setObjectName("bootstrap_confidence_label")
+        self.bootstrap_confidence_dspinbox = QtWidgets.QDoubleSpinBox(self.statistics)
+        self.bootstrap_confidence_dspinbox.setGeometry(QtCore.QRect(300, 60, 95, 29))
+        self.bootstrap_confidence_dspinbox.setDecimals(1)
+        self.bootstrap_confidence_dspinbox.setMinimum(50.0)
+        self.bootstrap_confidence_dspinbox.setMaximum(99.9)
+        self.bootstrap_confidence_dspinbox.setObjectName("bootstrap_confidence_dspinbox")
+        self.group_by_field_label = QtWidgets.QLabel(self.statistics)
+        self.group_by_field_label.setGeometry(QtCore.QRect(10, 100, 241, 29))
+        self.group_by_field_label.setObjectName("group_by_field_label")
+        self.group_by_field = QgsFieldComboBox(self.statistics)
+        self.group_by_field.setGeometry(QtCore.QRect(260, 100, 135, 29))
+        self.group_by_field.setObjectName("group_by_field")
+        self.tabWidget.addTab(self.statistics, "")
+
+        self.retranslateUi(SettingsDialog)
+        self.tabWidget.setCurrentIndex(0)
+        self.button_box.accepted.connect(SettingsDialog.accept) # type: ignore
+        self.button_box.rejected.connect(SettingsDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(SettingsDialog)
+
+    def retranslateUi(self, SettingsDialog):
+        _translate = QtCore.QCoreApplication.translate
+        SettingsDialog.setWindowTitle(_translate("SettingsDialog", "stereoplot"))
+        self.line_groupbox.setTitle(_translate("SettingsDialog", "Line data"))
+        self.trend_label.setText(_translate("SettingsDialog", "Trend"))
+        self.plunge_label.setText(_translate("SettingsDialog", "Plunge"))
+        self.plot_mean_plane_checkbox.setText(_translate("SettingsDialog", "Calculate best-fit great circle"))
+        self.plane_groupbox.setTitle(_translate("SettingsDialog", "Planar data"))
+        self.use_dip_dir_radio.setText(_translate("SettingsDialog", "Dip direction"))
+        self.use_strike_radio.setText(_translate("SettingsDialog", "Strike direction"))
+        self.label_3.setText(_translate("SettingsDialog", "Dip angle"))
+        self.plot_intersection_point_checkbox.setText(_translate("SettingsDialog", "Calculate best-fit intersection point"))
+        self.float32_storage_checkbox.setToolTip(_translate("SettingsDialog", "Halve the memory used by very large selections at the cost of precision"))
+        self.float32_storage_checkbox.setText(_translate("SettingsDialog", "Store orientations in single precision"))
+        self.profile_next_plot_checkbox.setToolTip(_translate("SettingsDialog", "Write a cProfile dump of the next plot to the temporary directory"))
+        self.profile_next_plot_checkbox.setText(_translate("SettingsDialog", "Profile the next plot"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.general), _translate("SettingsDialog", "General"))
+        self.marker_combobox.setItemText(0, _translate("SettingsDialog", "o"))
+        self.marker_combobox.setItemText(1, _translate("SettingsDialog", "v"))
+        self.marker_combobox.setItemText(2, _translate("SettingsDialog", "^"))
+        self.marker_combobox.setItemText(3, _translate("SettingsDialog", "P"))
+        self.marker_combobox.setItemText(4, _translate("SettingsDialog", "x"))
+        self.marker_combobox.setItemText(5, _translate("SettingsDialog", "."))
+        self.marker_combobox.setItemText(6, _translate("SettingsDialog", "+"))
+        self.label_5.setText(_translate("SettingsDialog", "Marker type:"))
+        self.label_6.setText(_translate("SettingsDialog", "Marker size:"))
+        self.color_by_data_field_radio.setText(_translate("SettingsDialog", "Color markers by data field:"))
+        self.color_by_single_color_radio.setText(_translate("SettingsDialog", "Color markers by single color:"))
+        self.marker_cmap_center_checkbox.setText(_translate("SettingsDialog", "Reset marker colormap center:"))
+        self.marker_colormap_label.setText(_translate("SettingsDialog", "Marker colormap:"))
+        self.marker_colormap_combobox.setItemText(0, _translate("SettingsDialog", "bwr"))
+        self.marker_colormap_combobox.setItemText(1, _translate("SettingsDialog", "bwr_r"))
+        self.marker_colormap_combobox.setItemText(2, _translate("SettingsDialog", "coolwarm"))
+        self.marker_colormap_combobox.setItemText(3, _translate("SettingsDialog", "coolwarm_r"))
+        self.marker_colormap_combobox.setItemText(4, _translate("SettingsDialog", "magma"))
+        self.marker_colormap_combobox.setItemText(5, _translate("SettingsDialog", "magma_r"))
+        self.marker_colormap_combobox.setItemText(6, _translate("SettingsDialog", "RdYlGn"))
+        self.marker_colormap_combobox.setItemText(7, _translate("SettingsDialog", "RdYlGn_r"))
+        self.marker_colormap_combobox.setItemText(8, _translate("SettingsDialog", "RdBu"))
+        self.marker_colormap_combobox.setItemText(9, _translate("SettingsDialog", "RdBu_r"))
+        self.marker_colormap_combobox.setItemText(10, _translate("SettingsDialog", "RdGy"))
+        self.marker_colormap_combobox.setItemText(11, _translate("SettingsDialog", "RdGy_r"))
+        self.marker_colormap_combobox.setItemText(12, _translate("SettingsDialog", "RdYlBu"))
+        self.marker_colormap_combobox.setItemText(13, _translate("SettingsDialog", "seismic"))
+        self.marker_colormap_combobox.setItemText(14, _translate("SettingsDialog", "seismic_r"))
+        self.marker_lower_label.setText(_translate("SettingsDialog", "Colormap lower limit:"))
+        self.marker_upper_label.setText(_translate("SettingsDialog", "Colormap upper limit:"))
+        self.marker_raster_threshold_label.setToolTip(_translate("SettingsDialog", "Larger datasets are drawn as a raster image of their density, 0 never rasterizes"))
+        self.marker_raster_threshold_label.setText(_translate("SettingsDialog", "Rasterize above (points)"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.markers), _translate("SettingsDialog", "Markers"))
+        self.contour_checkbox.setText(_translate("SettingsDialog", "Draw contour"))
+        self.contour_colors_label.setText(_translate("SettingsDialog", "Contour colors:"))
+        self.contour_cmap_combobox.setItemText(0, _translate("SettingsDialog", "Blues"))
+        self.contour_cmap_combobox.setItemText(1, _translate("SettingsDialog", "Greens"))
+        self.contour_cmap_combobox.setItemText(2, _translate("SettingsDialog", "Greys"))
+        self.contour_cmap_combobox.setItemText(3, _translate("SettingsDialog", "Oranges"))
+        self.contour_limits_label.setText(_translate("SettingsDialog", "Contour limits:"))
+        self.upper_label.setText(_translate("SettingsDialog", "Upper:"))
+        self.lower_label.setText(_translate("SettingsDialog", "Lower:"))
+        self.contour_k_mode_label.setText(_translate("SettingsDialog", "k optimization:"))
+        self.contour_k_mode_combobox.setToolTip(_translate("SettingsDialog", "Exact searches k on the full dataset, balanced on a subsample with a finer refinement, fast on a smaller subsample"))
+        self.contour_k_mode_combobox.setItemText(0, _translate("SettingsDialog", "exact"))
+        self.contour_k_mode_combobox.setItemText(1, _translate("SettingsDialog", "balanced"))
+        self.contour_k_mode_combobox.setItemText(2, _translate("SettingsDialog", "fast"))
+        self.contour_workers_label.setText(_translate("SettingsDialog", "Worker processes:"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.contour), _translate("SettingsDialog", "Contour"))
+        self.bootstrap_replicates_label.setToolTip(_translate("SettingsDialog", "Resamples of the bootstrap confidence cone of the mean plane or intersection, 0 draws no cone"))
+        self.bootstrap_replicates_label.setText(_translate("SettingsDialog", "Bootstrap replicates"))
+        self.bootstrap_confidence_label.setText(_translate("SettingsDialog", "Confidence level (%)"))
+        self.group_by_field_label.setToolTip(_translate("SettingsDialog", "Overlay the mean of each value of this field and log the statistics of each group"))
+        self.group_by_field_label.setText(_translate("SettingsDialog", "Group statistics by field"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.statistics), _translate("SettingsDialog", "Statistics"))
+from qgis.gui import QgsColorButton, QgsFieldComboBox